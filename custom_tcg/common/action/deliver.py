@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, cast, override
 from custom_tcg.common.action.hold import Hold
 from custom_tcg.common.card_type_def import CardTypeDef as CommonCardTypeDef
 from custom_tcg.common.effect.holding import Holding
+from custom_tcg.common.predicate import HeldBy
 from custom_tcg.core.action import Action
 from custom_tcg.core.card.select import Select
 from custom_tcg.core.card.select_by_choice import SelectByChoice
@@ -15,6 +16,7 @@ from custom_tcg.core.effect.remove_effect import RemoveEffect
 from custom_tcg.core.interface import (
     IExecutionContext,
 )
+from custom_tcg.core.predicate import HasType, InZone, Is
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -54,12 +56,9 @@ class Deliver(Action):
             name="Select a being to deliver to",
             accept_n=1,
             require_n=False,
-            options=(
-                lambda context: [
-                    card
-                    for card in context.player.played
-                    if CardTypeDef.being in card.types and card is not self.card
-                ]
+            options=InZone(
+                zone="played",
+                where=HasType(card_type=CardTypeDef.being) & ~Is(card=card),
             ),
             card=card,
             player=player,
@@ -69,15 +68,10 @@ class Deliver(Action):
             name="Select a material to deliver",
             accept_n=1,
             require_n=False,
-            options=(
-                lambda context: [
-                    card
-                    for card in context.player.played
-                    for effect in card.effects
-                    if CommonCardTypeDef.item in card.types
-                    and isinstance(effect, Holding)
-                    and effect.card_holding is self.card
-                ]
+            options=InZone(
+                zone="played",
+                where=HasType(card_type=CommonCardTypeDef.item)
+                & HeldBy(holder=card),
             ),
             card=card,
             player=player,
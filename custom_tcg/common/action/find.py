@@ -71,6 +71,7 @@ class Find(Action):
                 self.bind_n(context, card_factory),
             ):
                 card: ICard = card_factory.create(player=self.player)
+                context.index.add_card(card=card)
                 self.player.played.append(card)
                 if CardTypeDef.item in card.types:
                     context.execute(
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from custom_tcg.common.effect.holding import Holding
+from custom_tcg.common.predicate import HeldBy
 from custom_tcg.core.card.select_by_choice import SelectByChoice
+from custom_tcg.core.predicate import InZone, IsInstance
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -32,14 +33,10 @@ class SelectByHeld(SelectByChoice):
             name=name,
             card=card,
             player=player,
-            options=lambda context: [
-                card
-                for card in context.player.played
-                for effect in card.effects
-                if isinstance(card, held_type)
-                and isinstance(effect, Holding)
-                and effect.card_holding is self.card
-            ],
+            options=InZone(
+                zone="played",
+                where=IsInstance(cls=held_type) & HeldBy(holder=card),
+            ),
             require_n=require_n,
             auto_n=auto_n,
             accept_n=accept_n,
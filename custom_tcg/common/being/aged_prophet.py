@@ -14,6 +14,12 @@ from custom_tcg.core.effect.activated import Activated
 from custom_tcg.core.effect.add_effect import AddEffect
 from custom_tcg.core.execution.activate import Activate
 from custom_tcg.core.execution.play import Play
+from custom_tcg.core.predicate import (
+    ActionIs,
+    CardHasClass,
+    CardHasEffect,
+    PlayerIs,
+)
 
 if TYPE_CHECKING:
     from custom_tcg.core.interface import IPlayer
@@ -38,8 +44,6 @@ class AgedProphet(Card):
             Play(card=aged_prophet, player=player),
         )
 
-        this_player: IPlayer = player
-
         aged_prophet.actions.append(
             Activate(
                 actions=[
@@ -67,14 +71,10 @@ class AgedProphet(Card):
                 ],
                 card=aged_prophet,
                 player=player,
-                bind=lambda action, card, player: (
-                    isinstance(action, Activate)
-                    and CardClassDef.rest in card.classes
-                    and player is this_player
-                    and not any(
-                        isinstance(effect, Activated) for effect in card.effects
-                    )
-                ),
+                bind=ActionIs(cls=Activate)
+                & CardHasClass(card_class=CardClassDef.rest)
+                & PlayerIs(player=player)
+                & ~CardHasEffect(effect_type=Activated),
                 costs=[
                     SelectByHeld(
                         name=f"Verify a '{Pebble.name}' is held",
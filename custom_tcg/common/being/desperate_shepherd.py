@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from secrets import randbelow
 from typing import TYPE_CHECKING, cast
 
 from custom_tcg.common.action.deliver import Deliver
@@ -22,6 +21,12 @@ from custom_tcg.core.dimension import CardTypeDef
 from custom_tcg.core.effect.activated import Activated
 from custom_tcg.core.execution.activate import Activate
 from custom_tcg.core.execution.play import Play
+from custom_tcg.core.predicate import (
+    HasEffect,
+    InZone,
+    IsInstance,
+    SelectedCount,
+)
 
 if TYPE_CHECKING:
     from custom_tcg.core.interface import IAction, IPlayer
@@ -52,8 +57,8 @@ class DesperateShepherd(Card):
             searcher=desperate_shepherd,
             cards_to_search_for=[Sheep],
             n=1,
-            bind_success=lambda context: (  # noqa: ARG005
-                randbelow(exclusive_upper_bound=6) + 1
+            bind_success=lambda context: (
+                context.random.roll(sides=6)
                 == DesperateShepherd.SHEEP_FOUND_ACCORDING_TO_ROLLED_VALUE
             ),
             card=desperate_shepherd,
@@ -63,20 +68,11 @@ class DesperateShepherd(Card):
         shearing_tap_cost = Tap(
             cards_to_activate=Select(
                 name=f"Tap sheared '{Sheep.name}'",
-                options=lambda context: [
-                    card
-                    for card in context.player.played
-                    if isinstance(card, Sheep)
-                    and next(
-                        (
-                            effect
-                            for effect in card.effects
-                            if isinstance(effect, Activated)
-                        ),
-                        None,
-                    )
-                    is None
-                ],
+                options=InZone(
+                    zone="played",
+                    where=IsInstance(cls=Sheep)
+                    & ~HasEffect(effect_type=Activated),
+                ),
                 card=desperate_shepherd,
                 player=player,
             ),
@@ -88,13 +84,8 @@ class DesperateShepherd(Card):
             name=f"Shear a '{BundleOfWool.name}' from each sheep in play",
             finder=desperate_shepherd,
             cards_to_find=[BundleOfWool],
-            bind_n=lambda context, card_factory: (  # noqa: ARG005
-                len(
-                    cast(
-                        "Select",
-                        shearing_tap_cost.cards_to_activate,
-                    ).selected,
-                )
+            bind_n=SelectedCount(
+                select=cast("Select", shearing_tap_cost.cards_to_activate),
             ),
             costs=[shearing_tap_cost],
             card=desperate_shepherd,
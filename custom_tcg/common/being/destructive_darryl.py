@@ -19,6 +19,7 @@ from custom_tcg.core.effect.activated import Activated
 from custom_tcg.core.execution.activate import Activate
 from custom_tcg.core.execution.play import Play
 from custom_tcg.core.interface import IPlayer
+from custom_tcg.core.predicate import HasEffect, InZone, IsInstance
 
 if TYPE_CHECKING:
     from custom_tcg.core.interface import IAction, IPlayer
@@ -55,20 +56,11 @@ class DestructiveDarryl(Card):
                     name=f"Strike a {Flint.name}",
                     n=1,
                     require_n=True,
-                    options=lambda context: [
-                        card
-                        for card in context.player.played
-                        if isinstance(card, Flint)
-                        and next(
-                            (
-                                effect
-                                for effect in card.effects
-                                if isinstance(effect, Holding)
-                            ),
-                            None,
-                        )
-                        is None
-                    ],
+                    options=InZone(
+                        zone="played",
+                        where=IsInstance(cls=Flint)
+                        & ~HasEffect(effect_type=Holding),
+                    ),
                     card=darryl,
                     player=player,
                 ),
@@ -81,20 +73,11 @@ class DestructiveDarryl(Card):
                     name=f"Burn a {PileOfWood.name}",
                     n=1,
                     require_n=True,
-                    options=lambda context: [
-                        card
-                        for card in context.player.played
-                        if isinstance(card, PileOfWood)
-                        and next(
-                            (
-                                effect
-                                for effect in card.effects
-                                if isinstance(effect, Holding)
-                            ),
-                            None,
-                        )
-                        is None
-                    ],
+                    options=InZone(
+                        zone="played",
+                        where=IsInstance(cls=PileOfWood)
+                        & ~HasEffect(effect_type=Holding),
+                    ),
                     card=darryl,
                     player=player,
                 ),
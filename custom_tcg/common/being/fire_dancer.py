@@ -22,6 +22,7 @@ from custom_tcg.core.dimension import CardTypeDef
 from custom_tcg.core.effect.add_effect import AddEffect
 from custom_tcg.core.execution.activate import Activate
 from custom_tcg.core.execution.play import Play
+from custom_tcg.core.predicate import HasEffect, InZone, IsInstance
 
 if TYPE_CHECKING:
     from custom_tcg.core.interface import IAction, IPlayer
@@ -103,24 +104,20 @@ class FireDancer(Card):
                 name="Select an item to hold fire",
                 accept_n=1,
                 require_n=False,
-                options=lambda context: [
-                    card
-                    for card in context.player.played
-                    for effect in card.effects
-                    if isinstance(effect, Burnable)
-                ],
+                options=InZone(
+                    zone="played",
+                    where=HasEffect(effect_type=Burnable),
+                ),
                 card=fire_dancer,
                 player=player,
             ),
             costs=[
                 Select(
                     name="Find an existing burning source",
-                    options=lambda context: [
-                        card
-                        for card in context.player.played
-                        for effect in card.effects
-                        if isinstance(effect, Burning)
-                    ],
+                    options=InZone(
+                        zone="played",
+                        where=HasEffect(effect_type=Burning),
+                    ),
                     n=1,
                     require_n=True,
                     card=fire_dancer,
@@ -132,11 +129,10 @@ class FireDancer(Card):
                         name="Tame a fire if one is found",
                         n=1,
                         require_n=False,
-                        options=lambda context: [
-                            card
-                            for card in context.player.played
-                            if isinstance(card, Fire)
-                        ],
+                        options=InZone(
+                            zone="played",
+                            where=IsInstance(cls=Fire),
+                        ),
                         card=fire_dancer,
                         player=player,
                     ),
@@ -12,6 +12,12 @@ from custom_tcg.core.dimension import CardClassDef
 from custom_tcg.core.dimension import CardTypeDef as CardTypeCommonDef
 from custom_tcg.core.effect.activated import Activated
 from custom_tcg.core.execution.activate import Activate
+from custom_tcg.core.predicate import (
+    ActionIs,
+    CardHasClass,
+    CardHasEffect,
+    PlayerIs,
+)
 
 if TYPE_CHECKING:
     from custom_tcg.core.interface import IPlayer
@@ -32,8 +38,6 @@ class LastSurvivor(Card):
             classes=[CardClassCommonDef.human],
         )
 
-        this_player: IPlayer = player
-
         last_survivor.actions.append(
             Activate(
                 actions=[
@@ -45,14 +49,10 @@ class LastSurvivor(Card):
                 ],
                 card=last_survivor,
                 player=player,
-                bind=lambda action, card, player: (
-                    isinstance(action, Activate)
-                    and CardClassDef.play in card.classes
-                    and player is this_player
-                    and not any(
-                        isinstance(effect, Activated) for effect in card.effects
-                    )
-                ),
+                bind=ActionIs(cls=Activate)
+                & CardHasClass(card_class=CardClassDef.play)
+                & PlayerIs(player=player)
+                & ~CardHasEffect(effect_type=Activated),
             ),
         )
 
@@ -16,6 +16,7 @@ from custom_tcg.core.card.select_by_choice import SelectByChoice
 from custom_tcg.core.dimension import CardTypeDef
 from custom_tcg.core.execution.activate import Activate
 from custom_tcg.core.execution.play import Play
+from custom_tcg.core.predicate import HasType, InZone, Is
 
 if TYPE_CHECKING:
     from custom_tcg.core.interface import IPlayer
@@ -61,12 +62,13 @@ class QuestionableButcher(Card):
                                     accept_n=1,
                                     require_n=False,
                                     auto_n=True,
-                                    options=lambda context: [
-                                        card
-                                        for card in context.player.played
-                                        if CardTypeDef.being in card.types
-                                        and card is not butcher
-                                    ],
+                                    options=InZone(
+                                        zone="played",
+                                        where=HasType(
+                                            card_type=CardTypeDef.being,
+                                        )
+                                        & ~Is(card=butcher),
+                                    ),
                                     card=butcher,
                                     player=player,
                                 ),
@@ -32,9 +32,9 @@ class ThatPebbleGirl(Card):
     name: str = "That Pebble Girl"
 
     @classmethod
-    def create(cls: type[ThatPebbleGirl], player: IPlayer) -> Card:
+    def create(cls: type[ThatPebbleGirl], player: IPlayer) -> ThatPebbleGirl:
         """Create a That Pebble Girl instance."""
-        that_pebble_girl = Card(
+        that_pebble_girl = ThatPebbleGirl(
             name=cls.name,
             player=player,
             types=[CardTypeDef.being],
@@ -7,14 +7,15 @@ from typing import TYPE_CHECKING
 from custom_tcg.common.action.find import Find
 from custom_tcg.common.card_class_def import CardClassDef
 from custom_tcg.common.effect.being_stats import BeingStats
-from custom_tcg.common.effect.holding import Holding
 from custom_tcg.common.item.stew import Stew
+from custom_tcg.common.predicate import HeldBy
 from custom_tcg.core.card.card import Card
 from custom_tcg.core.card.discard import Discard
 from custom_tcg.core.card.select_by_choice import SelectByChoice
 from custom_tcg.core.dimension import CardTypeDef
 from custom_tcg.core.execution.activate import Activate
 from custom_tcg.core.execution.play import Play
+from custom_tcg.core.predicate import HasClass, InZone
 
 if TYPE_CHECKING:
     from custom_tcg.core.interface import IPlayer
@@ -65,14 +66,13 @@ class TheStewmaker(Card):
                                     accept_n=2,
                                     require_n=False,
                                     auto_n=True,
-                                    options=lambda context: [
-                                        item
-                                        for item in context.player.played
-                                        for effect in item.effects
-                                        if CardClassDef.food in item.classes
-                                        and isinstance(effect, Holding)
-                                        and effect.card_holding is stew
-                                    ],
+                                    options=InZone(
+                                        zone="played",
+                                        where=HasClass(
+                                            card_class=CardClassDef.food,
+                                        )
+                                        & HeldBy(holder=stew),
+                                    ),
                                     card=stew,
                                     player=player,
                                 ),
@@ -0,0 +1,39 @@
+"""Declarative conditions on common effects, see `custom_tcg.core.predicate`."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, override
+
+from custom_tcg.common.effect.holding import Holding
+from custom_tcg.core.predicate import HasEffect, Predicate, ZoneQuery
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from custom_tcg.core.interface import ICard
+
+
+class HeldBy(Predicate):
+    """Match cards held by a card."""
+
+    holder: ICard
+
+    def __init__(self: HeldBy, holder: ICard) -> None:
+        """Match cards held by `holder`."""
+        self.holder = holder
+
+    @override
+    def key(self: HeldBy) -> tuple[Hashable, ...]:
+        return (id(self.holder),)
+
+    @override
+    def __call__(self: HeldBy, card: ICard) -> bool:
+        return any(
+            isinstance(effect, Holding) and effect.card_holding is self.holder
+            for effect in card.effects
+        )
+
+    @override
+    def compile(self: HeldBy) -> tuple[ZoneQuery, Predicate | None]:
+        # Only held cards are in the index, the holder is checked after.
+        return HasEffect(effect_type=Holding).compile()[0], self
@@ -197,17 +197,16 @@ def test_select_by_choice_speculate_insufficient_options(game: Game) -> None:
     end_current_process(g)
 
     # Turn 3 (P1): Try to activate ResourcefulPreacher
-    # Should fail/cancel due to insufficient items
-    choose_by_name_contains(g, "Activate from card 'Resourceful Preacher'")
-
-    # Should not be able to complete the action
-    step_until_available(g, max_steps=60)
+    # Should not be offered, since speculation would cancel it
+    assert not any(
+        "Activate from card 'Resourceful Preacher'" in c.name
+        for c in g.context.choices
+    ), "Expected infeasible activation to be filtered from choices"
 
-    # Verify no items were discarded and no card was drawn
-    # (action should have been cancelled)
+    # Verify no items were discarded
     remaining_stick = [c for c in g.context.player.played if c.name == "Stick"]
     assert len(remaining_stick) == 1, (
-        "Expected stick to remain since action should be cancelled"
+        "Expected stick to remain since action was never offered"
     )
 
     end_current_process(g)
@@ -39,6 +39,7 @@ def test_select_by_held_filters_items_by_holder() -> None:
 
     context = Mock(name="ExecutionContextMock")
     context.player = player
+    context.version = 0
 
     # Build options via Select.queue() path
     selector.queue(context=context)
@@ -12,11 +12,19 @@ from custom_tcg.core.interface import IAction, ICard, IExecutionContext, IPlayer
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from custom_tcg.core.dirty_actions import DirtyActions
+
 logger: logging.Logger = logging.getLogger(name=__name__)
 
 
 class Action(IAction):
-    """An action to be executed in a match."""
+    """An action to be executed in a match.
+
+    Actions report leaving and returning to `not_started` to their player's
+    dirty action tracker, if the player has one.
+    """
+
+    _state: ActionState
 
     def __init__(  # noqa: PLR0913
         self: Action,
@@ -37,6 +45,7 @@ class Action(IAction):
         self.notify = []
         self.selectors = []
         self.costs = costs or []
+        self.dependency_plan = None
 
         self.card.register(action=self)
 
@@ -46,6 +55,30 @@ class Action(IAction):
         ):
             raise NotImplementedError
 
+    @property
+    def state(self: Action) -> ActionState:  # pyright: ignore[reportIncompatibleVariableOverride]
+        """Get the state of this action."""
+        return self._state
+
+    @state.setter
+    def state(self: Action, state: ActionState) -> None:
+        """Set the state of this action, tracking whether it is dirty."""
+        self._state = state
+
+        dirty_actions: DirtyActions | None = getattr(
+            self.player,
+            "dirty_actions",
+            None,
+        )
+
+        if dirty_actions is None:
+            return
+
+        if state in (ActionStateDef.not_started, ActionStateDef.stateless):
+            dirty_actions.clean(action=self)
+        else:
+            dirty_actions.mark(action=self)
+
     def change_state(self: Action, state: ActionState) -> None:
         """Log and perform a state change."""
         logger.info(
@@ -64,6 +97,11 @@ class Action(IAction):
         for action in (*self.selectors, *self.costs):
             action.reset_state()
 
+    @override
+    def can_satisfy(self: Action, context: IExecutionContext) -> bool:
+        """Check if this action could execute now, without changing state."""
+        return True
+
     @override
     def queue(self: Action, context: IExecutionContext) -> None:
         """Change state to `ActionStateDef.queued`."""
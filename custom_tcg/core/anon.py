@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, override
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, ClassVar, override
 
 from custom_tcg.core.action import Action as NonAnonAction
+from custom_tcg.core.dirty_actions import DirtyActions
 from custom_tcg.core.interface import (
     IAction,
     ICard,
@@ -13,6 +14,7 @@ from custom_tcg.core.interface import (
     IExecutionContext,
     IPlayer,
 )
+from custom_tcg.core.zone import Zone
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -55,17 +57,42 @@ class Action(NonAnonAction):
 
 @dataclass
 class Player(IPlayer):
-    """A tcg match player."""
+    """A tcg match player.
+
+    Lists given for the main deck, hand, played, and discard zones are turned
+    into `Zone`s, whether passed in or assigned later.
+    """
+
+    ZONES: ClassVar[frozenset[str]] = frozenset(
+        ("main_cards", "hand", "played", "discard"),
+    )
 
     session_object_id: str
     name: str
     decks: list[IDeck]
     starting_cards: list[ICard]
-    main_cards: list[ICard]
+    main_cards: Zone
     processes: list[ICard]
-    hand: list[ICard]
-    played: list[ICard]
-    discard: list[ICard]
+    hand: Zone
+    played: Zone
+    discard: Zone
+    dirty_actions: DirtyActions = field(default_factory=DirtyActions)
+
+    def __setattr__(self: Player, name: str, value: Any) -> None:  # noqa: ANN401
+        """Set an attribute, turning zone lists into zones.
+
+        A zone replacing another keeps reporting changes to the same place.
+        """
+        if name in Player.ZONES and not isinstance(value, Zone):
+            value = Zone(cards=value)
+
+        previous: object = self.__dict__.get(name)
+
+        if isinstance(previous, Zone) and isinstance(value, Zone):
+            value.changed = previous.changed
+            value.removed = previous.removed
+
+        super().__setattr__(name, value)
 
 
 @dataclass
@@ -0,0 +1,55 @@
+"""Make choices on behalf of a player."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from custom_tcg.core.card.select_by_choice import SelectByChoiceOption
+
+if TYPE_CHECKING:
+    from custom_tcg.core.interface import IAction, IExecutionContext
+
+logger: logging.Logger = logging.getLogger(name=__name__)
+
+
+class AutoPilot:
+    """Make choices on behalf of a player."""
+
+    def choose(self: AutoPilot, context: IExecutionContext) -> IAction | None:
+        """Pick an offered choice, or None to leave it to the player."""
+        raise NotImplementedError
+
+
+class ForcedChoiceAutoPilot(AutoPilot):
+    """Make choices a player has no real say in.
+
+    A choice is forced when it is the only one offered, such as a process
+    with nothing left to do but end. A selector offering one option, with a
+    confirm but no cancel, and requiring at least one selection, forces the
+    option (and then the confirm.)
+    """
+
+    def choose(
+        self: ForcedChoiceAutoPilot,
+        context: IExecutionContext,
+    ) -> IAction | None:
+        """Pick the forced choice, if any."""
+        if len(context.choices) == 1:
+            return context.choices[0]
+
+        options: list[SelectByChoiceOption] = [
+            choice
+            for choice in context.choices
+            if isinstance(choice, SelectByChoiceOption)
+        ]
+
+        if (
+            len(options) == 1
+            and len(context.choices) == 2  # noqa: PLR2004
+            and options[0].selector.confirm_action in context.choices
+            and min(options[0].selector.accept_n) >= 1
+        ):
+            return options[0]
+
+        return None
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import functools
+from typing import TYPE_CHECKING, Any, ClassVar, Self, SupportsIndex
 from uuid import uuid4
 
+from custom_tcg.core.execution.dependency_plan import DependencyShape
 from custom_tcg.core.interface import (
     IAction,
     ICard,
@@ -15,9 +17,89 @@ from custom_tcg.core.interface import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
 
     from custom_tcg.core.dimension import CardClass, CardType
+    from custom_tcg.core.zone import Zone
+
+
+class CardEffects(list[IEffect]):
+    """Effects on a card, reporting changes to the zones holding the card."""
+
+    card: Card
+
+    def __init__(
+        self: CardEffects,
+        card: Card,
+        effects: Iterable[IEffect] = (),
+    ) -> None:
+        """Create a list of effects for a card."""
+        super().__init__(effects)
+        self.card = card
+
+    def __reduce__(
+        self: CardEffects,
+    ) -> tuple[type[CardEffects], tuple[Card, list[IEffect]]]:
+        """Pickle with the card, which is needed before effects are added."""
+        return (CardEffects, (self.card, list(self)))
+
+    def changed(self: CardEffects) -> None:
+        """Update indexes of every zone holding the card."""
+        for zone in self.card.zones:
+            zone.reindex_effects(card=self.card)
+
+    def append(self: CardEffects, effect: IEffect) -> None:
+        """Add an effect."""
+        super().append(effect)
+        self.changed()
+
+    def extend(self: CardEffects, effects: Iterable[IEffect]) -> None:
+        """Add effects."""
+        super().extend(effects)
+        self.changed()
+
+    def insert(
+        self: CardEffects,
+        index: SupportsIndex,
+        effect: IEffect,
+    ) -> None:
+        """Add an effect before a position."""
+        super().insert(index, effect)
+        self.changed()
+
+    def remove(self: CardEffects, effect: IEffect) -> None:
+        """Remove an effect."""
+        super().remove(effect)
+        self.changed()
+
+    def pop(self: CardEffects, index: SupportsIndex = -1) -> IEffect:
+        """Remove and return an effect."""
+        effect: IEffect = super().pop(index)
+        self.changed()
+        return effect
+
+    def clear(self: CardEffects) -> None:
+        """Remove all effects."""
+        super().clear()
+        self.changed()
+
+    def __setitem__(self: CardEffects, index: Any, value: Any) -> None:  # noqa: ANN401
+        """Replace effects."""
+        super().__setitem__(index, value)
+        self.changed()
+
+    def __delitem__(self: CardEffects, index: Any) -> None:  # noqa: ANN401
+        """Remove effects by position."""
+        super().__delitem__(index)
+        self.changed()
+
+    def __iadd__(  # type: ignore[override]
+        self: CardEffects,
+        effects: Iterable[IEffect],
+    ) -> Self:
+        """Add effects."""
+        self.extend(effects)
+        return self
 
 
 class Card(ICard, INamed):
@@ -27,8 +109,40 @@ class Card(ICard, INamed):
     types: list[CardType]
     classes: list[CardClass]
     actions: list[IAction]
-    effects: list[IEffect]
     action_registry: list[IAction]
+    zones: list[Zone]
+    _effects: CardEffects
+
+    # Compiled from the first card each definition creates.
+    dependency_shape: ClassVar[DependencyShape | None] = None
+
+    def __init_subclass__(cls: type[Card], **kwargs: Any) -> None:  # noqa: ANN401
+        """Bind dependency plans to the actions of every card created."""
+        super().__init_subclass__(**kwargs)
+        create: object = vars(cls).get("create")
+
+        if isinstance(create, classmethod):
+            cls.create = classmethod(Card.binding_plans(create=create.__func__))
+
+    @staticmethod
+    def binding_plans[C: ICard](
+        create: Callable[[type[C], IPlayer], C],
+    ) -> Callable[[type[C], IPlayer], C]:
+        """Wrap a definition's `create`, to bind plans to the card created."""
+
+        @functools.wraps(create)
+        def create_bound(cls: type[C], player: IPlayer) -> C:
+            card: C = create(cls, player)
+            shape: DependencyShape | None = vars(cls).get("dependency_shape")
+
+            if shape is None:
+                shape = DependencyShape.compile(card=card)
+                cls.dependency_shape = shape  # pyright: ignore[reportAttributeAccessIssue]
+
+            shape.bind(card=card)
+            return card
+
+        return create_bound
 
     def __init__(  # noqa: PLR0913
         self: Card,
@@ -46,8 +160,20 @@ class Card(ICard, INamed):
         self.types = types
         self.classes = classes
         self.actions = actions or []
-        self.effects = effects or []
         self.action_registry = []
+        self.zones = []
+        self.effects = effects or []
+
+    @property
+    def effects(self: Card) -> list[IEffect]:
+        """Get effects on this card."""
+        return self._effects
+
+    @effects.setter
+    def effects(self: Card, effects: list[IEffect]) -> None:
+        """Replace effects on this card."""
+        self._effects = CardEffects(card=self, effects=effects)
+        self._effects.changed()
 
     @classmethod
     def create(cls: type[Card], player: IPlayer) -> ICard:
@@ -10,7 +10,6 @@ from typing import TYPE_CHECKING, override
 from custom_tcg.core.action import Action
 from custom_tcg.core.dimension import ActionStateDef
 from custom_tcg.core.interface import IExecutionContext
-from custom_tcg.core.util.random import list_randomize
 
 if TYPE_CHECKING:
     from custom_tcg.core.interface import (
@@ -35,6 +34,7 @@ class Select(Action):
     randomize: bool
 
     create_options: Callable[[IExecutionContext], list]
+    options_cache: tuple[IExecutionContext, int, list] | None
 
     def __init__(  # noqa: PLR0913
         self: Select,
@@ -68,6 +68,23 @@ class Select(Action):
 
         self.options = []
         self.selected = []
+        self.options_cache = None
+
+    def current_options(self: Select, context: IExecutionContext) -> list:
+        """Create options, reusing them until the board version changes."""
+        version: int = context.version
+
+        if (
+            self.options_cache is not None
+            and self.options_cache[0] is context
+            and self.options_cache[1] == version
+        ):
+            return list(self.options_cache[2])
+
+        options: list = self.create_options(context)
+        self.options_cache = (context, version, list(options))
+
+        return options
 
     @override
     def reset_state(self: Select) -> None:
@@ -77,11 +94,16 @@ class Select(Action):
         self.options = []
         self.selected = []
 
+    @override
+    def can_satisfy(self: Select, context: IExecutionContext) -> bool:
+        """Check if options available now would satisfy this selector."""
+        return self.accepts(options=self.current_options(context=context))
+
     @override
     def queue(self: Select, context: IExecutionContext) -> None:
         super().queue(context=context)
 
-        self.options = self.create_options(context)
+        self.options = self.current_options(context=context)
 
         if not self.speculate():
             logger.info("Select '%s' speculatively cancelled", self.name)
@@ -96,15 +118,17 @@ class Select(Action):
         """Create selector choices."""
         super().enter(context=context)
 
-        self.options = self.create_options(context)
+        self.options = self.current_options(context=context)
 
         if self.randomize:
-            self.options = list_randomize(ordered=self.options)
+            self.options = context.random.randomize(ordered=self.options)
 
         self.selected = self.options[: self.n]
 
     def speculate(self: Select) -> bool:
         """Decide if this selection is even possible."""
-        return (
-            self.require_n and len(self.options) >= self.n
-        ) or not self.require_n
+        return self.accepts(options=self.options)
+
+    def accepts(self: Select, options: list[INamed]) -> bool:
+        """Decide if a list of options could satisfy this selector."""
+        return (self.require_n and len(options) >= self.n) or not self.require_n
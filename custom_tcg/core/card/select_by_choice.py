@@ -91,7 +91,7 @@ class SelectByChoice(Select):
     @override
     def speculate(self: SelectByChoice) -> bool:
         """Speculate if selection can be satisfied."""
-        speculation_result: bool = len(self.options) >= min(self.accept_n)
+        speculation_result: bool = self.accepts(options=self.options)
         auto_select: bool = False
         option_1: INamed | None = next(iter(self.options), None)
 
@@ -126,12 +126,17 @@ class SelectByChoice(Select):
 
         return speculation_result
 
+    @override
+    def accepts(self: SelectByChoice, options: list[INamed]) -> bool:
+        """Decide if a list of options has enough to choose from."""
+        return len(options) >= min(self.accept_n)
+
     @override
     def enter(self: SelectByChoice, context: IExecutionContext) -> None:
         """Create selector choices."""
         # Explicitly DO NOT call the super class.
 
-        self.options = self.create_options(context)
+        self.options = self.current_options(context=context)
 
         self.choice_actions = [
             *(
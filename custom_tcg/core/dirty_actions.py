@@ -0,0 +1,77 @@
+"""Track actions that have left their starting state."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+from weakref import WeakSet
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from custom_tcg.core.interface import IAction
+
+logger: logging.Logger = logging.getLogger(name=__name__)
+
+
+class DirtyActions:
+    """Track actions that have left their starting state, by action class.
+
+    Actions mark themselves when leaving `not_started` and clean themselves
+    when reset, so resetting only needs to visit actions used since the last
+    reset rather than every action on the board. Actions are held by weak
+    reference, so retired actions never need cleaning.
+    """
+
+    by_class: dict[type, WeakSet[IAction]]
+
+    def __init__(self: DirtyActions) -> None:
+        """Create an empty tracker."""
+        self.by_class = {}
+
+    def mark(self: DirtyActions, action: IAction) -> None:
+        """Note that an action left its starting state."""
+        self.by_class.setdefault(type(action), WeakSet()).add(action)
+
+    def clean(self: DirtyActions, action: IAction) -> None:
+        """Note that an action was reset."""
+        actions: WeakSet[IAction] | None = self.by_class.get(type(action))
+
+        if actions is not None:
+            actions.discard(action)
+
+    def matching(
+        self: DirtyActions,
+        action_types: type | tuple[type, ...] | None = None,
+    ) -> list[IAction]:
+        """Get dirty actions, optionally only of some classes or subclasses."""
+        return [
+            action
+            for cls, actions in list(self.by_class.items())
+            if action_types is None or issubclass(cls, action_types)
+            for action in list(actions)
+        ]
+
+    def __contains__(self: DirtyActions, action: object) -> bool:
+        """Check if an action is dirty."""
+        actions: WeakSet[IAction] | None = self.by_class.get(type(action))
+        return actions is not None and action in actions
+
+    def __len__(self: DirtyActions) -> int:
+        """Count dirty actions."""
+        return sum(len(actions) for actions in self.by_class.values())
+
+    def __iter__(self: DirtyActions) -> Iterator[IAction]:
+        """Iterate dirty actions."""
+        return iter(self.matching())
+
+    def __getstate__(self: DirtyActions) -> dict[str, Any]:
+        """Hold dirty actions strongly while pickled."""
+        return {"actions": self.matching()}
+
+    def __setstate__(self: DirtyActions, state: dict[str, Any]) -> None:
+        """Restore dirty actions after unpickling."""
+        self.by_class = {}
+
+        for action in state["actions"]:
+            self.mark(action=action)
@@ -1,7 +1,33 @@
 """Shows that the card has been activated."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, override
+
+from custom_tcg.core.dimension import CardTypeDef
 from custom_tcg.core.effect.effect import Effect
 
+if TYPE_CHECKING:
+    from custom_tcg.core.interface import IExecutionContext
+
 
 class Activated(Effect):
-    """The card has been activated."""
+    """The card has been activated.
+
+    Activated processes are tracked by the turn structure, so they can be
+    readied at the start of their player's turn.
+    """
+
+    @override
+    def activate(self: Activated, context: IExecutionContext) -> None:
+        super().activate(context=context)
+
+        if CardTypeDef.process in self.card_affected.types:
+            context.turns.mark_activated(effect=self)
+
+    @override
+    def deactivate(self: Activated, context: IExecutionContext) -> None:
+        super().deactivate(context=context)
+
+        if CardTypeDef.process in self.card_affected.types:
+            context.turns.unmark_activated(effect=self)
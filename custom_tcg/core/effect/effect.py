@@ -7,10 +7,11 @@ from typing import TYPE_CHECKING, override
 from uuid import uuid4
 
 from custom_tcg.core.dimension import EffectStateDef
-from custom_tcg.core.interface import IEffect, IExecutionContext
+from custom_tcg.core.interface import IAction, IEffect, IExecutionContext
 
 if TYPE_CHECKING:
-    from custom_tcg.core.interface import IAction, ICard
+    from custom_tcg.core.effect.expiry import Expiry
+    from custom_tcg.core.interface import ICard, IPlayer
 
 
 logger: logging.Logger = logging.getLogger(name=__name__)
@@ -19,13 +20,18 @@ logger: logging.Logger = logging.getLogger(name=__name__)
 class Effect(IEffect):
     """An effect applied to a card."""
 
-    def __init__(
+    # Actions after which `bind_deactivation` is checked, if overridden.
+    deactivates_after: tuple[type[IAction], ...] = (IAction,)
+
+    def __init__(  # noqa: PLR0913
         self: Effect,
         card: ICard,
         name: str | None = None,
         actions: list[IAction] | None = None,
         card_affected: ICard | None = None,
         card_affecting: ICard | None = None,
+        *,
+        expiries: list[Expiry] | None = None,
     ) -> None:
         """Create an effect."""
         self.session_object_id = uuid4().hex
@@ -36,6 +42,7 @@ class Effect(IEffect):
         self.actions = actions or []
         self.card_affected = card_affected or card
         self.card_affecting = card_affecting or card
+        self.expiries = expiries or []
 
     @classmethod
     def create(cls: type[Effect], card: ICard) -> IEffect:
@@ -53,6 +60,7 @@ class Effect(IEffect):
             card=card,
             actions=self.actions,
             card_affected=self.card_affected,
+            expiries=list(self.expiries),
         )
 
     @override
@@ -65,6 +73,9 @@ class Effect(IEffect):
         )
 
         self.state = EffectStateDef.active
+        context.index.add(obj=self)
+        context.expiries.register(effect=self)
+        context.touch()
 
         if self not in self.card_affected.effects:
             self.card_affected.effects.append(self)
@@ -79,10 +90,21 @@ class Effect(IEffect):
         )
 
         self.state = EffectStateDef.inactive
+        context.expiries.unregister(effect=self)
+        context.touch()
 
         if self in self.card_affected.effects:
             self.card_affected.effects.remove(self)
 
+    @override
+    def bind_removal(
+        self: Effect,
+        action: IAction,
+        card: ICard,
+        player: IPlayer,
+    ) -> bool:
+        return any(expiry.matches(action=action) for expiry in self.expiries)
+
     @override
     def bind_deactivation(self: Effect, context: IExecutionContext) -> bool:
         return False
@@ -0,0 +1,164 @@
+"""End effects when matching actions complete."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, cast
+
+from custom_tcg.core.card.discard import Discard
+from custom_tcg.core.effect.effect import Effect
+from custom_tcg.core.process.end_process import EndProcess
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from custom_tcg.core.interface import (
+        IAction,
+        ICard,
+        IEffect,
+        IExecutionContext,
+        IPlayer,
+    )
+
+logger: logging.Logger = logging.getLogger(name=__name__)
+
+
+@dataclass
+class Expiry:
+    """A condition ending an effect, checked when an action completes.
+
+    Only completed actions of `action_type` (or a subclass) are considered,
+    and only those from `card`, if given. `when` can refine the match further.
+    """
+
+    action_type: type[IAction]
+    card: ICard | None = None
+    when: Callable[[IAction, ICard, IPlayer], bool] | None = None
+
+    def matches(self: Expiry, action: IAction) -> bool:
+        """Check if a completed action ends the effect."""
+        return (
+            isinstance(action, self.action_type)
+            and (self.card is None or action.card is self.card)
+            and (
+                self.when is None
+                or self.when(action, action.card, action.player)
+            )
+        )
+
+    @classmethod
+    def end_of_process(cls: type[Expiry], process: ICard) -> Expiry:
+        """Expire when a process ends."""
+        return cls(action_type=EndProcess, card=process)
+
+    @classmethod
+    def discarded(cls: type[Expiry], card: ICard) -> Expiry:
+        """Expire when a card is discarded."""
+        return cls(
+            action_type=Discard,
+            when=lambda action, _card, _player: (
+                card in cast("Discard", action).cards_to_discard.selected
+            ),
+        )
+
+
+class EffectExpiries:
+    """Find active effects that may expire after an action.
+
+    Effects are indexed by the action classes and cards of their expiries, so
+    after an action only effects waiting on that kind of action from that card
+    (or from any card) are checked. Effects that define when they deactivate
+    are indexed by the action classes in their `deactivates_after`, and
+    checked after any action of those classes.
+    """
+
+    by_trigger: dict[tuple[type, ICard | None], dict[IEffect, None]]
+    deactivating: dict[type, dict[IEffect, None]]
+
+    def __init__(self: EffectExpiries) -> None:
+        """Create an empty index."""
+        self.by_trigger = {}
+        self.deactivating = {}
+
+    @staticmethod
+    def binds_deactivation(effect: IEffect) -> bool:
+        """Check if an effect defines when it deactivates."""
+        return type(effect).bind_deactivation is not Effect.bind_deactivation
+
+    def keys(
+        self: EffectExpiries,
+        effect: IEffect,
+    ) -> list[tuple[dict[Any, dict[IEffect, None]], object]]:
+        """List the index buckets an effect belongs in."""
+        keys: list[tuple[dict[Any, dict[IEffect, None]], object]] = [
+            (self.by_trigger, (expiry.action_type, expiry.card))
+            for expiry in effect.expiries
+        ]
+
+        if EffectExpiries.binds_deactivation(effect=effect):
+            keys.extend(
+                (self.deactivating, action_type)
+                for action_type in effect.deactivates_after
+            )
+
+        return keys
+
+    def register(self: EffectExpiries, effect: IEffect) -> None:
+        """Index an active effect by its expiries."""
+        for buckets, key in self.keys(effect=effect):
+            buckets.setdefault(key, {})[effect] = None
+
+    def unregister(self: EffectExpiries, effect: IEffect) -> None:
+        """Stop indexing an effect."""
+        for buckets, key in self.keys(effect=effect):
+            effects: dict[IEffect, None] | None = buckets.get(key)
+
+            if effects is not None:
+                effects.pop(effect, None)
+
+                if len(effects) == 0:
+                    del buckets[key]
+
+    def forget(self: EffectExpiries, card: ICard) -> None:
+        """Stop indexing the effects on a card."""
+        for effect in card.effects:
+            self.unregister(effect=effect)
+
+    def candidates(self: EffectExpiries, action: IAction) -> list[IEffect]:
+        """Get effects waiting on an action's class, from its card or any."""
+        return list(
+            dict.fromkeys(
+                effect
+                for cls in type(action).__mro__
+                for effects in (
+                    self.by_trigger.get((cls, action.card), ()),
+                    self.by_trigger.get((cls, None), ()),
+                    self.deactivating.get(cls, ()),
+                )
+                for effect in effects
+            ),
+        )
+
+    def expire(
+        self: EffectExpiries,
+        action: IAction,
+        context: IExecutionContext,
+    ) -> list[IEffect]:
+        """Find and stop indexing effects that a completed action ends."""
+        expired: list[IEffect] = [
+            effect
+            for effect in self.candidates(action=action)
+            if effect.bind_removal(action, action.card, action.player)
+            or effect.bind_deactivation(context=context)
+        ]
+
+        for effect in expired:
+            logger.info(
+                "  Effect '%s' expired after '%s'",
+                effect.name,
+                action.name,
+            )
+            self.unregister(effect=effect)
+
+        return expired
@@ -11,8 +11,10 @@ from custom_tcg.core.execution.resolve import Resolve
 from custom_tcg.core.interface import IAction
 
 if TYPE_CHECKING:
+    from collections import deque
     from collections.abc import Callable
 
+    from custom_tcg.core.execution.trigger_queue import TriggerQueue
     from custom_tcg.core.interface import (
         IAction,
         ICard,
@@ -58,7 +60,7 @@ class Activate(Action):
     def enter(self: Activate, context: IExecutionContext) -> None:
         super().enter(context=context)
 
-        append_queue: list[IAction] = context.notifications
+        append_queue: deque[IAction] | TriggerQueue = context.notifications
 
         if CardTypeDef.process in self.card.types:
             context.process = self.card
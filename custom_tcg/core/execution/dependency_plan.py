@@ -0,0 +1,133 @@
+"""Flattened trees of the selectors and costs an action depends on."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from custom_tcg.core.dimension import ActionStateDef
+
+if TYPE_CHECKING:
+    from custom_tcg.core.interface import IAction, ICard
+
+logger: logging.Logger = logging.getLogger(name=__name__)
+
+
+@dataclass(frozen=True, eq=False)
+class DependencyPlan:
+    """An action and its dependents, flattened in depth-first order.
+
+    `actions[0]` is the action itself. The dependents of `actions[index]`
+    follow it, up to `ends[index]`, selectors before costs. A completed
+    dependent's own dependents are skipped by jumping to its end.
+
+    Actions of a card definition are bound their plans when the card is
+    created, from the definition's `DependencyShape`. Other actions are
+    compiled each time they are needed, and are rarely more than a leaf.
+    """
+
+    actions: tuple[IAction, ...]
+    ends: tuple[int, ...]
+
+    @classmethod
+    def compile(cls: type[DependencyPlan], action: IAction) -> DependencyPlan:
+        """Flatten the dependency tree of an action."""
+        actions: list[IAction] = []
+        ends: list[int] = []
+        stack: list[tuple[IAction, int | None]] = [(action, None)]
+
+        # Entries with an index close the subtree started at that index.
+        while len(stack) > 0:
+            next_action, started = stack.pop()
+
+            if started is not None:
+                ends[started] = len(actions)
+                continue
+
+            stack.append((next_action, len(actions)))
+            actions.append(next_action)
+            ends.append(0)
+            stack.extend(
+                (dependent, None)
+                for dependent in reversed(
+                    (*next_action.selectors, *next_action.costs),
+                )
+            )
+
+        return cls(actions=tuple(actions), ends=tuple(ends))
+
+    @classmethod
+    def of(cls: type[DependencyPlan], action: IAction) -> DependencyPlan:
+        """Get the plan bound to an action, or compile one."""
+        plan: object = getattr(action, "dependency_plan", None)
+
+        if isinstance(plan, DependencyPlan):
+            return plan
+
+        return cls.compile(action=action)
+
+    def pending(self: DependencyPlan, index: int) -> int | None:
+        """Find the first dependent of an action not yet completed."""
+        dependent: int = index + 1
+
+        while dependent < self.ends[index]:
+            if self.actions[dependent].state != ActionStateDef.completed:
+                return dependent
+
+            dependent = self.ends[dependent]
+
+        return None
+
+
+@dataclass(frozen=True, eq=False)
+class DependencyShape:
+    """The dependency plans of a card definition's actions, as positions.
+
+    Definitions create the same actions each time, so the plan of the action
+    at `index` in a card's registry lists the registry positions in
+    `positions[index]`, and its subtree ends in `ends[index]`. Actions
+    depending on actions of other cards have no positions, and are compiled
+    when needed.
+    """
+
+    positions: tuple[tuple[int, ...] | None, ...]
+    ends: tuple[tuple[int, ...], ...]
+
+    @classmethod
+    def compile(cls: type[DependencyShape], card: ICard) -> DependencyShape:
+        """Find the plans of a newly created card's actions."""
+        registry: dict[int, int] = {
+            id(action): position
+            for position, action in enumerate(card.action_registry)
+        }
+        plans: list[DependencyPlan] = [
+            DependencyPlan.compile(action=action)
+            for action in card.action_registry
+        ]
+
+        return cls(
+            positions=tuple(
+                tuple(registry[id(action)] for action in plan.actions)
+                if all(id(action) in registry for action in plan.actions)
+                else None
+                for plan in plans
+            ),
+            ends=tuple(plan.ends for plan in plans),
+        )
+
+    def bind(self: DependencyShape, card: ICard) -> None:
+        """Bind a newly created card's actions to their plans."""
+        registry: list[IAction] = card.action_registry
+
+        for action, positions, ends in zip(
+            registry,
+            self.positions,
+            self.ends,
+            strict=True,
+        ):
+            if positions is not None:
+                action.dependency_plan = DependencyPlan(
+                    actions=tuple(registry[position] for position in positions),
+                    ends=ends,
+                )
@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+import operator
+from collections import deque
+from dataclasses import dataclass, field
+from functools import partial
 
 from custom_tcg.core.card.card import Card
 from custom_tcg.core.dimension import ActionStateDef
+from custom_tcg.core.effect.expiry import EffectExpiries
+from custom_tcg.core.effect.remove_effect import RemoveEffect
+from custom_tcg.core.execution.activate import Activate
+from custom_tcg.core.execution.dependency_plan import DependencyPlan
 from custom_tcg.core.execution.resolve import Resolve
+from custom_tcg.core.execution.trigger_queue import TriggerQueue
 from custom_tcg.core.interface import (
     IAction,
     IActionContext,
@@ -17,10 +24,11 @@ from custom_tcg.core.interface import (
     IExecutionContext,
     IPlayer,
 )
+from custom_tcg.core.object_index import ObjectIndex
 from custom_tcg.core.process.reset_actions import ResetActions
-
-if TYPE_CHECKING:
-    from collections.abc import Generator
+from custom_tcg.core.turn_structure import TurnStructure
+from custom_tcg.core.util.random import GameRandom
+from custom_tcg.core.zone import Zone
 
 logger: logging.Logger = logging.getLogger(name=__name__)
 
@@ -35,21 +43,40 @@ class ActionContext(IActionContext):
     players: list[IPlayer]
 
 
+@dataclass
+class ExecutionFrame:
+    """An action being executed, with the actions it asked to execute."""
+
+    action: IAction
+    pending: deque[IAction] = field(default_factory=deque)
+
+
 class ExecutionContext(IExecutionContext):
     """Match context for an action."""
 
     player: IPlayer
     process: ICard
-    ready: list[IAction]
-    choices: list[IAction]
-    notifications: list[IAction]
+    ready: deque[IAction]
+    _choices: list[IAction]
+    offered: dict[str, int]
+    notifications: TriggerQueue
     completed: IActionQueue | None
     players: list[IPlayer]
+    index: ObjectIndex
+    expiries: EffectExpiries
+    turns: TurnStructure
+    random: GameRandom
+    version: int
+    feasibility: dict[IAction, bool]
+    feasibility_version: int
+    frames: list[ExecutionFrame]
+    departed: dict[ICard, None]
 
     def __init__(
         self: ExecutionContext,
         players: list[IPlayer],
         completed: IActionQueue | None = None,
+        rng: GameRandom | None = None,
     ) -> None:
         """Create an execution context."""
         self.player = players[0]
@@ -59,20 +86,132 @@ class ExecutionContext(IExecutionContext):
             types=[],
             classes=[],
         )
-        self.ready = []
+        self.ready = deque()
         self.choices = []
-        self.notifications = []
+        self.notifications = TriggerQueue(rank=self.controller_rank)
         self.completed = completed
         self.players = players
+        self.index = ObjectIndex()
+        self.expiries = EffectExpiries()
+        self.turns = TurnStructure(players=players)
+        self.random = rng or GameRandom()
+        self.version = 0
+        self.feasibility = {}
+        self.feasibility_version = 0
+        self.frames = []
+        self.departed = {}
+
+        for player in players:
+            self.watch(player=player)
+
+    @property
+    def choices(self: ExecutionContext) -> list[IAction]:
+        """Get the actions offered to choose from."""
+        return self._choices
+
+    @choices.setter
+    def choices(self: ExecutionContext, choices: list[IAction]) -> None:
+        """Offer new choices, indexing their positions by id."""
+        self._choices = choices
+        self.offered = {
+            choice.session_object_id: position
+            for position, choice in enumerate(choices)
+        }
+
+    def choice_position(self: ExecutionContext, action: IAction) -> int:
+        """Find where an action is among the choices, or -1 if not offered."""
+        position: int = self.offered.get(action.session_object_id, -1)
+
+        if (
+            not 0 <= position < len(self._choices)
+            or self._choices[position] is not action
+        ):
+            return -1
+
+        return position
+
+    def controller_rank(self: ExecutionContext, player: IPlayer) -> int:
+        """Rank a player by turn order, starting from the active player."""
+        if player not in self.players:
+            return len(self.players)
+
+        active: int = (
+            self.players.index(self.player)
+            if self.player in self.players
+            else 0
+        )
+        return (self.players.index(player) - active) % len(self.players)
+
+    def touch(self: ExecutionContext) -> None:
+        """Note that the board changed, invalidating cached evaluations."""
+        self.version += 1
+
+    def watch(self: ExecutionContext, player: IPlayer) -> None:
+        """Move the board version on whenever a player's zones change.
+
+        Cards taken out of play are noted, to forget their effects' expiries
+        if they are still out of play once the action completes.
+        """
+        for zone in (
+            player.main_cards,
+            player.hand,
+            player.played,
+            player.discard,
+        ):
+            if isinstance(zone, Zone):
+                zone.changed = self.touch
+
+        if isinstance(player.played, Zone):
+            player.played.removed = self.depart
+
+    def depart(self: ExecutionContext, card: ICard) -> None:
+        """Note a card taken out of play."""
+        self.departed[card] = None
 
     def execute(self: ExecutionContext, action: IAction) -> None:
-        """Execute an action."""
+        """Execute an action, and any actions it executes in turn.
+
+        Actions executed while another is stepping are not run right away.
+        They are pending on the stepping action's frame, and run in order once
+        that step is done, each with its own frame. This keeps nested
+        execution iterative rather than recursive.
+        """
+        if len(self.frames) > 0:
+            logger.info("  Deferring '%s' to a new frame", action.name)
+            self.frames[-1].pending.append(action)
+            return
+
+        try:
+            self.push(action=action)
+
+            while len(self.frames) > 0:
+                frame: ExecutionFrame = self.frames[-1]
+
+                if len(frame.pending) > 0:
+                    self.push(action=frame.pending.popleft())
+                else:
+                    self.pop()
+        finally:
+            self.frames.clear()
+
+    def push(self: ExecutionContext, action: IAction) -> None:
+        """Start a frame for an action and step it."""
+        self.frames.append(ExecutionFrame(action=action))
+        self.step(action=action)
+
+    def pop(self: ExecutionContext) -> None:
+        """Finish the innermost frame once its pending actions have run."""
+        self.frames.pop()
+
+    def step(self: ExecutionContext, action: IAction) -> None:
+        """Move an action through its states once."""
         logger.info(
             "Attempt to execute '%s' from card '%s'",
             action.name,
             action.card.name,
         )
 
+        self.index.add(obj=action)
         next_action: IAction = action
 
         # Consider dependent selector and cost actions, then queue and provide
@@ -108,18 +247,21 @@ class ExecutionContext(IExecutionContext):
             logger.info("  Post-executing '%s'", next_action.name)
             self.post_execute(action=next_action)
 
-        if (
-            next_action.state
-            in (
-                ActionStateDef.completed,
-                ActionStateDef.cancelled,
-            )
-            and self.completed is not None
+        if next_action.state in (
+            ActionStateDef.completed,
+            ActionStateDef.cancelled,
         ):
+            self.finish(action=next_action)
+
+        self.request_next_input()
+
+    def finish(self: ExecutionContext, action: IAction) -> None:
+        """Report a completed or cancelled action and dequeue it."""
+        if self.completed is not None:
             logger.info("  Queueing event for a completed action")
             self.completed.append(
                 ActionContext(
-                    action=next_action,
+                    action=action,
                     ready=list(self.ready),
                     choices=list(self.choices),
                     players=list(self.players),
@@ -127,133 +269,150 @@ class ExecutionContext(IExecutionContext):
             )
 
         # Dequeue if done executing. Pop state if necessary.
-        if next_action.state in (
-            ActionStateDef.completed,
-            ActionStateDef.cancelled,
-        ):
-            logger.info("  Dequeueing '%s'", next_action.name)
-            self.dequeue(action=next_action)
+        logger.info("  Dequeueing '%s'", action.name)
+        self.dequeue(action=action)
 
+    def request_next_input(self: ExecutionContext) -> None:
+        """Offer choices if the next ready action is waiting on input."""
         if (
             len(self.ready) > 0
             and self.ready[0].state == ActionStateDef.input_requested
         ):
             self.ready[0].request_input(context=self)
+            self.index.add_all(objs=self.choices)
 
     def speculate(
         self: ExecutionContext,
         action: IAction,
     ) -> None:
-        """Check all dependent actions and execute `queue` speculatively."""
-        next_action: IAction | None = action
-        stack: list[IAction] = []
-        cancellation_found: bool = False
-
-        while next_action is not None:
-            dependents: Generator[IAction, None, None] = (
-                stateful
-                for stateful in (*next_action.selectors, *next_action.costs)
-                if stateful.state != ActionStateDef.completed
+        """Cancel an action if it or any dependent action can't be satisfied."""
+        if not self.satisfiable(action=action):
+            action.state = ActionStateDef.cancelled
+            logger.info(
+                "  Cancelled action '%s' due to dependent cancellation",
+                action.name,
             )
 
-            stack.extend(dependents)
+    def satisfiable(self: ExecutionContext, action: IAction) -> bool:
+        """Check if an action and its dependents can all be satisfied.
 
-            if next_action.state == ActionStateDef.not_started:
+        Only actions not yet started are checked, with `can_satisfy`, so no
+        action state is changed.
+        """
+        plan: DependencyPlan = DependencyPlan.of(action=action)
+        index: int = 0
+
+        while index < len(plan.actions):
+            next_action: IAction = plan.actions[index]
+
+            # Completed dependents need nothing more, nor do theirs.
+            if index > 0 and next_action.state == ActionStateDef.completed:
+                index = plan.ends[index]
+                continue
+
+            if (
+                next_action.state == ActionStateDef.not_started
+                and not next_action.can_satisfy(context=self)
+            ):
                 logger.info(
-                    "  Check cancellation of dependent '%s'",
+                    "  Found cancellation of dependent '%s'",
                     next_action.name,
                 )
+                return False
 
-                next_action.queue(context=self)
+            index += 1
 
-                if next_action.state == ActionStateDef.cancelled:
-                    logger.info(
-                        "  Found cancellation of dependent '%s'",
-                        next_action.name,
-                    )
-                    cancellation_found = True
-                    stack.clear()
+        return True
 
-                next_action.reset_state()
+    def feasible(self: ExecutionContext, action: IAction) -> bool:
+        """Check if an action could execute now, without executing it.
 
-            next_action = stack.pop() if len(stack) > 0 else None
+        An action is feasible unless speculation cancels it. An activation is
+        also infeasible if none of its actions are. Results are cached until
+        the board version moves on, when a zone or an effect changes.
+        """
+        if self.feasibility_version != self.version:
+            self.feasibility.clear()
+            self.feasibility_version = self.version
 
-        if cancellation_found:
-            action.state = ActionStateDef.cancelled
-            logger.info(
-                "  Cancelled action '%s' due to dependent cancellation",
-                action.name,
-            )
+        if action not in self.feasibility:
+            feasible: bool = self.satisfiable(action=action)
+
+            if feasible and isinstance(action, Activate) and action.actions:
+                feasible = any(
+                    self.feasible(action=activated)
+                    for activated in action.actions
+                )
+
+            self.feasibility[action] = feasible
+
+        return self.feasibility[action]
 
     def next_dependent(self: ExecutionContext, action: IAction) -> IAction:
         """Find the first dependent actions that still needs execution."""
+        plan: DependencyPlan = DependencyPlan.of(action=action)
+
         # Push state on the parent action, even if it won't execute yet.
-        next_action: IAction | None = action
+        index: int | None = 0
+
+        while index is not None:
+            next_action: IAction = plan.actions[index]
 
-        while next_action is not None:
             if next_action.state == ActionStateDef.not_started:
                 logger.info("  Queueing '%s'", next_action.name)
-                self.ready = [next_action, *self.ready]
+                self.ready.appendleft(next_action)
                 next_action.queue(context=self)
 
             # Selector and cost results are used by the action. They are always
             # stateful. They must be satisfied or cancelled before the desired
             # action is executed.
-            dependents: Generator[IAction, None, None] = (
-                stateful
-                for stateful in (*next_action.selectors, *next_action.costs)
-                if stateful.state != ActionStateDef.completed
-            )
-            next_dependent: IAction | None = next(iter(dependents), None)
+            next_dependent: int | None = plan.pending(index=index)
 
             # If any dependent was cancelled, pass execution back to the parent
             # and cancel it too.
             if (
                 next_dependent is not None
-                and next_dependent.state == ActionStateDef.cancelled
+                and plan.actions[next_dependent].state
+                == ActionStateDef.cancelled
             ):
                 next_action.state = ActionStateDef.cancelled
                 next_dependent = None
 
-            next_action = next_dependent
+            index = next_dependent
 
         return self.ready[0]
 
     def post_execute(self: ExecutionContext, action: IAction) -> None:
         """Update changes to effects, notifications, etc."""
-        # TODO: Effect removal on bind.  # noqa: TD002, FIX002, TD003
-        # for effect, affected_card in (
-        #     (effect, card)
-        #     for player in self.players
-        #     for card in player.played
-        #     for effect in card.effects
-        # ):
-        #     if effect.bind_removal(
-        #         action,
-        #         action.card,
-        #         action.card.player,
-        #     ):
-        #         self.ready.append(
-        #             Resolve(
-        #                 action=RemoveEffect(
-        #                     effect_to_remove=effect,
-        #                     card_to_remove_from=affected_card,
-        #                     card=action.card,
-        #                     player=action.player,
-        #                 ),
-        #                 card=action.card,
-        #                 player=action.player,
-        #             ),
-        #         )
+        # End effects waiting on this kind of action, on their own frame.
+        for effect in self.expiries.expire(action=action, context=self):
+            self.execute(
+                action=RemoveEffect(
+                    effect_to_remove=effect,
+                    card_to_remove_from=effect.card_affected,
+                    card=action.card,
+                    player=action.player,
+                ),
+            )
+
+        # Effects left on cards out of play never expire, so stop indexing.
+        for card in self.departed:
+            if card not in card.player.played:
+                self.expiries.forget(card=card)
+
+        self.departed.clear()
 
         self.notifications.extend(
-            Resolve(
-                action=notification,
-                card=notification.card,
-                player=notification.player,
-            )
-            for notification in action.notify
-            if notification.card in action.player.played
+            actions=(
+                Resolve(
+                    action=notification,
+                    card=notification.card,
+                    player=notification.player,
+                )
+                for notification in action.notify
+                if notification.card in action.player.played
+            ),
+            source=action,
         )
 
     def dequeue(self: ExecutionContext, action: IAction) -> None:
@@ -265,21 +424,23 @@ class ExecutionContext(IExecutionContext):
             )
             self.ready.remove(action)
 
-        if action in self.choices:
+        if self.choice_position(action=action) >= 0:
             logger.info(
                 "Action '%s' found in choice after execution, dequeueing.",
                 action.name,
             )
-            self.choices.remove(action)
+            self.choices = [
+                choice for choice in self.choices if choice is not action
+            ]
 
         if action.bind is not None:
-            this_action: IAction = action
-
+            # A partial rather than a closure, so the reset can be saved.
             self.notifications.append(
                 ResetActions(
                     card=action.card,
                     player=action.player,
-                    filter_actions=lambda action: action is this_action,
+                    filter_actions=partial(operator.is_, action),
+                    action_types=type(action),
                 ),
             )
 
@@ -45,6 +45,7 @@ class Play(Action):
 
         if CardTypeDef.process in self.card.types:
             context.player.processes.append(self.card)
+            context.turns.add_process(process=self.card)
 
         for effect in self.card.effects:
             effect.activate(context=context)
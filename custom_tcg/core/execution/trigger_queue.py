@@ -0,0 +1,140 @@
+"""Order triggered actions waiting to resolve."""
+
+from __future__ import annotations
+
+import heapq
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from custom_tcg.core.interface import IAction, IPlayer
+
+logger: logging.Logger = logging.getLogger(name=__name__)
+
+type TriggerEntry = tuple[int, int, IAction]
+
+
+class TriggerQueue:
+    """Order triggered actions waiting to resolve.
+
+    Triggers are kept in a heap, resolving by controller (as ranked by
+    `rank`, such as the active player first), then in the order they
+    triggered. A trigger resolving the same action for the same `source`, the
+    action that set it off, is already pending and is not queued again. The
+    same listener set off by two actions triggers twice.
+
+    Iterating gives pending triggers in resolution order. `drain` pops them
+    all off the heap as a batch, in the same order.
+    """
+
+    heap: list[TriggerEntry]
+    pending: set[object]
+    sources: dict[int, object]
+    timestamp: int
+    rank: Callable[[IPlayer], int]
+
+    def __init__(
+        self: TriggerQueue,
+        rank: Callable[[IPlayer], int] | None = None,
+    ) -> None:
+        """Create an empty queue."""
+        self.heap = []
+        self.pending = set()
+        self.sources = {}
+        self.timestamp = 0
+        self.rank = rank or (lambda player: 0)  # noqa: ARG005
+
+    @staticmethod
+    def key(action: IAction, source: object = None) -> object:
+        """Identify what a trigger does and what set it off."""
+        resolved: IAction | None = getattr(action, "action", None)
+
+        if resolved is None:
+            return action
+
+        return (type(action), resolved, id(source))
+
+    def append(
+        self: TriggerQueue,
+        action: IAction,
+        source: object = None,
+    ) -> None:
+        """Queue a trigger, unless an identical one is pending."""
+        key: object = TriggerQueue.key(action=action, source=source)
+
+        if key in self.pending:
+            logger.info("  Trigger '%s' already pending", action.name)
+            return
+
+        self.timestamp += 1
+        self.pending.add(key)
+        self.sources[id(action)] = source
+        heapq.heappush(
+            self.heap,
+            (self.rank(action.player), self.timestamp, action),
+        )
+
+    def extend(
+        self: TriggerQueue,
+        actions: Iterable[IAction],
+        source: object = None,
+    ) -> None:
+        """Queue many triggers, all set off by `source`."""
+        for action in actions:
+            self.append(action=action, source=source)
+
+    def pop(self: TriggerQueue, index: int = 0) -> IAction:
+        """Remove and return a trigger, the next to resolve by default."""
+        if index == 0:
+            entry: TriggerEntry = heapq.heappop(self.heap)
+        else:
+            ordered: list[TriggerEntry] = sorted(self.heap)
+            entry = ordered.pop(index)
+            self.heap = ordered
+
+        action: IAction = entry[-1]
+        self.pending.discard(
+            TriggerQueue.key(
+                action=action,
+                source=self.sources.pop(id(action)),
+            ),
+        )
+        return action
+
+    def drain(self: TriggerQueue) -> list[IAction]:
+        """Remove and return every pending trigger, in resolution order."""
+        triggered: list[IAction] = [
+            heapq.heappop(self.heap)[-1] for _ in range(len(self.heap))
+        ]
+        self.pending.clear()
+        self.sources.clear()
+        return triggered
+
+    def clear(self: TriggerQueue) -> None:
+        """Remove every pending trigger."""
+        self.heap.clear()
+        self.pending.clear()
+        self.sources.clear()
+
+    def __len__(self: TriggerQueue) -> int:
+        """Count pending triggers."""
+        return len(self.heap)
+
+    def __iter__(self: TriggerQueue) -> Iterator[IAction]:
+        """Iterate pending triggers in resolution order."""
+        return (entry[-1] for entry in sorted(self.heap))
+
+    def __eq__(self: TriggerQueue, other: object) -> bool:
+        """Compare pending triggers, in order, with another sequence."""
+        if isinstance(other, (TriggerQueue, list, tuple)):
+            return list(self) == list(other)
+
+        return NotImplemented
+
+    __hash__ = None  # pyright: ignore[reportAssignmentType]
+
+    def __repr__(self: TriggerQueue) -> str:
+        """Create a string representation of a queue."""
+        return f"TriggerQueue({list(self)!r})"
@@ -3,25 +3,36 @@
 from __future__ import annotations
 
 import logging
-from secrets import randbelow
+from collections import deque
+from time import monotonic
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
 from custom_tcg.core.dimension import ActionStateDef
-from custom_tcg.core.execution.activate import Activate
 from custom_tcg.core.execution.execution import ExecutionContext
 from custom_tcg.core.execution.play import Play
-from custom_tcg.core.execution.resolve import Resolve
 from custom_tcg.core.interface import IAction, IPlayer
-from custom_tcg.core.util import random
+from custom_tcg.core.replay import (
+    CHECKPOINT_INTERVAL,
+    GameRecord,
+    PlayerRecord,
+    digest,
+    encode_checkpoint,
+    encode_choice,
+)
+from custom_tcg.core.util.random import GameRandom
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from custom_tcg.core.autopilot import AutoPilot
     from custom_tcg.core.interface import (
         IAction,
         ICard,
         IExecutionContext,
         IPlayer,
     )
+    from custom_tcg.core.replay import ReplayWriter
 
 logger: logging.Logger = logging.getLogger(name=__name__)
 
@@ -29,18 +40,45 @@ logger: logging.Logger = logging.getLogger(name=__name__)
 class Game:
     """Play a game!."""
 
+    # Consecutive choices auto-pilots may make, across runs, before the choice
+    # is left to the player, so that games between auto-pilots always yield.
+    MAX_AUTO_CHOICES: int = 100
+
     session_id: str
     players: list[IPlayer]
     context: IExecutionContext
     prev_action: IAction | None
     prev_count: int = 0
-
-    def __init__(self: Game, players: list[IPlayer]) -> None:
-        """Create a game."""
+    autopilots: dict[str, AutoPilot]
+    random: GameRandom
+    record: GameRecord
+    recorder: ReplayWriter | None
+    pending_choices: list[str]
+    dropped_choices: list[str]
+    auto_choices: int
+
+    def __init__(
+        self: Game,
+        players: list[IPlayer],
+        rng: GameRandom | None = None,
+    ) -> None:
+        """Create a game, with random numbers from `rng` or a fresh seed."""
         self.session_id = uuid4().hex
         self.players = []
-        self.context = ExecutionContext(players=players)
+        self.random = rng or GameRandom()
+        self.context = ExecutionContext(players=players, rng=self.random)
+        logger.info(
+            "Game '%s' seeded with %d",
+            self.session_id,
+            self.random.seed,
+        )
         self.prev_action = None
+        self.autopilots = {}
+        self.record = GameRecord(seed=self.random.seed)
+        self.recorder = None
+        self.pending_choices = []
+        self.dropped_choices = []
+        self.auto_choices = 0
 
         for player in players:
             self.add_player(player=player)
@@ -48,6 +86,9 @@ class Game:
     def add_player(self: Game, player: IPlayer) -> None:
         """Add a player to this game. Do minimal setup."""
         self.players.append(player)
+        self.context.watch(player=player)
+        self.context.index.add_player(player=player)
+        self.record.players.append(PlayerRecord.of(player=player))
 
         for card_, action_ in (
             (card, action)
@@ -59,11 +100,22 @@ class Game:
             self.context.ready.append(action_)
             action_.state = ActionStateDef.queued
 
+    def set_autopilot(
+        self: Game,
+        player: IPlayer,
+        autopilot: AutoPilot | None,
+    ) -> None:
+        """Let an auto-pilot make a player's choices, or stop it with None."""
+        if autopilot is None:
+            self.autopilots.pop(player.session_object_id, None)
+        else:
+            self.autopilots[player.session_object_id] = autopilot
+
     def setup(self: Game) -> None:
         """Perform game-wide setup for players."""
         for player in self.players:
-            player.main_cards = random.list_randomize(ordered=player.main_cards)
-        random_first_index: int = randbelow(
+            self.random.shuffle(items=player.main_cards)
+        random_first_index: int = self.random.below(
             exclusive_upper_bound=len(self.players),
         )
         self.players = (
@@ -71,15 +123,27 @@ class Game:
             + self.players[:random_first_index]
         )
         self.context.players = self.players
-        self.context.ready.sort(
-            key=lambda action: self.players.index(action.player),
+        self.context.turns.set_players(players=self.players)
+        self.context.ready = deque(
+            sorted(
+                self.context.ready,
+                key=lambda action: self.players.index(action.player),
+            ),
         )
 
-    def start(self: Game) -> list[IAction]:
+    def start(
+        self: Game,
+        max_steps: int | None = None,
+        deadline: float | None = None,
+    ) -> list[IAction]:
         """Play starting hands with no resolution from bindings.
 
-        Then queue up the first process for the first player.
+        Then queue up the first process for the first player. See `run` for
+        `max_steps` and `deadline`.
         """
+        if self.recorder is not None:
+            self.recorder.start(record=self.record)
+
         while len(self.context.ready) > 0:
             action: IAction = self.context.ready[0]
             logger.info(
@@ -90,32 +154,43 @@ class Game:
             self.context.player = action.player
             self.context.execute(action=action)
 
-        self.context.notifications = []
+        self.context.notifications.clear()
 
         self.context.player = self.players[0]
         first_process: ICard = self.context.player.processes[0]
 
-        self.context.ready = [
-            Resolve(
-                action=next(
-                    action
-                    for action in first_process.actions
-                    if isinstance(action, Activate)
-                ),
-                card=first_process,
-                player=self.context.player,
-            ),
-        ]
+        self.context.ready = deque(
+            [self.context.turns.entry(process=first_process).resolve],
+        )
         self.context.ready[0].state = ActionStateDef.queued
-        self.context.notifications = []
+        self.context.notifications.clear()
 
-        self.execute_ready_queue()
+        self.run(max_steps=max_steps, deadline=deadline)
+        return self.context.choices
+
+    def choose(
+        self: Game,
+        action: IAction,
+        max_steps: int | None = None,
+        deadline: float | None = None,
+    ) -> list[IAction]:
+        """Execute a chosen action and evaluate any ready actions.
+
+        See `run` for `max_steps` and `deadline`. A choice made directly
+        replaces any batch of choices still pending.
+        """
+        self.pending_choices.clear()
+        self.dropped_choices = []
+        self.auto_choices = 0
+        self.apply_choice(action=action)
+        self.run(max_steps=max_steps, deadline=deadline)
         return self.context.choices
 
-    def choose(self: Game, action: IAction) -> list[IAction]:
-        """Execute a chosen action and evaluate any ready actions."""
+    def apply_choice(self: Game, action: IAction) -> None:
+        """Execute a chosen action and pass input to the action awaiting it."""
         choice_for_action: bool = len(self.context.ready) > 0
 
+        self.record_choice(action=action)
         self.context.execute(action=action)
 
         if choice_for_action:
@@ -124,31 +199,184 @@ class Game:
 
         logger.info(msg=self.context)
 
-        self.execute_ready_queue()
+    def record_choice(self: Game, action: IAction) -> None:
+        """Record a choice, and the game state every few choices if recording.
+
+        Without a recorder, only choices are kept, skipping state digests.
+        """
+        count: int = len(self.record.choices)
+        chunk: bytes = b""
+
+        if self.recorder is not None and count % CHECKPOINT_INTERVAL == 0:
+            checksum: int = digest(game=self)
+            self.record.checkpoints[count] = checksum
+            chunk += encode_checkpoint(choices=count, checksum=checksum)
+
+        index: int = self.context.choice_position(action=action)
+        self.record.choices.append(index)
+        chunk += encode_choice(index=index)
+
+        if self.recorder is not None:
+            self.recorder.append(chunk=chunk)
+
+    def choose_many(
+        self: Game,
+        actions: Sequence[IAction | str],
+        max_steps: int | None = None,
+        deadline: float | None = None,
+    ) -> list[IAction]:
+        """Execute several choices in order, as if chosen one at a time.
+
+        Each entry is an action or its session object id. The first must be
+        offered now, or the batch is rejected and nothing is chosen. Later
+        entries only need to be offered by the time they are reached, so a
+        batch may go on into the next selector, such as a receiver and then
+        the items to deliver to it. If an entry is not offered when reached,
+        it and the rest of the batch are dropped, and left in
+        `dropped_choices` for the caller. The batch is applied by `run`, one
+        choice per step, so `max_steps` and `deadline` bound all of it and
+        calling `run` again resumes it.
+        """
+        batch: list[str] = [
+            entry if isinstance(entry, str) else entry.session_object_id
+            for entry in actions
+        ]
+        self.pending_choices = batch
+        self.dropped_choices = []
+
+        if self.pending_choice() is None:
+            logger.warning("Rejected %s choice(s), not offered.", len(batch))
+            return self.context.choices
+
+        self.auto_choices = 0
+        self.run(max_steps=max_steps, deadline=deadline)
         return self.context.choices
 
-    def execute_ready_queue(self: Game) -> None:
-        """Continuously execute the ready action until a choice is needed."""
-        while (
-            len(self.context.ready) > 0
-            and self.context.ready[0].state != ActionStateDef.input_requested
-        ):
-            self.prev_action = self.context.ready[0]
+    def choice_by_id(self: Game, session_object_id: str) -> IAction | None:
+        """Find a currently offered choice by id, or None if not offered."""
+        position: int | None = self.context.offered.get(session_object_id)
 
-            self.context.execute(action=self.context.ready[0])
-            logger.info(msg=self.context)
+        if position is None:
+            return None
+
+        return self.context.choices[position]
+
+    @property
+    def idle(self: Game) -> bool:
+        """Check if nothing can execute until a choice is made."""
+        return (
+            len(self.context.ready) == 0
+            or self.context.ready[0].state == ActionStateDef.input_requested
+        )
+
+    def run(
+        self: Game,
+        max_steps: int | None = None,
+        deadline: float | None = None,
+    ) -> bool:
+        """Execute ready actions until a choice is needed or budget runs out.
+
+        Pending choices from `choose_many` are applied first, then choices
+        made by an auto-pilot. Both count as steps. `deadline` is compared
+        against `time.monotonic()`. Returns whether the game is idle. If not,
+        the budget ran out first, and calling `run` again resumes execution
+        where it stopped.
+        """
+        steps: int = 0
+
+        while True:
+            auto_choice: IAction | None = None
+
+            pending: IAction | None = None
+
+            if self.idle:
+                pending = self.pending_choice()
+
+            if self.idle and pending is None:
+                if self.auto_choices >= Game.MAX_AUTO_CHOICES:
+                    return True
+
+                auto_choice = self.auto_choice()
+
+                if auto_choice is None:
+                    return True
 
-            if (
-                len(self.context.ready) == 0
-                or self.prev_action is None
-                or self.context.ready[0] != self.prev_action
+            if (max_steps is not None and steps >= max_steps) or (
+                deadline is not None and monotonic() >= deadline
             ):
-                self.prev_count = 0
+                logger.info("Run budget exhausted after %s step(s).", steps)
+                return False
+
+            if pending is not None:
+                self.pending_choices.pop(0)
+                self.apply_choice(action=pending)
+            elif auto_choice is not None:
+                logger.info("Auto-pilot chose '%s'.", auto_choice.name)
+                self.apply_choice(action=auto_choice)
+                self.auto_choices += 1
             else:
-                self.prev_count += 1
+                self.step()
+
+            steps += 1
+
+    def pending_choice(self: Game) -> IAction | None:
+        """Get the next pending choice, dropping the batch if not offered."""
+        if len(self.pending_choices) == 0:
+            return None
+
+        action: IAction | None = self.choice_by_id(
+            session_object_id=self.pending_choices[0],
+        )
+
+        if action is None:
+            logger.warning(
+                "Dropped %s pending choice(s), not offered.",
+                len(self.pending_choices),
+            )
+            self.dropped_choices = self.pending_choices
+            self.pending_choices = []
+
+        return action
+
+    def auto_choice(self: Game) -> IAction | None:
+        """Ask the auto-pilot of the player being asked for input, if any."""
+        if len(self.context.ready) == 0:
+            return None
+
+        autopilot: AutoPilot | None = self.autopilots.get(
+            self.context.ready[0].player.session_object_id,
+        )
+
+        if autopilot is None:
+            return None
+
+        return autopilot.choose(context=self.context)
+
+    def execute_ready_queue(self: Game) -> None:
+        """Continuously execute the ready action until a choice is needed."""
+        self.run()
+
+    def step(self: Game) -> None:
+        """Execute the next ready action once."""
+        if self.idle:
+            return
+
+        self.prev_action = self.context.ready[0]
+
+        self.context.execute(action=self.context.ready[0])
+        logger.info(msg=self.context)
+
+        if (
+            len(self.context.ready) == 0
+            or self.prev_action is None
+            or self.context.ready[0] != self.prev_action
+        ):
+            self.prev_count = 0
+        else:
+            self.prev_count += 1
 
-            if self.prev_count > 10:  # noqa: PLR2004
-                raise Exception("Max duplicate ready action occurred.")  # noqa: TRY003, TRY002, EM101
+        if self.prev_count > 10:  # noqa: PLR2004
+            raise Exception("Max duplicate ready action occurred.")  # noqa: TRY003, TRY002, EM101
 
 
 if __name__ == "__main__":
@@ -6,6 +6,7 @@ import logging
 from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
+    from collections import deque
     from collections.abc import Callable
 
     from custom_tcg.core.dimension import (
@@ -14,6 +15,14 @@ if TYPE_CHECKING:
         CardType,
         EffectState,
     )
+    from custom_tcg.core.dirty_actions import DirtyActions
+    from custom_tcg.core.effect.expiry import EffectExpiries, Expiry
+    from custom_tcg.core.execution.dependency_plan import DependencyPlan
+    from custom_tcg.core.execution.trigger_queue import TriggerQueue
+    from custom_tcg.core.object_index import ObjectIndex
+    from custom_tcg.core.turn_structure import TurnStructure
+    from custom_tcg.core.util.random import GameRandom
+    from custom_tcg.core.zone import Zone
 
 
 logger: logging.Logger = logging.getLogger(name=__name__)
@@ -35,17 +44,18 @@ class IPlayer(INamed, ISessionTracked):
     """A tcg match player."""
 
     decks: list[IDeck]
+    dirty_actions: DirtyActions
     starting_cards: list[ICard]
-    main_cards: list[ICard]
+    main_cards: Zone
     processes: list[ICard]
-    hand: list[ICard]
-    played: list[ICard]
-    discard: list[ICard]
+    hand: Zone
+    played: Zone
+    discard: Zone
 
     def select_deck(self: IPlayer, deck: IDeck) -> None:
         """Select a deck for play."""
         self.starting_cards = deck.starting
-        self.main_cards = deck.main
+        self.main_cards = deck.main  # pyright: ignore[reportAttributeAccessIssue]
 
 
 class IDeck(INamed):
@@ -65,6 +75,7 @@ class ICard(INamed, ISessionTracked):
     actions: list[IAction]
     effects: list[IEffect]
     action_registry: list[IAction]
+    zones: list[Zone]
 
     @classmethod
     def create(cls: type[ICard], player: IPlayer) -> ICard:
@@ -114,11 +125,16 @@ class IAction(INamed, ISessionTracked):
     costs: list[IAction]
     bind: Callable[[IAction, ICard, IPlayer], bool] | None
     notify: list[IAction]
+    dependency_plan: DependencyPlan | None
 
     def reset_state(self: IAction) -> None:
         """Reset any stored information that is stateful."""
         raise NotImplementedError
 
+    def can_satisfy(self: IAction, context: IExecutionContext) -> bool:
+        """Check if this action could execute now, without changing state."""
+        raise NotImplementedError
+
     def queue(self: IAction, context: IExecutionContext) -> None:
         """Respond to state `ActionStateDef.queued`."""
         raise NotImplementedError
@@ -153,7 +169,8 @@ class IEffect(INamed, ISessionTracked):
     actions: list[IAction]
     card_affected: ICard
     card_affecting: ICard
-    bind_removal: Callable[[IAction, ICard, IPlayer], bool]
+    expiries: list[Expiry]
+    deactivates_after: tuple[type[IAction], ...]
 
     @classmethod
     def create(cls: type[IEffect], card: ICard) -> IEffect:
@@ -172,6 +189,15 @@ class IEffect(INamed, ISessionTracked):
         """Make this effect inactive."""
         raise NotImplementedError
 
+    def bind_removal(
+        self: IEffect,
+        action: IAction,
+        card: ICard,
+        player: IPlayer,
+    ) -> bool:
+        """Specify which completed actions remove this effect."""
+        raise NotImplementedError
+
     def bind_deactivation(self: IEffect, context: IExecutionContext) -> bool:
         """Specify when this effect should deactivate."""
         raise NotImplementedError
@@ -199,16 +225,38 @@ class IExecutionContext:
 
     player: IPlayer
     process: ICard
-    ready: list[IAction]
+    ready: deque[IAction]
     choices: list[IAction]
-    notifications: list[IAction]
+    offered: dict[str, int]
+    notifications: TriggerQueue
     completed: IActionQueue | None
     players: list[IPlayer]
+    index: ObjectIndex
+    expiries: EffectExpiries
+    turns: TurnStructure
+    random: GameRandom
+    version: int
 
     def execute(self: IExecutionContext, action: IAction) -> None:
         """Execute an action."""
         raise NotImplementedError
 
+    def choice_position(self: IExecutionContext, action: IAction) -> int:
+        """Find where an action is among the choices, or -1 if not offered."""
+        raise NotImplementedError
+
+    def touch(self: IExecutionContext) -> None:
+        """Note that the board changed, invalidating cached evaluations."""
+        raise NotImplementedError
+
+    def watch(self: IExecutionContext, player: IPlayer) -> None:
+        """Move the board version on whenever a player's zones change."""
+        raise NotImplementedError
+
+    def feasible(self: IExecutionContext, action: IAction) -> bool:
+        """Check if an action could execute now, without executing it."""
+        raise NotImplementedError
+
     def post_execute(self: IExecutionContext, action: IAction) -> None:
         """Update changes to effects, notifications, etc."""
         raise NotImplementedError
@@ -218,9 +266,9 @@ class IExecutionContext:
         raise NotImplementedError
 
     def push(self: IExecutionContext, action: IAction) -> None:
-        """Push execution state to stack and start a new one."""
+        """Start a frame for an action and step it."""
         raise NotImplementedError
 
     def pop(self: IExecutionContext) -> None:
-        """Pop prior execution state and combine with current."""
+        """Finish the innermost frame once its pending actions have run."""
         raise NotImplementedError
@@ -0,0 +1,85 @@
+"""Find objects of a game by session object id."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+from weakref import WeakValueDictionary
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from custom_tcg.core.interface import ICard, IPlayer, ISessionTracked
+
+logger: logging.Logger = logging.getLogger(name=__name__)
+
+
+class ObjectIndex:
+    """Find objects of a game by session object id.
+
+    Objects are held by weak reference, so retired cards, actions, and effects
+    drop out of the index once nothing else in the game refers to them.
+    """
+
+    objects: WeakValueDictionary[str, ISessionTracked]
+
+    def __init__(self: ObjectIndex) -> None:
+        """Create an empty index."""
+        self.objects = WeakValueDictionary()
+
+    def __len__(self: ObjectIndex) -> int:
+        """Count live indexed objects."""
+        return len(self.objects)
+
+    def __contains__(self: ObjectIndex, session_object_id: object) -> bool:
+        """Check if an id refers to a live indexed object."""
+        return session_object_id in self.objects
+
+    def get(
+        self: ObjectIndex,
+        session_object_id: str,
+    ) -> ISessionTracked | None:
+        """Get an object by id, or None if it is unknown or retired."""
+        return self.objects.get(session_object_id)
+
+    def add(self: ObjectIndex, obj: ISessionTracked) -> None:
+        """Index an object."""
+        self.objects[obj.session_object_id] = obj
+
+    def add_all(self: ObjectIndex, objs: Iterable[ISessionTracked]) -> None:
+        """Index many objects."""
+        for obj in objs:
+            self.add(obj=obj)
+
+    def add_card(self: ObjectIndex, card: ICard) -> None:
+        """Index a card with every action and effect it has."""
+        self.add(obj=card)
+        self.add_all(objs=card.action_registry)
+        self.add_all(objs=card.effects)
+
+    def add_player(self: ObjectIndex, player: IPlayer) -> None:
+        """Index a player with every card in each of their zones."""
+        self.add(obj=player)
+
+        for zone in (
+            player.starting_cards,
+            player.main_cards,
+            player.processes,
+            player.hand,
+            player.played,
+            player.discard,
+        ):
+            for card in zone:
+                self.add_card(card=card)
+
+    def discard(self: ObjectIndex, session_object_id: str) -> None:
+        """Stop indexing an object, if indexed."""
+        self.objects.pop(session_object_id, None)
+
+    def __getstate__(self: ObjectIndex) -> dict[str, Any]:
+        """Hold indexed objects strongly while pickled."""
+        return {"objects": dict(self.objects)}
+
+    def __setstate__(self: ObjectIndex, state: dict[str, Any]) -> None:
+        """Restore indexed objects after unpickling."""
+        self.objects = WeakValueDictionary(state["objects"])
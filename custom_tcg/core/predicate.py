@@ -0,0 +1,550 @@
+"""Declarative conditions for selecting options and binding actions.
+
+Predicates are plain objects rather than lambdas, so they can be compared,
+hashed, saved with a game, and answered from a zone's indexes. They compose
+with `&`, `|` and `~`. Card predicates are called with a card, and bind
+predicates are called like a `bind`, with an action, its card and its player.
+
+Anywhere a predicate is accepted, a function still works.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Any, override
+
+from custom_tcg.core.zone import Zone
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+    from custom_tcg.core.card.select import Select
+    from custom_tcg.core.dimension import CardClass, CardType
+    from custom_tcg.core.interface import (
+        IAction,
+        ICard,
+        IEffect,
+        IExecutionContext,
+        IPlayer,
+    )
+
+logger: logging.Logger = logging.getLogger(name=__name__)
+
+
+@dataclass(frozen=True)
+class ZoneQuery:
+    """Conditions a zone can answer from its indexes, see `Zone.where`."""
+
+    cls: type | tuple[type, ...] | None = None
+    card_type: CardType | None = None
+    with_effect: type[IEffect] | tuple[type[IEffect], ...] | None = None
+    without_effect: type[IEffect] | tuple[type[IEffect], ...] | None = None
+
+    def merge(self: ZoneQuery, other: ZoneQuery) -> ZoneQuery | None:
+        """Combine two queries, or None if they both set a condition."""
+        changes: dict[str, Any] = {
+            name: value
+            for name, value in vars(other).items()
+            if value is not None
+        }
+
+        if any(getattr(self, name) is not None for name in changes):
+            return None
+
+        return replace(self, **changes)
+
+    def run(self: ZoneQuery, zone: Zone) -> list[ICard]:
+        """Find the cards of a zone matching this query."""
+        return zone.where(
+            cls=self.cls,
+            card_type=self.card_type,
+            with_effect=self.with_effect,
+            without_effect=self.without_effect,
+        )
+
+
+class Declarative:
+    """An object compared and hashed by its `key`, rather than identity."""
+
+    def key(self: Declarative) -> tuple[Hashable, ...]:
+        """Get the values that identify this object."""
+        raise NotImplementedError
+
+    def opaque(self: Declarative) -> bool:
+        """Check if this object wraps a function, so cannot be saved."""
+        return False
+
+    @override
+    def __eq__(self: Declarative, other: object) -> bool:
+        return (
+            isinstance(other, Declarative)
+            and type(self) is type(other)
+            and self.key() == other.key()
+        )
+
+    @override
+    def __hash__(self: Declarative) -> int:
+        return hash((type(self), self.key()))
+
+    @override
+    def __repr__(self: Declarative) -> str:
+        return f"{type(self).__name__}{self.key()!r}"
+
+
+class Predicate(Declarative):
+    """A condition, checked by calling it."""
+
+    def __call__(self: Predicate, *args: Any) -> bool:  # noqa: ANN401
+        """Check the condition."""
+        raise NotImplementedError
+
+    def compile(self: Predicate) -> tuple[ZoneQuery, Predicate | None]:
+        """Split into a zone query and what is left to check on each card."""
+        return ZoneQuery(), self
+
+    def __and__(self: Predicate, other: Predicate) -> And:
+        """Match when both conditions match."""
+        return And(self, other)
+
+    def __or__(self: Predicate, other: Predicate) -> Or:
+        """Match when either condition matches."""
+        return Or(self, other)
+
+    def __invert__(self: Predicate) -> Predicate:
+        """Match when the condition does not."""
+        return Not(self)
+
+
+class And(Predicate):
+    """Match when every condition matches, checking them in order."""
+
+    parts: tuple[Predicate, ...]
+
+    def __init__(self: And, *parts: Predicate) -> None:
+        """Combine conditions, flattening nested `And`s."""
+        self.parts = tuple(
+            inner
+            for part in parts
+            for inner in (part.parts if isinstance(part, And) else (part,))
+        )
+
+    @override
+    def key(self: And) -> tuple[Hashable, ...]:
+        return self.parts
+
+    @override
+    def opaque(self: And) -> bool:
+        return any(part.opaque() for part in self.parts)
+
+    @override
+    def __call__(self: And, *args: Any) -> bool:
+        return all(part(*args) for part in self.parts)
+
+    @override
+    def compile(self: And) -> tuple[ZoneQuery, Predicate | None]:
+        query = ZoneQuery()
+        residual: list[Predicate] = []
+
+        for part in self.parts:
+            part_query, part_residual = part.compile()
+            merged: ZoneQuery | None = query.merge(other=part_query)
+
+            if merged is None:
+                residual.append(part)
+                continue
+
+            query = merged
+
+            if part_residual is not None:
+                residual.append(part_residual)
+
+        if len(residual) == 0:
+            return query, None
+
+        return query, residual[0] if len(residual) == 1 else And(*residual)
+
+
+class Or(Predicate):
+    """Match when any condition matches, checking them in order."""
+
+    parts: tuple[Predicate, ...]
+
+    def __init__(self: Or, *parts: Predicate) -> None:
+        """Combine conditions, flattening nested `Or`s."""
+        self.parts = tuple(
+            inner
+            for part in parts
+            for inner in (part.parts if isinstance(part, Or) else (part,))
+        )
+
+    @override
+    def key(self: Or) -> tuple[Hashable, ...]:
+        return self.parts
+
+    @override
+    def opaque(self: Or) -> bool:
+        return any(part.opaque() for part in self.parts)
+
+    @override
+    def __call__(self: Or, *args: Any) -> bool:
+        return any(part(*args) for part in self.parts)
+
+    @override
+    def compile(self: Or) -> tuple[ZoneQuery, Predicate | None]:
+        # Zone indexes match any of several classes, or effect types.
+        classes: tuple[type, ...] = tuple(
+            part.cls for part in self.parts if type(part) is IsInstance
+        )
+
+        if len(classes) == len(self.parts):
+            return ZoneQuery(cls=classes), None
+
+        effect_types: tuple[type[IEffect], ...] = tuple(
+            part.effect_type for part in self.parts if type(part) is HasEffect
+        )
+
+        if len(effect_types) == len(self.parts):
+            return ZoneQuery(with_effect=effect_types), None
+
+        return ZoneQuery(), self
+
+
+class Not(Predicate):
+    """Match when a condition does not."""
+
+    part: Predicate
+
+    def __init__(self: Not, part: Predicate) -> None:
+        """Negate a condition."""
+        self.part = part
+
+    @override
+    def key(self: Not) -> tuple[Hashable, ...]:
+        return (self.part,)
+
+    @override
+    def opaque(self: Not) -> bool:
+        return self.part.opaque()
+
+    @override
+    def __call__(self: Not, *args: Any) -> bool:
+        return not self.part(*args)
+
+    @override
+    def compile(self: Not) -> tuple[ZoneQuery, Predicate | None]:
+        if type(self.part) is HasEffect:
+            return ZoneQuery(without_effect=self.part.effect_type), None
+
+        return ZoneQuery(), self
+
+    @override
+    def __invert__(self: Not) -> Predicate:
+        return self.part
+
+
+class Matches(Predicate):
+    """Match with a function, to compose conditions there is no object for.
+
+    Functions cannot be saved with a game, so are rebuilt by definitions.
+    """
+
+    function: Callable[..., bool]
+
+    def __init__(self: Matches, function: Callable[..., bool]) -> None:
+        """Wrap a function."""
+        self.function = function
+
+    @override
+    def key(self: Matches) -> tuple[Hashable, ...]:
+        return (self.function,)
+
+    @override
+    def opaque(self: Matches) -> bool:
+        return True
+
+    @override
+    def __call__(self: Matches, *args: Any) -> bool:
+        return self.function(*args)
+
+
+class IsInstance(Predicate):
+    """Match cards of a class, or its subclasses."""
+
+    cls: type
+
+    def __init__(self: IsInstance, cls: type) -> None:
+        """Match a card class."""
+        self.cls = cls
+
+    @override
+    def key(self: IsInstance) -> tuple[Hashable, ...]:
+        return (self.cls,)
+
+    @override
+    def __call__(self: IsInstance, card: ICard) -> bool:
+        return isinstance(card, self.cls)
+
+    @override
+    def compile(self: IsInstance) -> tuple[ZoneQuery, Predicate | None]:
+        return ZoneQuery(cls=self.cls), None
+
+
+class HasType(Predicate):
+    """Match cards of a card type."""
+
+    card_type: CardType
+
+    def __init__(self: HasType, card_type: CardType) -> None:
+        """Match a card type."""
+        self.card_type = card_type
+
+    @override
+    def key(self: HasType) -> tuple[Hashable, ...]:
+        return (self.card_type.name,)
+
+    @override
+    def __call__(self: HasType, card: ICard) -> bool:
+        return self.card_type in card.types
+
+    @override
+    def compile(self: HasType) -> tuple[ZoneQuery, Predicate | None]:
+        return ZoneQuery(card_type=self.card_type), None
+
+
+class HasClass(Predicate):
+    """Match cards of a card class."""
+
+    card_class: CardClass
+
+    def __init__(self: HasClass, card_class: CardClass) -> None:
+        """Match a card class."""
+        self.card_class = card_class
+
+    @override
+    def key(self: HasClass) -> tuple[Hashable, ...]:
+        return (self.card_class.name,)
+
+    @override
+    def __call__(self: HasClass, card: ICard) -> bool:
+        return self.card_class in card.classes
+
+
+class HasEffect(Predicate):
+    """Match cards with an effect of a type, or its subclasses."""
+
+    effect_type: type[IEffect]
+
+    def __init__(self: HasEffect, effect_type: type[IEffect]) -> None:
+        """Match an effect type."""
+        self.effect_type = effect_type
+
+    @override
+    def key(self: HasEffect) -> tuple[Hashable, ...]:
+        return (self.effect_type,)
+
+    @override
+    def __call__(self: HasEffect, card: ICard) -> bool:
+        return any(
+            isinstance(effect, self.effect_type) for effect in card.effects
+        )
+
+    @override
+    def compile(self: HasEffect) -> tuple[ZoneQuery, Predicate | None]:
+        return ZoneQuery(with_effect=self.effect_type), None
+
+
+class Is(Predicate):
+    """Match one card."""
+
+    card: ICard
+
+    def __init__(self: Is, card: ICard) -> None:
+        """Match a card."""
+        self.card = card
+
+    @override
+    def key(self: Is) -> tuple[Hashable, ...]:
+        return (id(self.card),)
+
+    @override
+    def __call__(self: Is, card: ICard) -> bool:
+        return card is self.card
+
+
+class ActionIs(Predicate):
+    """Bind to actions of a class, or its subclasses."""
+
+    cls: type[IAction]
+
+    def __init__(self: ActionIs, cls: type[IAction]) -> None:
+        """Bind to an action class."""
+        self.cls = cls
+
+    @override
+    def key(self: ActionIs) -> tuple[Hashable, ...]:
+        return (self.cls,)
+
+    @override
+    def __call__(
+        self: ActionIs,
+        action: IAction,
+        card: ICard,
+        player: IPlayer,
+    ) -> bool:
+        return isinstance(action, self.cls)
+
+
+class PlayerIs(Predicate):
+    """Bind to actions of one player."""
+
+    player: IPlayer
+
+    def __init__(self: PlayerIs, player: IPlayer) -> None:
+        """Bind to a player."""
+        self.player = player
+
+    @override
+    def key(self: PlayerIs) -> tuple[Hashable, ...]:
+        return (id(self.player),)
+
+    @override
+    def __call__(
+        self: PlayerIs,
+        action: IAction,
+        card: ICard,
+        player: IPlayer,
+    ) -> bool:
+        return player is self.player
+
+
+class OnCard(Predicate):
+    """Bind to actions whose card matches a card predicate."""
+
+    part: Predicate
+
+    def __init__(self: OnCard, part: Predicate) -> None:
+        """Bind by a condition on the action's card."""
+        self.part = part
+
+    @override
+    def key(self: OnCard) -> tuple[Hashable, ...]:
+        return (self.part,)
+
+    @override
+    def opaque(self: OnCard) -> bool:
+        return self.part.opaque()
+
+    @override
+    def __call__(
+        self: OnCard,
+        action: IAction,
+        card: ICard,
+        player: IPlayer,
+    ) -> bool:
+        return self.part(card)
+
+
+class CardHasClass(OnCard):
+    """Bind to actions whose card is of a card class."""
+
+    def __init__(self: CardHasClass, card_class: CardClass) -> None:
+        """Bind to a card class."""
+        super().__init__(part=HasClass(card_class=card_class))
+
+
+class CardHasEffect(OnCard):
+    """Bind to actions whose card has an effect of a type."""
+
+    def __init__(self: CardHasEffect, effect_type: type[IEffect]) -> None:
+        """Bind to an effect type."""
+        super().__init__(part=HasEffect(effect_type=effect_type))
+
+
+class InZone(Declarative):
+    """Options from a zone of the acting player, matching a card predicate.
+
+    The predicate is compiled once, so the zone's indexes narrow the cards
+    before anything is checked card by card. Refine with `&`.
+    """
+
+    zone: str
+    where: Predicate | None
+    player: IPlayer | None
+    query: ZoneQuery
+    residual: Predicate | None
+
+    def __init__(
+        self: InZone,
+        zone: str,
+        where: Predicate | None = None,
+        player: IPlayer | None = None,
+    ) -> None:
+        """Select from a player zone, by name, such as "played".
+
+        Without `player`, the zone of the player in context is used.
+        """
+        self.zone = zone
+        self.where = where
+        self.player = player
+        self.query, self.residual = (
+            (ZoneQuery(), None) if where is None else where.compile()
+        )
+
+    @override
+    def key(self: InZone) -> tuple[Hashable, ...]:
+        return (
+            self.zone,
+            self.where,
+            None if self.player is None else id(self.player),
+        )
+
+    @override
+    def opaque(self: InZone) -> bool:
+        return self.where is not None and self.where.opaque()
+
+    def __and__(self: InZone, other: Predicate) -> InZone:
+        """Narrow the options to cards also matching a predicate."""
+        return InZone(
+            zone=self.zone,
+            where=other if self.where is None else self.where & other,
+            player=self.player,
+        )
+
+    def __call__(self: InZone, context: IExecutionContext) -> list[ICard]:
+        """Find the matching cards, in zone order."""
+        cards: list[ICard] = getattr(self.player or context.player, self.zone)
+
+        if isinstance(cards, Zone):
+            found: list[ICard] = self.query.run(zone=cards)
+        elif self.where is not None:
+            return [card for card in cards if self.where(card)]
+        else:
+            found = list(cards)
+
+        if self.residual is None:
+            return found
+
+        return [card for card in found if self.residual(card)]
+
+
+class SelectedCount(Declarative):
+    """The number of options a selector selected, for `Find(bind_n=...)`."""
+
+    select: Select
+
+    def __init__(self: SelectedCount, select: Select) -> None:
+        """Count the selections of a selector."""
+        self.select = select
+
+    @override
+    def key(self: SelectedCount) -> tuple[Hashable, ...]:
+        return (id(self.select),)
+
+    def __call__(
+        self: SelectedCount,
+        context: IExecutionContext,  # noqa: ARG002
+        card_factory: type[ICard],  # noqa: ARG002
+    ) -> int:
+        """Count the selections."""
+        return len(self.select.selected)
@@ -6,12 +6,10 @@ from typing import TYPE_CHECKING, override
 
 from custom_tcg.core.action import Action
 from custom_tcg.core.dimension import ActionStateDef
-from custom_tcg.core.execution.activate import Activate
-from custom_tcg.core.execution.resolve import Resolve
-from custom_tcg.core.interface import IEffect
 
 if TYPE_CHECKING:
     from custom_tcg.core.interface import ICard, IExecutionContext, IPlayer
+    from custom_tcg.core.turn_structure import TurnEntry
 
 
 class EndProcess(Action):
@@ -33,44 +31,20 @@ class EndProcess(Action):
     def enter(self: EndProcess, context: IExecutionContext) -> None:
         super().enter(context=context)
 
-        current_process_index: int = context.player.processes.index(
-            self.card,
-        )
-        next_process_index: int
-
-        if current_process_index != len(context.player.processes) - 1:
-            # Activate the next process for this player.
-            next_process_index = current_process_index + 1
-
-        else:
-            # Move to next player and activate their first process.
-            context.player = context.players[
-                (context.players.index(context.player) + 1)
-                % len(context.players)
-            ]
+        # Find the next process in turn order. Moving to the first process of
+        # a player starts their turn, readying their processes.
+        next_turn: TurnEntry = context.turns.after(process=self.card)
+        context.player = next_turn.player
 
-            next_process_index = 0
+        if next_turn.first:
+            for activated in context.turns.activated_effects(
+                player=next_turn.player,
+            ):
+                activated.deactivate(context=context)
 
-            for process in context.player.processes:
-                activated: IEffect | None = next(
-                    (
-                        effect
-                        for effect in process.effects
-                        if effect.name == "Activated"
-                    ),
-                    None,
-                )
-                if activated is not None:
-                    process.effects.remove(activated)
-
-        for action in context.player.processes[next_process_index].actions:
+        for action in next_turn.process.actions:
             action.reset_state()
 
-        next_process_activation: Resolve = next(
-            Resolve(action=action, card=action.card, player=action.player)
-            for action in context.player.processes[next_process_index].actions
-            if isinstance(action, Activate) and action.bind is None
-        )
-
-        next_process_activation.state = ActionStateDef.queued
-        context.ready.append(next_process_activation)
+        next_turn.resolve.reset_state()
+        next_turn.resolve.state = ActionStateDef.queued
+        context.ready.append(next_turn.resolve)
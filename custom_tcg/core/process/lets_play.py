@@ -83,7 +83,7 @@ class LetsPlay(Card):
             self: LetsPlay.ProcessManager,
             context: IExecutionContext,
         ) -> None:
-            """Create play and activation actions, add to context."""
+            """Create feasible play and activation actions, add to context."""
             super().update_choices(context=context)
 
             context.choices = [
@@ -91,18 +91,20 @@ class LetsPlay(Card):
                     action
                     for card in context.player.hand
                     for action in card.actions
-                    if isinstance(action, Play) and action.bind is None
+                    if isinstance(action, Play)
+                    and action.bind is None
+                    and context.feasible(action=action)
                 ),
                 *(
                     action
-                    for card in context.player.played
+                    for card in context.player.played.where(
+                        card_type=CardTypeDef.being,
+                        without_effect=Activated,
+                    )
                     for action in card.actions
                     if isinstance(action, Activate)
                     and action.bind is None
-                    and not any(
-                        isinstance(effect, Activated) for effect in card.effects
-                    )
-                    and CardTypeDef.being in card.types
+                    and context.feasible(action=action)
                 ),
                 self.end_process,
             ]
@@ -106,10 +106,12 @@ class ProcessManager(Action):
         self.update_choices(context=context)
 
         if len(context.notifications) > 0:
-            for action in context.notifications:
+            # Resolve every pending trigger as one batch, in trigger order.
+            triggered: list[IAction] = context.notifications.drain()
+
+            for action in triggered:
                 action.state = ActionStateDef.queued
-            context.ready = [*context.notifications, *context.ready]
-            context.notifications = []
+            context.ready.extendleft(reversed(triggered))
             self.state = ActionStateDef.queued
 
         elif (
@@ -23,18 +23,26 @@ logger: logging.Logger = logging.getLogger(name=__name__)
 
 
 class ResetActions(Action):
-    """Reset a filtered set of actions."""
+    """Reset a filtered set of actions.
+
+    Only actions on played cards that have left `not_started` since they were
+    last reset are considered, as tracked by each player's dirty actions.
+    Passing `action_types` narrows this further to actions of those classes.
+    """
 
     filter_actions: Callable[[IAction], bool]
+    action_types: type[IAction] | tuple[type[IAction], ...] | None
 
     def __init__(  # noqa: PLR0913
         self: ResetActions,
         card: ICard,
         player: IPlayer,
-        filter_actions: Callable[[IAction], bool],
         state: ActionState | None = None,
         bind: Callable[[IAction, ICard, IPlayer], bool] | None = None,
         costs: list[IAction] | None = None,
+        *,
+        filter_actions: Callable[[IAction], bool],
+        action_types: type[IAction] | tuple[type[IAction], ...] | None = None,
     ) -> None:
         """Create a reset actions action."""
         super().__init__(
@@ -46,6 +54,7 @@ class ResetActions(Action):
             costs=costs,
         )
         self.filter_actions = filter_actions
+        self.action_types = action_types
 
     @override
     def enter(self: ResetActions, context: IExecutionContext) -> None:
@@ -54,9 +63,12 @@ class ResetActions(Action):
         filtered: list[IAction] = [
             action
             for player in context.players
-            for card in player.played
-            for action in card.actions
-            if self.filter_actions(action)
+            for action in player.dirty_actions.matching(
+                action_types=self.action_types,
+            )
+            if action.card in player.played
+            and action in action.card.actions
+            and self.filter_actions(action)
             # If we try to reset this action, it'll go infinite in execution.
             and action is not self
         ]
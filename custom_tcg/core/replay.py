@@ -0,0 +1,270 @@
+"""Record games compactly, so that they can be replayed."""
+
+from __future__ import annotations
+
+import logging
+import zlib
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from custom_tcg.core.game import Game
+    from custom_tcg.core.interface import ICard, IPlayer
+
+logger: logging.Logger = logging.getLogger(name=__name__)
+
+REPLAY_MAGIC: bytes = b"TCGR"
+REPLAY_VERSION: int = 1
+
+# Choices between state checkpoints.
+CHECKPOINT_INTERVAL: int = 16
+
+CHOICE_TAG: bytes = b"C"
+CHECKPOINT_TAG: bytes = b"K"
+
+
+@dataclass
+class PlayerRecord:
+    """A player as they joined a game, with their deck by card class."""
+
+    session_object_id: str
+    name: str
+    starting: list[str]
+    main: list[str]
+
+    @classmethod
+    def of(cls: type[PlayerRecord], player: IPlayer) -> PlayerRecord:
+        """Record a player and their selected deck."""
+        return cls(
+            session_object_id=player.session_object_id,
+            name=player.name,
+            starting=[card_name(card=card) for card in player.starting_cards],
+            main=[card_name(card=card) for card in player.main_cards],
+        )
+
+
+@dataclass
+class GameRecord:
+    """Everything needed to replay a game.
+
+    With the seed and decks, a game is rebuilt as it was set up. Choices are
+    recorded by their position among the choices offered, or -1 for a choice
+    that was not offered. Checkpoints map a number of choices made to a
+    digest of the game state at that point.
+    """
+
+    seed: int
+    players: list[PlayerRecord] = field(default_factory=list)
+    choices: list[int] = field(default_factory=list)
+    checkpoints: dict[int, int] = field(default_factory=dict)
+
+
+def card_name(card: ICard) -> str:
+    """Name a card's class, to create the card again on replay."""
+    return type(card).__name__
+
+
+def digest(game: Game) -> int:
+    """Summarize the visible state of a game as a checksum."""
+    context = game.context
+    state: list[str] = [
+        context.player.name,
+        context.process.name,
+        *(choice.name for choice in context.choices),
+    ]
+
+    for player in context.players:
+        state.extend(
+            (
+                player.name,
+                str(len(player.main_cards)),
+                *(card.name for card in player.hand),
+                "|",
+                *(card.name for card in player.played),
+                "|",
+                *(card.name for card in player.discard),
+            ),
+        )
+
+    return zlib.crc32("\x1f".join(state).encode())
+
+
+def write_varint(out: bytearray, value: int) -> None:
+    """Append an unsigned integer in as few bytes as it needs."""
+    while True:
+        byte: int = value & 0x7F
+        value >>= 7
+
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return
+
+
+def read_varint(data: bytes, offset: int) -> tuple[int, int]:
+    """Read an unsigned integer, returning it and the offset after it."""
+    value: int = 0
+    shift: int = 0
+
+    while True:
+        byte: int = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+
+        if not byte & 0x80:
+            return value, offset
+
+
+def write_str(out: bytearray, value: str) -> None:
+    """Append a length-prefixed string."""
+    encoded: bytes = value.encode()
+    write_varint(out=out, value=len(encoded))
+    out.extend(encoded)
+
+
+def read_str(data: bytes, offset: int) -> tuple[str, int]:
+    """Read a length-prefixed string, returning it and the offset after it."""
+    length, offset = read_varint(data=data, offset=offset)
+    return data[offset : offset + length].decode(), offset + length
+
+
+def encode_header(record: GameRecord) -> bytes:
+    """Encode the seed and players of a game."""
+    out = bytearray(REPLAY_MAGIC)
+    out.append(REPLAY_VERSION)
+    write_varint(out=out, value=record.seed)
+    write_varint(out=out, value=len(record.players))
+
+    for player in record.players:
+        write_str(out=out, value=player.session_object_id)
+        write_str(out=out, value=player.name)
+
+        for names in (player.starting, player.main):
+            write_varint(out=out, value=len(names))
+
+            for name in names:
+                write_str(out=out, value=name)
+
+    return bytes(out)
+
+
+def encode_choice(index: int) -> bytes:
+    """Encode a choice by its position, shifted so -1 encodes as 0."""
+    out = bytearray(CHOICE_TAG)
+    write_varint(out=out, value=index + 1)
+    return bytes(out)
+
+
+def encode_checkpoint(choices: int, checksum: int) -> bytes:
+    """Encode a state digest after a number of choices."""
+    out = bytearray(CHECKPOINT_TAG)
+    write_varint(out=out, value=choices)
+    write_varint(out=out, value=checksum)
+    return bytes(out)
+
+
+def encode(record: GameRecord) -> bytes:
+    """Encode a whole record, in the order it would have been written."""
+    out = bytearray(encode_header(record=record))
+
+    for count, index in enumerate(record.choices):
+        if count in record.checkpoints:
+            out.extend(
+                encode_checkpoint(
+                    choices=count,
+                    checksum=record.checkpoints[count],
+                ),
+            )
+
+        out.extend(encode_choice(index=index))
+
+    return bytes(out)
+
+
+def decode(data: bytes) -> GameRecord:
+    """Decode a record, ignoring a truncated record at the end."""
+    if data[: len(REPLAY_MAGIC)] != REPLAY_MAGIC:
+        msg: str = "Not a replay"
+        raise ValueError(msg)
+
+    offset: int = len(REPLAY_MAGIC)
+
+    if data[offset] != REPLAY_VERSION:
+        msg = f"Unsupported replay version {data[offset]}"
+        raise ValueError(msg)
+
+    seed, offset = read_varint(data=data, offset=offset + 1)
+    record = GameRecord(seed=seed)
+    player_count, offset = read_varint(data=data, offset=offset)
+
+    for _ in range(player_count):
+        session_object_id, offset = read_str(data=data, offset=offset)
+        name, offset = read_str(data=data, offset=offset)
+        zones: list[list[str]] = []
+
+        for _ in range(2):
+            count, offset = read_varint(data=data, offset=offset)
+            names: list[str] = []
+
+            for _ in range(count):
+                card, offset = read_str(data=data, offset=offset)
+                names.append(card)
+
+            zones.append(names)
+
+        record.players.append(
+            PlayerRecord(
+                session_object_id=session_object_id,
+                name=name,
+                starting=zones[0],
+                main=zones[1],
+            ),
+        )
+
+    try:
+        while offset < len(data):
+            tag: bytes = data[offset : offset + 1]
+
+            if tag == CHOICE_TAG:
+                index, offset = read_varint(data=data, offset=offset + 1)
+                record.choices.append(index - 1)
+            elif tag == CHECKPOINT_TAG:
+                count, offset = read_varint(data=data, offset=offset + 1)
+                checksum, offset = read_varint(data=data, offset=offset)
+                record.checkpoints[count] = checksum
+            else:
+                msg = f"Unknown replay record {tag!r} at {offset}"
+                raise ValueError(msg)
+    except IndexError:
+        logger.warning("Replay ends with a truncated record, ignoring it.")
+
+    return record
+
+
+class ReplayWriter:
+    """Write a game record to a file as the game is played.
+
+    The header is written once the game starts, then each choice and
+    checkpoint is appended as it is made, so a crashed game can still be
+    replayed up to its last choice.
+    """
+
+    path: Path
+
+    def __init__(self: ReplayWriter, path: Path) -> None:
+        """Create a writer for a file."""
+        self.path = path
+
+    def start(self: ReplayWriter, record: GameRecord) -> None:
+        """Write the header, replacing any earlier file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_bytes(encode_header(record=record))
+
+    def append(self: ReplayWriter, chunk: bytes) -> None:
+        """Append an encoded choice or checkpoint."""
+        with self.path.open(mode="ab") as file:
+            file.write(chunk)
@@ -0,0 +1,278 @@
+"""Save and load games, keeping behavior out of the saved state.
+
+Card definitions give actions behavior as lambdas and closures, which cannot
+be pickled. Saved games refer to cards, their players, and the actions their
+definitions create by position instead. Loading creates the cards again from
+their definitions, so their behavior is rebuilt, then puts the saved state of
+every player, card, and action back into the new objects. Closures made by a
+definition refer to those same objects, so they see the loaded state.
+
+Everything else, such as actions and effects created during play, is saved
+as it is.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import pickle
+import zlib
+from dataclasses import dataclass
+from types import FunctionType
+from typing import TYPE_CHECKING, Any
+
+from custom_tcg.core.card.card import Card
+from custom_tcg.core.predicate import Declarative
+from custom_tcg.core.replay import card_name
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from custom_tcg.core.game import Game
+    from custom_tcg.core.interface import IPlayer
+
+logger: logging.Logger = logging.getLogger(name=__name__)
+
+STATE_MAGIC: bytes = b"TCGS"
+STATE_VERSION: int = 1
+
+type AnchorKey = tuple[str, int] | tuple[str, int, int]
+
+
+@dataclass
+class CardEntry:
+    """A card to create again from its definition, by card class name."""
+
+    name: str
+    player: int
+    actions: int
+
+
+@dataclass
+class Manifest:
+    """The players and cards to create before loading a game's state."""
+
+    player_types: list[type]
+    cards: list[CardEntry]
+
+
+def behavior(value: object) -> bool:
+    """Check if an attribute holds behavior, which definitions rebuild."""
+    if isinstance(value, FunctionType):
+        return True
+
+    # Predicates are saved as state, unless they wrap a function.
+    if isinstance(value, Declarative):
+        return value.opaque()
+
+    return isinstance(value, (list, tuple)) and any(
+        behavior(value=item) for item in value
+    )
+
+
+def runtime_state(obj: object) -> dict[str, Any]:
+    """Get the attributes of an object that are not behavior."""
+    return {
+        name: value
+        for name, value in vars(obj).items()
+        if not behavior(value=value)
+    }
+
+
+class _Discovery(pickle.Pickler):
+    """Walk everything a game refers to, collecting cards with definitions.
+
+    Functions are skipped, and cards are collected rather than walked, so
+    each card is walked once, after it is found.
+    """
+
+    types: Mapping[str, type[Card]]
+    found: set[Card]
+    cards: list[Card]
+
+    def __init__(self: _Discovery, types: Mapping[str, type[Card]]) -> None:
+        super().__init__(io.BytesIO(), protocol=pickle.HIGHEST_PROTOCOL)
+        self.types = types
+        self.found = set()
+        self.cards = []
+
+    def persistent_id(self: _Discovery, obj: object) -> object | None:
+        if isinstance(obj, Card) and card_name(card=obj) in self.types:
+            if obj not in self.found:
+                self.found.add(obj)
+                self.cards.append(obj)
+
+            return id(obj)
+
+        return None
+
+    def reducer_override(self: _Discovery, obj: object) -> Any:  # noqa: ANN401
+        if isinstance(obj, FunctionType):
+            return (str, ())
+
+        return NotImplemented
+
+    def discover(self: _Discovery, root: object) -> list[Card]:
+        """Find every card with a definition, in the order first referred to."""
+        self.dump(root)
+        walked: int = 0
+
+        while walked < len(self.cards):
+            self.dump(vars(self.cards[walked]))
+            walked += 1
+
+        return self.cards
+
+
+class _StatePickler(pickle.Pickler):
+    """Pickle state, referring to anchored objects by key."""
+
+    anchors: dict[int, AnchorKey]
+
+    def __init__(
+        self: _StatePickler,
+        file: io.BytesIO,
+        anchors: dict[int, AnchorKey],
+    ) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.anchors = anchors
+
+    def persistent_id(self: _StatePickler, obj: object) -> AnchorKey | None:
+        return self.anchors.get(id(obj))
+
+
+class _StateUnpickler(pickle.Unpickler):
+    """Unpickle state, resolving anchor keys to newly created objects."""
+
+    anchors: dict[AnchorKey, object]
+
+    def __init__(
+        self: _StateUnpickler,
+        file: io.BytesIO,
+        anchors: dict[AnchorKey, object],
+    ) -> None:
+        super().__init__(file)
+        self.anchors = anchors
+
+    def persistent_load(self: _StateUnpickler, pid: Any) -> object:  # noqa: ANN401
+        return self.anchors[tuple(pid)]
+
+
+def dumps(game: Game, types: Mapping[str, type[Card]]) -> bytes:
+    """Save a game as compressed bytes, without its cards' behavior.
+
+    `types` maps class names to the card classes defining them. Cards without
+    a definition in `types` are saved as they are.
+    """
+    cards: list[Card] = _Discovery(types=types).discover(root=game)
+    players: list[IPlayer] = list(game.players)
+    anchors: dict[int, AnchorKey] = {
+        id(player): ("player", position)
+        for position, player in enumerate(players)
+    }
+    manifest = Manifest(
+        player_types=[type(player) for player in players],
+        cards=[],
+    )
+    action_counts: dict[str, int] = {}
+
+    for position, card in enumerate(cards):
+        if card.player not in players:
+            msg: str = f"Card '{card.name}' belongs to no player of the game"
+            raise ValueError(msg)
+
+        name: str = card_name(card=card)
+
+        # Definitions create the same actions each time, so count them once.
+        if name not in action_counts:
+            action_counts[name] = len(
+                types[name].create(player=card.player).action_registry,
+            )
+
+        manifest.cards.append(
+            CardEntry(
+                name=name,
+                player=players.index(card.player),
+                actions=action_counts[name],
+            ),
+        )
+        anchors[id(card)] = ("card", position)
+        anchors.update(
+            (id(action), ("action", position, index))
+            for index, action in enumerate(
+                card.action_registry[: action_counts[name]],
+            )
+        )
+
+    file = io.BytesIO()
+    pickle.dump(manifest, file, protocol=pickle.HIGHEST_PROTOCOL)
+    _StatePickler(file=file, anchors=anchors).dump(
+        (
+            game,
+            [runtime_state(obj=player) for player in players],
+            [runtime_state(obj=card) for card in cards],
+            [
+                runtime_state(obj=action)
+                for position, card in enumerate(cards)
+                for action in card.action_registry[
+                    : manifest.cards[position].actions
+                ]
+            ],
+        ),
+    )
+
+    return (
+        STATE_MAGIC + bytes((STATE_VERSION,)) + zlib.compress(file.getvalue())
+    )
+
+
+def loads(data: bytes, types: Mapping[str, type[Card]]) -> Game:
+    """Load a game saved with `dumps`, creating its cards from `types`."""
+    if data[: len(STATE_MAGIC)] != STATE_MAGIC:
+        msg: str = "Not a saved game"
+        raise ValueError(msg)
+
+    if data[len(STATE_MAGIC)] != STATE_VERSION:
+        msg = f"Unsupported saved game version {data[len(STATE_MAGIC)]}"
+        raise ValueError(msg)
+
+    file = io.BytesIO(zlib.decompress(data[len(STATE_MAGIC) + 1 :]))
+    manifest: Manifest = pickle.load(file)  # noqa: S301
+    players: list[IPlayer] = [cls.__new__(cls) for cls in manifest.player_types]
+    anchors: dict[AnchorKey, object] = {
+        ("player", position): player for position, player in enumerate(players)
+    }
+    cards: list[Card] = []
+    actions: list[object] = []
+
+    for position, entry in enumerate(manifest.cards):
+        card: Card = types[entry.name].create(player=players[entry.player])
+
+        if len(card.action_registry) != entry.actions:
+            msg = f"Definition of '{entry.name}' changed since it was saved"
+            raise ValueError(msg)
+
+        anchors[("card", position)] = card
+        cards.append(card)
+
+        for index, action in enumerate(card.action_registry):
+            anchors[("action", position, index)] = action
+            actions.append(action)
+
+    game: Game
+    player_states: list[dict[str, Any]]
+    card_states: list[dict[str, Any]]
+    action_states: list[dict[str, Any]]
+    game, player_states, card_states, action_states = _StateUnpickler(
+        file=file,
+        anchors=anchors,
+    ).load()
+
+    for obj, state in zip(
+        (*players, *cards, *actions),
+        (*player_states, *card_states, *action_states),
+        strict=True,
+    ):
+        vars(obj).update(state)
+
+    return game
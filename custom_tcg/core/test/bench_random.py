@@ -0,0 +1,36 @@
+"""Benchmark shuffles of `custom_tcg.core.util.random` module."""
+
+from __future__ import annotations
+
+import logging
+import timeit
+
+from custom_tcg.core.util.random import GameRandom, shuffle_many
+
+logger: logging.Logger = logging.getLogger(name=__name__)
+
+
+def benchmark(
+    deck_size: int = 60,
+    decks: int = 1000,
+    repeat: int = 5,
+) -> float:
+    """Measure shuffled cards per second, shuffling decks in batches."""
+    rng = GameRandom(seed=0)
+    batch: list[list[int]] = [list(range(deck_size)) for _ in range(decks)]
+    best: float = min(
+        timeit.repeat(
+            lambda: shuffle_many(decks=batch, rng=rng),
+            number=1,
+            repeat=repeat,
+        ),
+    )
+    return deck_size * decks / best
+
+
+if __name__ == "__main__":
+    from custom_tcg.main import setup
+
+    setup()
+
+    logger.info("Shuffled %.0f cards per second", benchmark())
@@ -0,0 +1,113 @@
+"""Tests for `custom_tcg.core.autopilot` module."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+import pytest
+
+from custom_tcg.common.player import p1, p2
+from custom_tcg.core.autopilot import ForcedChoiceAutoPilot
+from custom_tcg.core.card.select_by_choice import SelectByChoice
+from custom_tcg.core.game import Game
+
+
+def _selector(n_options: int, *, require_n: bool) -> SelectByChoice:
+    options = [Mock(name=f"Option {i}") for i in range(n_options)]
+    selector = SelectByChoice(
+        name="Select",
+        card=Mock(),
+        player=Mock(),
+        options=options,
+        require_n=require_n,
+        accept_n=1,
+    )
+    selector.enter(context=Mock(version=0))
+    return selector
+
+
+def test_only_choice_is_forced() -> None:
+    """Choose the only choice offered."""
+    context = Mock()
+    only = Mock()
+    context.choices = [only]
+
+    assert ForcedChoiceAutoPilot().choose(context=context) is only
+
+
+def test_single_required_option_is_forced() -> None:
+    """Choose a lone option when it must be selected before confirming."""
+    context = Mock()
+    selector = _selector(n_options=1, require_n=True)
+    context.choices = list(selector.choice_actions)
+
+    assert (
+        ForcedChoiceAutoPilot().choose(context=context)
+        is (selector.choice_actions[0])
+    )
+
+
+@pytest.mark.parametrize(
+    ("n_options", "require_n"),
+    [(2, True), (1, False)],
+)
+def test_real_choices_are_left_to_the_player(
+    n_options: int,
+    require_n: bool,  # noqa: FBT001
+) -> None:
+    """Leave choices among several options, or with cancel, to the player."""
+    context = Mock()
+    selector = _selector(n_options=n_options, require_n=require_n)
+    context.choices = list(selector.choice_actions)
+
+    assert ForcedChoiceAutoPilot().choose(context=context) is None
+
+
+def test_game_yields_after_max_auto_choices(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Stop auto-choosing after the cap, leaving the choice to the player."""
+    monkeypatch.setattr(Game, "MAX_AUTO_CHOICES", 3)
+    autopilot = Mock()
+    autopilot.choose.side_effect = lambda context: next(
+        choice for choice in context.choices if choice.name == "End Process"
+    )
+
+    game = Game(players=[p1(), p2()])
+    for player in game.players:
+        game.set_autopilot(player=player, autopilot=autopilot)
+    game.setup()
+    game.start()
+
+    assert game.idle
+    assert autopilot.choose.call_count == 3  # noqa: PLR2004
+    assert len(game.context.choices) > 0
+
+
+def test_max_auto_choices_holds_across_runs(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Keep counting auto-choices across runs until a player chooses."""
+    monkeypatch.setattr(Game, "MAX_AUTO_CHOICES", 3)
+    autopilot = Mock()
+    autopilot.choose.side_effect = lambda context: next(
+        choice for choice in context.choices if choice.name == "End Process"
+    )
+
+    game = Game(players=[p1(), p2()])
+    for player in game.players:
+        game.set_autopilot(player=player, autopilot=autopilot)
+    game.setup()
+    game.start(max_steps=0)
+
+    while not game.run(max_steps=1):
+        pass
+
+    assert game.auto_choices == 3  # noqa: PLR2004
+    assert game.run()
+    assert len(game.record.choices) == 3  # noqa: PLR2004
+
+    game.choose(action=game.context.choices[0])
+
+    assert game.auto_choices == 3  # noqa: PLR2004
+    assert len(game.record.choices) == 7  # noqa: PLR2004
@@ -0,0 +1,62 @@
+"""Tests for `custom_tcg.core.execution.dependency_plan` module."""
+
+from __future__ import annotations
+
+from custom_tcg.common.action.find import Find
+from custom_tcg.common.being.desperate_shepherd import DesperateShepherd
+from custom_tcg.common.player import p1
+from custom_tcg.core.card.select import Select
+from custom_tcg.core.card.tap import Tap
+from custom_tcg.core.dimension import ActionStateDef
+from custom_tcg.core.execution.dependency_plan import DependencyPlan
+
+
+def shear(shepherd: DesperateShepherd) -> Find:
+    """Get the action shearing wool from sheep, which depends on a tap."""
+    return next(
+        action
+        for action in shepherd.action_registry
+        if isinstance(action, Find) and len(action.costs) > 0
+    )
+
+
+def test_plans_flatten_dependents_in_order() -> None:
+    """Flatten an action's costs and selectors depth first."""
+    action: Find = shear(shepherd=DesperateShepherd.create(player=p1()))
+    plan: DependencyPlan = DependencyPlan.of(action=action)
+
+    assert [type(dependent) for dependent in plan.actions] == [
+        Find,
+        Tap,
+        Select,
+    ]
+    assert plan.ends == (3, 3, 3)
+    assert DependencyPlan.of(action=action) is plan
+
+
+def test_plans_are_bound_from_the_shape_of_a_card() -> None:
+    """Bind every copy of a card's actions to plans of one shape."""
+    player = p1()
+    first: Find = shear(shepherd=DesperateShepherd.create(player=player))
+    second: Find = shear(shepherd=DesperateShepherd.create(player=player))
+
+    assert DesperateShepherd.dependency_shape is not None
+    assert isinstance(first.dependency_plan, DependencyPlan)
+    assert isinstance(second.dependency_plan, DependencyPlan)
+    assert first.dependency_plan.ends is second.dependency_plan.ends
+    assert first.dependency_plan.actions[1] is first.costs[0]
+    assert second.dependency_plan.actions[1] is second.costs[0]
+
+
+def test_pending_skips_completed_dependents() -> None:
+    """Find the first dependent left to run, skipping completed subtrees."""
+    plan: DependencyPlan = DependencyPlan.of(
+        action=shear(shepherd=DesperateShepherd.create(player=p1())),
+    )
+
+    assert plan.pending(index=0) == 1
+    assert plan.pending(index=1) == 2  # noqa: PLR2004
+
+    plan.actions[1].state = ActionStateDef.completed
+
+    assert plan.pending(index=0) is None
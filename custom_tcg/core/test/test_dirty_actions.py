@@ -0,0 +1,27 @@
+"""Tests for `custom_tcg.core.dirty_actions` module."""
+
+from __future__ import annotations
+
+from custom_tcg.common.being.peasant import Peasant
+from custom_tcg.common.player import p1
+from custom_tcg.core.dimension import ActionStateDef
+from custom_tcg.core.execution.play import Play
+
+
+def test_actions_mark_and_clean_themselves() -> None:
+    """Track actions leaving `not_started`, by class, until they are reset."""
+    player = p1()
+    peasant = Peasant.create(player=player)
+    play = next(a for a in peasant.actions if isinstance(a, Play))
+
+    assert play not in player.dirty_actions
+
+    play.state = ActionStateDef.queued
+
+    assert play in player.dirty_actions
+    assert player.dirty_actions.matching(action_types=Play) == [play]
+
+    play.reset_state()
+
+    assert play not in player.dirty_actions
+    assert len(player.dirty_actions) == 0
@@ -1,6 +1,6 @@
 """End-to-end test for three full game turns using the Game API.
 
-Only randomness is mocked to keep turn order and deck order deterministic.
+Only randomness is fixed to keep turn order and deck order deterministic.
 The test drives Game.setup/start/choose and validates process rotation and
 player turn order over three full turns (Play then Rest for a player).
 """
@@ -11,13 +11,12 @@ import pytest
 
 from custom_tcg.common.being.aimless_wanderer import AimlessWanderer
 from custom_tcg.common.being.that_pebble_girl import ThatPebbleGirl
-from custom_tcg.core import game as game_mod
 from custom_tcg.core.anon import Deck, Player
 from custom_tcg.core.game import Game
 from custom_tcg.core.process.lets_play import LetsPlay
 from custom_tcg.core.process.lets_rest import LetsRest
-from custom_tcg.core.util import random as util_mod
 from custom_tcg.core.util.e2e_test import (
+    FixedRandom,
     choose_by_name_contains,
     end_current_process,
     step_until_available,
@@ -25,21 +24,8 @@ from custom_tcg.core.util.e2e_test import (
 
 
 @pytest.fixture
-def game(monkeypatch: pytest.MonkeyPatch) -> Game:
+def game() -> Game:
     """Create a deterministic game instance for testing turns."""
-
-    def identity_randomize(*, ordered: list) -> list:  # match signature
-        return list(ordered)
-
-    monkeypatch.setattr(util_mod, "list_randomize", identity_randomize)
-
-    # Ensure first player selection is deterministic (p1 goes first)
-    def fake_randbelow(*, exclusive_upper_bound: int) -> int:  # noqa: ARG001
-        return 0
-
-    monkeypatch.setattr(game_mod, "randbelow", fake_randbelow)
-    monkeypatch.setattr(util_mod, "randbelow", fake_randbelow)
-
     # Manually create two players and their starting decks
     p1 = Player(
         session_object_id="p1",
@@ -95,7 +81,8 @@ def game(monkeypatch: pytest.MonkeyPatch) -> Game:
     p2.decks.append(p2_deck)
     p2.select_deck(deck=p2_deck)
 
-    g = Game(players=[p1, p2])
+    # Keep deck order, and let p1 go first.
+    g = Game(players=[p1, p2], rng=FixedRandom())
     g.setup()
     return g
 
@@ -1,6 +1,6 @@
 """End-to-end test for three full game turns using the Game API.
 
-Only randomness is mocked to keep turn order and deck order deterministic.
+Only randomness is fixed to keep turn order and deck order deterministic.
 The test drives Game.setup/start/choose and validates process rotation and
 player turn order over three full turns (Play then Rest for a player).
 """
@@ -10,29 +10,15 @@ from __future__ import annotations
 import pytest
 
 from custom_tcg.common.player import p1, p2
-from custom_tcg.core import game as game_mod
 from custom_tcg.core.game import Game
-from custom_tcg.core.util import random as util_mod
-from custom_tcg.core.util.e2e_test import end_current_process
+from custom_tcg.core.util.e2e_test import FixedRandom, end_current_process
 
 
 @pytest.fixture
-def game(monkeypatch: pytest.MonkeyPatch) -> Game:
+def game() -> Game:
     """Create a deterministic game instance for testing turns."""
-
-    def identity_randomize(*, ordered: list) -> list:  # match signature
-        return list(ordered)
-
-    monkeypatch.setattr(util_mod, "list_randomize", identity_randomize)
-
-    # Ensure first player selection is deterministic (p1 goes first)
-    def fake_randbelow(*, exclusive_upper_bound: int) -> int:  # noqa: ARG001
-        return 0
-
-    monkeypatch.setattr(game_mod, "randbelow", fake_randbelow)
-    monkeypatch.setattr(util_mod, "randbelow", fake_randbelow)
-
-    g = Game(players=[p1(), p2()])
+    # Keep deck order, and let p1 go first.
+    g = Game(players=[p1(), p2()], rng=FixedRandom())
     g.setup()
     return g
 
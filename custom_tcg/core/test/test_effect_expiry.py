@@ -0,0 +1,183 @@
+"""Tests for `custom_tcg.core.effect.expiry` module."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+from custom_tcg.core.anon import Action as AnonAction
+from custom_tcg.core.anon import Player as AnonPlayer
+from custom_tcg.core.card.card import Card
+from custom_tcg.core.card.discard import Discard
+from custom_tcg.core.dimension import EffectStateDef
+from custom_tcg.core.effect.effect import Effect
+from custom_tcg.core.effect.expiry import Expiry
+from custom_tcg.core.execution.execution import ExecutionContext
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _player() -> AnonPlayer:
+    """Create an empty player."""
+    return AnonPlayer(
+        session_object_id="p1",
+        name="P1",
+        decks=[],
+        starting_cards=[],
+        main_cards=[],
+        processes=[],
+        hand=[],
+        played=[],
+        discard=[],
+    )
+
+
+def test_effect_expires_after_matching_action_only() -> None:
+    """Remove an effect once an action of its class completes from its card."""
+    player = _player()
+    affected = Card(name="Affected", player=player, types=[], classes=[])
+    trigger = Card(name="Trigger", player=player, types=[], classes=[])
+    bystander = Card(name="Bystander", player=player, types=[], classes=[])
+
+    ctx = ExecutionContext(players=[player])
+    effect = Effect(
+        card=affected,
+        expiries=[Expiry(action_type=AnonAction, card=trigger)],
+    )
+    effect.activate(context=ctx)
+
+    def action(card: Card) -> AnonAction:
+        return AnonAction(
+            name=f"From {card.name}",
+            card=card,
+            player=player,
+            enter=lambda ctx: None,  # noqa: ARG005
+        )
+
+    ctx.execute(action=action(card=bystander))
+
+    assert effect in affected.effects
+    assert ctx.expiries.candidates(action=action(card=bystander)) == []
+
+    ctx.execute(action=action(card=trigger))
+
+    assert effect not in affected.effects
+    assert effect.state == EffectStateDef.inactive
+    assert ctx.expiries.by_trigger == {}
+
+
+def test_effect_deactivates_without_expiries() -> None:
+    """End an effect once its deactivation bind holds, with no expiries."""
+    player = _player()
+    affected = Card(name="Affected", player=player, types=[], classes=[])
+
+    class Fragile(Effect):
+        broken: bool = False
+
+        def bind_deactivation(self: Fragile, context: object) -> bool:  # noqa: ARG002
+            return self.broken
+
+    ctx = ExecutionContext(players=[player])
+    effect = Fragile(card=affected)
+    effect.activate(context=ctx)
+
+    def action() -> AnonAction:
+        return AnonAction(
+            name="Anything",
+            card=affected,
+            player=player,
+            enter=lambda ctx: None,  # noqa: ARG005
+        )
+
+    ctx.execute(action=action())
+
+    assert effect in affected.effects
+
+    effect.broken = True
+    ctx.execute(action=action())
+
+    assert effect not in affected.effects
+    assert ctx.expiries.deactivating == {}
+
+
+def test_deactivation_is_checked_after_listed_actions_only() -> None:
+    """Check when an effect deactivates only after the actions it lists."""
+    player = _player()
+    affected = Card(name="Affected", player=player, types=[], classes=[])
+
+    class Fragile(Effect):
+        deactivates_after = (Discard,)
+
+        def bind_deactivation(self: Fragile, context: object) -> bool:  # noqa: ARG002
+            return True
+
+    ctx = ExecutionContext(players=[player])
+    effect = Fragile(card=affected)
+    effect.activate(context=ctx)
+    action = AnonAction(
+        name="Anything",
+        card=affected,
+        player=player,
+        enter=lambda ctx: None,  # noqa: ARG005
+    )
+
+    assert ctx.expiries.candidates(action=action) == []
+    assert ctx.expiries.candidates(
+        action=Discard(cards_to_discard=Mock(), card=affected, player=player),
+    ) == [effect]
+
+
+def test_effects_are_forgotten_when_their_card_leaves_play() -> None:
+    """Stop indexing effects on a card out of play, but not on one moved."""
+    player = _player()
+    affected = Card(name="Affected", player=player, types=[], classes=[])
+    other = Card(name="Other", player=player, types=[], classes=[])
+    player.played.extend([affected, other])
+
+    ctx = ExecutionContext(players=[player])
+    effect = Effect(
+        card=affected,
+        expiries=[Expiry(action_type=Discard)],
+    )
+    effect.activate(context=ctx)
+
+    def action(enter: Callable[[object], None]) -> AnonAction:
+        return AnonAction(
+            name="Move",
+            card=other,
+            player=player,
+            enter=enter,
+        )
+
+    ctx.execute(
+        action=action(
+            enter=lambda ctx: player.played.reindex(cards=[other, affected]),  # noqa: ARG005
+        ),
+    )
+
+    assert ctx.expiries.by_trigger == {(Discard, None): {effect: None}}
+
+    ctx.execute(
+        action=action(enter=lambda ctx: player.played.remove(affected)),  # noqa: ARG005
+    )
+
+    assert effect in affected.effects
+    assert ctx.expiries.by_trigger == {}
+
+
+def test_discarded_expiry_matches_discarded_card() -> None:
+    """Match a discard only when it discards the given card."""
+    player = _player()
+    card = Card(name="Card", player=player, types=[], classes=[])
+    other = Card(name="Other", player=player, types=[], classes=[])
+    expiry = Expiry.discarded(card=card)
+
+    selector = Mock(name="Select")
+    discard = Discard(cards_to_discard=selector, card=other, player=player)
+
+    selector.selected = [other]
+    assert not expiry.matches(action=discard)
+
+    selector.selected = [other, card]
+    assert expiry.matches(action=discard)
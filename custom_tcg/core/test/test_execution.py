@@ -2,13 +2,23 @@
 
 from __future__ import annotations
 
-from typing import Any
+import sys
+from typing import TYPE_CHECKING, Any
 
 from custom_tcg.core.anon import Action as AnonAction
 from custom_tcg.core.anon import Player as AnonPlayer
 from custom_tcg.core.card.card import Card
-from custom_tcg.core.dimension import CardClassDef, CardTypeDef
-from custom_tcg.core.execution.execution import ExecutionContext
+from custom_tcg.core.card.select import Select
+from custom_tcg.core.dimension import (
+    ActionStateDef,
+    CardClassDef,
+    CardTypeDef,
+)
+from custom_tcg.core.execution.activate import Activate
+from custom_tcg.core.execution.execution import ActionContext, ExecutionContext
+
+if TYPE_CHECKING:
+    from custom_tcg.core.interface import IExecutionContext
 
 
 def test_execute_simple_action_completes_and_notifies() -> None:
@@ -71,9 +81,289 @@ def test_execute_simple_action_completes_and_notifies() -> None:
 
     # Ensure the action's enter was invoked and the ready queue is empty
     assert executed["count"] == 1
-    assert ctx.ready == []
+    assert len(ctx.ready) == 0
 
     # A Resolve of notify_action should be queued to notifications
     assert any(
         getattr(n, "action", None) is notify_action for n in ctx.notifications
     )
+
+
+def test_feasible_speculates_without_changing_state() -> None:
+    """Report infeasible actions, keep their state, and cache until touched."""
+    player = AnonPlayer(
+        session_object_id="p1",
+        name="P1",
+        decks=[],
+        starting_cards=[],
+        main_cards=[],
+        processes=[],
+        hand=[],
+        played=[],
+        discard=[],
+    )
+    card = Card(name="Card", player=player, types=[], classes=[])
+    options: list[Card] = []
+
+    action = AnonAction(
+        name="NeedsAnOption",
+        card=card,
+        player=player,
+        enter=lambda ctx: None,  # noqa: ARG005
+        costs=[
+            Select(
+                name="Requires one",
+                card=card,
+                player=player,
+                options=lambda ctx: list(options),  # noqa: ARG005
+                n=1,
+                require_n=True,
+            ),
+        ],
+    )
+    activate = Activate(card=card, player=player, actions=[action])
+
+    ctx = ExecutionContext(players=[player])
+
+    assert not ctx.feasible(action=action)
+    assert not ctx.feasible(action=activate)
+    assert action.state == ActionStateDef.not_started
+    assert activate.state == ActionStateDef.not_started
+
+    options.append(card)
+    assert not ctx.feasible(action=action)
+
+    ctx.touch()
+    assert ctx.feasible(action=action)
+    assert ctx.feasible(action=activate)
+
+
+def test_nested_execution_runs_iteratively_in_order() -> None:
+    """Run nested actions after their parent, in order, without recursion."""
+    player = AnonPlayer(
+        session_object_id="p1",
+        name="P1",
+        decks=[],
+        starting_cards=[],
+        main_cards=[],
+        processes=[],
+        hand=[],
+        played=[],
+        discard=[],
+    )
+    card = Card(name="Card", player=player, types=[], classes=[])
+    entered: list[str] = []
+    depth: int = sys.getrecursionlimit() * 2
+
+    def chain(n: int) -> AnonAction:
+        def on_enter(ctx: IExecutionContext) -> None:
+            entered.append(f"chain {n}")
+            if n < depth:
+                ctx.execute(action=chain(n + 1))
+
+        return AnonAction(
+            name="Chain",
+            card=card,
+            player=player,
+            enter=on_enter,
+        )
+
+    def leaf(name: str) -> AnonAction:
+        return AnonAction(
+            name=name,
+            card=card,
+            player=player,
+            enter=lambda ctx: entered.append(name),  # noqa: ARG005
+        )
+
+    def on_parent_enter(ctx: IExecutionContext) -> None:
+        entered.append("parent")
+        ctx.execute(action=leaf(name="first"))
+        ctx.execute(action=leaf(name="second"))
+        entered.append("parent done")
+
+    ctx = ExecutionContext(players=[player])
+    ctx.execute(
+        action=AnonAction(
+            name="Parent",
+            card=card,
+            player=player,
+            enter=on_parent_enter,
+        ),
+    )
+
+    assert entered == ["parent", "parent done", "first", "second"]
+    assert ctx.frames == []
+
+    entered.clear()
+    ctx.execute(action=chain(n=1))
+
+    assert len(entered) == depth
+    assert len(ctx.ready) == 0
+
+
+def test_nested_actions_complete_after_their_parent() -> None:
+    """Report a parent's completion before the actions it executed."""
+    player = AnonPlayer(
+        session_object_id="p1",
+        name="P1",
+        decks=[],
+        starting_cards=[],
+        main_cards=[],
+        processes=[],
+        hand=[],
+        played=[],
+        discard=[],
+    )
+    card = Card(name="Card", player=player, types=[], classes=[])
+    completed: list[ActionContext] = []
+
+    def action(name: str, *children: AnonAction) -> AnonAction:
+        def on_enter(ctx: IExecutionContext) -> None:
+            for child in children:
+                ctx.execute(action=child)
+
+        return AnonAction(name=name, card=card, player=player, enter=on_enter)
+
+    ctx = ExecutionContext(players=[player], completed=completed)
+    ctx.execute(
+        action=action(
+            "parent",
+            action("first", action("grandchild")),
+            action("second"),
+        ),
+    )
+
+    assert [event.action.name for event in completed] == [
+        "parent",
+        "first",
+        "grandchild",
+        "second",
+    ]
+
+
+def test_choices_are_indexed_by_id() -> None:
+    """Find offered choices by id, and forget them once no longer offered."""
+    player = AnonPlayer(
+        session_object_id="p1",
+        name="P1",
+        decks=[],
+        starting_cards=[],
+        main_cards=[],
+        processes=[],
+        hand=[],
+        played=[],
+        discard=[],
+    )
+    card = Card(name="Card", player=player, types=[], classes=[])
+    first, second = (
+        AnonAction(
+            name=name,
+            card=card,
+            player=player,
+            enter=lambda ctx: None,  # noqa: ARG005
+        )
+        for name in ("first", "second")
+    )
+
+    ctx = ExecutionContext(players=[player])
+    ctx.choices = [first, second]
+
+    assert ctx.offered[second.session_object_id] == 1
+    assert ctx.choice_position(action=second) == 1
+
+    ctx.dequeue(action=first)
+
+    assert ctx.choices == [second]
+    assert ctx.choice_position(action=first) == -1
+    assert ctx.choice_position(action=second) == 0
+
+
+def test_board_version_follows_zone_changes() -> None:
+    """Move the board version on for zone changes, not for every action."""
+    player = AnonPlayer(
+        session_object_id="p1",
+        name="P1",
+        decks=[],
+        starting_cards=[],
+        main_cards=[],
+        processes=[],
+        hand=[],
+        played=[],
+        discard=[],
+    )
+    card = Card(name="Card", player=player, types=[], classes=[])
+    ctx = ExecutionContext(players=[player])
+    version: int = ctx.version
+
+    ctx.execute(
+        action=AnonAction(
+            name="Nothing",
+            card=card,
+            player=player,
+            enter=lambda ctx: None,  # noqa: ARG005
+        ),
+    )
+
+    assert ctx.version == version
+
+    player.hand.append(card)
+
+    assert ctx.version > version
+
+    version = ctx.version
+    player.hand = []
+    player.hand.append(card)
+
+    assert ctx.version > version
+
+
+def test_feasibility_is_cached_until_a_zone_changes() -> None:
+    """Keep feasibility across actions that change no zone."""
+    player = AnonPlayer(
+        session_object_id="p1",
+        name="P1",
+        decks=[],
+        starting_cards=[],
+        main_cards=[],
+        processes=[],
+        hand=[],
+        played=[],
+        discard=[],
+    )
+    card = Card(name="Card", player=player, types=[], classes=[])
+    action = AnonAction(
+        name="NeedsAPlayedCard",
+        card=card,
+        player=player,
+        enter=lambda ctx: None,  # noqa: ARG005
+        costs=[
+            Select(
+                name="Requires one",
+                card=card,
+                player=player,
+                options=lambda ctx: list(ctx.player.played),
+                n=1,
+                require_n=True,
+            ),
+        ],
+    )
+    ctx = ExecutionContext(players=[player])
+
+    assert not ctx.feasible(action=action)
+
+    ctx.execute(
+        action=AnonAction(
+            name="Nothing",
+            card=card,
+            player=player,
+            enter=lambda ctx: None,  # noqa: ARG005
+        ),
+    )
+
+    assert ctx.feasibility_version == ctx.version
+    assert action in ctx.feasibility
+
+    player.played.append(card)
+
+    assert ctx.feasible(action=action)
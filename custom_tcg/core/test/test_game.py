@@ -0,0 +1,171 @@
+"""Tests for `custom_tcg.core.game` module."""
+
+from __future__ import annotations
+
+from custom_tcg.common.player import p1, p2
+from custom_tcg.core.card.select_by_choice import SelectByChoice
+from custom_tcg.core.dimension import ActionStateDef
+from custom_tcg.core.game import Game
+
+
+def test_run_respects_step_budget_and_resumes() -> None:
+    """Stop after the step budget, then resume to the same idle state."""
+    budgeted = Game(players=[p1(), p2()])
+    budgeted.setup()
+    budgeted.start(max_steps=1)
+
+    assert not budgeted.idle
+
+    slices: int = 1
+    while not budgeted.run(max_steps=1):
+        slices += 1
+
+    assert budgeted.idle
+    assert slices > 1
+    assert [choice.name for choice in budgeted.context.choices]
+
+
+def test_run_respects_expired_deadline() -> None:
+    """Do no work when the deadline has already passed."""
+    game = Game(players=[p1(), p2()])
+    game.setup()
+    game.start(max_steps=0)
+
+    ready_before = list(game.context.ready)
+
+    assert not game.run(deadline=0)
+    assert list(game.context.ready) == ready_before
+
+
+def test_choice_by_id_finds_offered_choices_only() -> None:
+    """Resolve offered choices by id, rejecting unknown and stale ids."""
+    game = Game(players=[p1(), p2()])
+    game.setup()
+    game.start()
+
+    offered = game.context.choices[0]
+    process_card = game.context.player.processes[0]
+
+    assert game.choice_by_id(session_object_id=offered.session_object_id) is (
+        offered
+    )
+    assert (
+        game.choice_by_id(session_object_id=process_card.session_object_id)
+        is None
+    )
+    assert game.choice_by_id(session_object_id="unknown") is None
+
+    game.choose(action=offered)
+
+    assert offered not in game.context.choices
+    assert game.choice_by_id(session_object_id=offered.session_object_id) is (
+        None
+    )
+
+
+def test_choose_many_rejects_batches_not_offered() -> None:
+    """Choose nothing when the first entry is not offered."""
+    game = Game(players=[p1(), p2()])
+    game.setup()
+    game.start()
+
+    play_process = game.context.process
+    choices_before = list(game.context.choices)
+    end = next(c for c in game.context.choices if c.name == "End Process")
+
+    assert game.choose_many(actions=["unknown", end]) == choices_before
+    assert game.dropped_choices == ["unknown", end.session_object_id]
+    assert game.context.process is play_process
+    assert game.record.choices == []
+
+    choices = game.choose_many(actions=[end.session_object_id, "unknown"])
+
+    assert game.context.process is not play_process
+    assert choices is game.context.choices
+    assert end not in choices
+    assert game.dropped_choices == ["unknown"]
+
+
+def test_choose_many_selects_options_then_confirms() -> None:
+    """Apply a selector's options and confirm as one budgeted batch."""
+    game = Game(players=[p1(), p2()])
+    game.setup()
+    game.start()
+
+    player = game.context.player
+    selector = SelectByChoice(
+        name="Select",
+        card=player.processes[0],
+        player=player,
+        options=player.main_cards[:2],
+        require_n=True,
+        accept_n=2,
+    )
+    selector.state = ActionStateDef.queued
+    game.context.ready.insert(0, selector)
+    game.run()
+
+    *options, confirm = game.context.choices
+
+    assert len(options) == 2  # noqa: PLR2004
+    assert confirm.name == "Confirm"
+
+    game.choose_many(
+        actions=[*(option.session_object_id for option in options), confirm],
+        max_steps=1,
+    )
+
+    assert selector.selected == [player.main_cards[0]]
+    assert game.pending_choices == [
+        options[1].session_object_id,
+        confirm.session_object_id,
+    ]
+
+    while not game.run(max_steps=1):
+        pass
+
+    assert selector.state == ActionStateDef.completed
+    assert selector.selected == player.main_cards[:2]
+    assert game.pending_choices == []
+
+
+def test_choose_many_continues_into_the_next_selector() -> None:
+    """Apply entries offered only once earlier entries were applied."""
+    game = Game(players=[p1(), p2()])
+    game.setup()
+    game.start()
+
+    player = game.context.player
+    receiver, items = (
+        SelectByChoice(
+            name=name,
+            card=player.processes[0],
+            player=player,
+            options=player.main_cards[:2],
+            require_n=False,
+            accept_n=1,
+        )
+        for name in ("Receiver", "Items")
+    )
+
+    for selector in (items, receiver):
+        selector.state = ActionStateDef.queued
+        game.context.ready.insert(0, selector)
+
+    game.run()
+
+    assert items.cancel_action not in game.context.choices
+
+    game.choose_many(
+        actions=[
+            game.context.choices[0],
+            receiver.confirm_action,
+            items.cancel_action,
+        ],
+    )
+
+    assert receiver.state == ActionStateDef.completed
+    assert receiver.selected == [player.main_cards[0]]
+    assert items.state == ActionStateDef.cancelled
+    assert game.pending_choices == []
+    assert game.dropped_choices == []
@@ -0,0 +1,41 @@
+"""Tests for `custom_tcg.core.object_index` module."""
+
+from __future__ import annotations
+
+import gc
+
+from custom_tcg.common.being.peasant import Peasant
+from custom_tcg.common.player import p1
+from custom_tcg.core.object_index import ObjectIndex
+
+
+def test_add_player_indexes_cards_and_their_actions() -> None:
+    """Index a player, their cards, and every action registered to a card."""
+    index = ObjectIndex()
+    player = p1()
+    index.add_player(player=player)
+
+    card = player.main_cards[0]
+
+    assert index.get(session_object_id=player.session_object_id) is player
+    assert index.get(session_object_id=card.session_object_id) is card
+    assert all(
+        index.get(session_object_id=action.session_object_id) is action
+        for action in card.action_registry
+    )
+
+
+def test_retired_objects_drop_out() -> None:
+    """Forget objects once nothing else refers to them."""
+    index = ObjectIndex()
+    player = p1()
+    card = Peasant.create(player=player)
+    session_object_id = card.session_object_id
+    index.add_card(card=card)
+
+    assert session_object_id in index
+
+    del card
+    gc.collect()
+
+    assert index.get(session_object_id=session_object_id) is None
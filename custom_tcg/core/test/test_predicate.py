@@ -0,0 +1,120 @@
+"""Tests for `custom_tcg.core.predicate` module."""
+
+from __future__ import annotations
+
+import pickle
+from unittest.mock import Mock
+
+from custom_tcg.common.being.peasant import Peasant
+from custom_tcg.common.effect.holding import Holding
+from custom_tcg.common.item.flint import Flint
+from custom_tcg.common.item.stick import Stick
+from custom_tcg.common.player import p1, p2
+from custom_tcg.common.predicate import HeldBy
+from custom_tcg.core.card.card import Card
+from custom_tcg.core.dimension import CardClassDef, CardTypeDef
+from custom_tcg.core.effect.activated import Activated
+from custom_tcg.core.execution.activate import Activate
+from custom_tcg.core.execution.play import Play
+from custom_tcg.core.predicate import (
+    ActionIs,
+    CardHasClass,
+    CardHasEffect,
+    HasEffect,
+    HasType,
+    InZone,
+    Is,
+    IsInstance,
+    Matches,
+    PlayerIs,
+    ZoneQuery,
+)
+from custom_tcg.core.state import behavior
+
+
+def test_card_predicates_compile_to_zone_queries() -> None:
+    """Answer what the zone indexes can, leaving the rest per card."""
+    peasant = Peasant.create(player=p1())
+    holder = HeldBy(holder=peasant)
+
+    assert (
+        IsInstance(cls=Flint) & ~HasEffect(effect_type=Activated)
+    ).compile() == (
+        ZoneQuery(cls=Flint, without_effect=Activated),
+        None,
+    )
+    assert (
+        HasType(card_type=CardTypeDef.being) & ~Is(card=peasant)
+    ).compile() == (
+        ZoneQuery(card_type=CardTypeDef.being),
+        ~Is(card=peasant),
+    )
+    assert (IsInstance(cls=Flint) & holder).compile() == (
+        ZoneQuery(cls=Flint, with_effect=Holding),
+        holder,
+    )
+    assert (IsInstance(cls=Flint) | IsInstance(cls=Stick)).compile() == (
+        ZoneQuery(cls=(Flint, Stick)),
+        None,
+    )
+
+
+def test_in_zone_selects_like_a_filter() -> None:
+    """Select the same cards, in the same order, as filtering the zone."""
+    player = p1()
+    peasant = Peasant.create(player=player)
+    flints = [Flint.create(player=player) for _ in range(3)]
+    flints[1].effects.append(
+        Holding(card=flints[1], card_holding=peasant, card_held=flints[1]),
+    )
+    flints[2].effects.append(Activated(card=flints[2]))
+    player.played.extend([flints[0], peasant, flints[1], flints[2]])
+    context = Mock(player=player)
+
+    unheld = InZone(zone="played", where=IsInstance(cls=Flint)) & ~HeldBy(
+        holder=peasant,
+    )
+
+    assert unheld(context) == [flints[0], flints[2]]
+    assert (unheld & ~HasEffect(effect_type=Activated))(context) == [flints[0]]
+    assert InZone(zone="played", where=HeldBy(holder=peasant))(context) == [
+        flints[1],
+    ]
+    assert InZone(zone="played")(context) == list(player.played)
+
+
+def test_bind_predicates_match_like_binds() -> None:
+    """Bind by action class, card class, player, and card effects."""
+    player = p1()
+    process = Card(
+        name="Process",
+        player=player,
+        types=[CardTypeDef.process],
+        classes=[CardClassDef.play],
+    )
+    bind = (
+        ActionIs(cls=Activate)
+        & CardHasClass(card_class=CardClassDef.play)
+        & PlayerIs(player=player)
+        & ~CardHasEffect(effect_type=Activated)
+    )
+    activate = Activate(card=process, player=player, actions=[])
+
+    assert bind(activate, process, player)
+    assert not bind(Play(card=process, player=player), process, player)
+    assert not bind(activate, process, p2())
+
+    process.effects.append(Activated(card=process))
+
+    assert not bind(activate, process, player)
+
+
+def test_predicates_compare_and_save_by_value() -> None:
+    """Compare and hash by value, and save unless wrapping a function."""
+    predicate = IsInstance(cls=Flint) & ~HasEffect(effect_type=Activated)
+    same = IsInstance(cls=Flint) & ~HasEffect(effect_type=Activated)
+
+    assert predicate == same
+    assert len({predicate, pickle.loads(pickle.dumps(predicate))}) == 1  # noqa: S301
+    assert not behavior(value=InZone(zone="played", where=predicate))
+    assert behavior(value=predicate & Matches(function=lambda card: True))  # noqa: ARG005
@@ -3,9 +3,10 @@
 from unittest.mock import Mock
 
 from custom_tcg.core.dimension import ActionStateDef, CardTypeDef
-from custom_tcg.core.effect.effect import Effect
+from custom_tcg.core.effect.activated import Activated
 from custom_tcg.core.execution.activate import Activate
 from custom_tcg.core.process.end_process import EndProcess
+from custom_tcg.core.turn_structure import TurnStructure
 
 
 def _make_process_card(name: str, player, actions) -> Mock:  # noqa: ANN001
@@ -44,6 +45,7 @@ def test_end_process_queues_next_process_for_same_player() -> None:
     context.player = player
     context.players = [player]
     context.ready = []
+    context.turns = TurnStructure(players=context.players)
 
     end = EndProcess(card=p1, player=player)
     end.enter(context=context)
@@ -69,8 +71,6 @@ def test_end_process_rotates_to_next_player_and_clears_activated() -> None:
         actions=[],
     )
     p2_proc = _make_process_card("P2Proc", p2, [p2_activate])
-    activated_effect = Effect(name="Activated", card=p2_proc)
-    p2_proc.effects.append(activated_effect)
     p2.processes.append(p2_proc)
 
     # p1 current process
@@ -86,6 +86,12 @@ def test_end_process_rotates_to_next_player_and_clears_activated() -> None:
     context.player = p1
     context.players = [p1, p2]
     context.ready = []
+    context.turns = TurnStructure(players=context.players)
+
+    # Activating p2's process marks it in the turn structure
+    activated_effect = Activated(card=p2_proc)
+    activated_effect.activate(context=context)
+    assert context.turns.activated_effects(player=p2) == [activated_effect]
 
     end = EndProcess(card=p1_proc, player=p1)
     end.enter(context=context)
@@ -93,6 +99,7 @@ def test_end_process_rotates_to_next_player_and_clears_activated() -> None:
     # Should rotate to p2 and clear the Activated effect on their process
     assert context.player is p2
     assert all(e.name != "Activated" for e in p2_proc.effects)
+    assert context.turns.activated_effects(player=p2) == []
     assert len(context.ready) == 1
     next_resolve = context.ready[0]
     assert getattr(next_resolve, "action", None) is p2_activate
@@ -1,8 +1,10 @@
 """Tests for `custom_tcg.core.process.process_manager` module."""
 
+from collections import deque
 from unittest.mock import Mock
 
 from custom_tcg.core.dimension import ActionStateDef
+from custom_tcg.core.execution.trigger_queue import TriggerQueue
 from custom_tcg.core.process.process_manager import ProcessManager
 
 
@@ -31,7 +33,7 @@ def test_process_manager_enter_transitions_to_input_requested() -> None:
 
     context = Mock(name="ExecutionContextMock")
     context.notifications = []
-    context.ready = []
+    context.ready = deque()
     context.choices = []
 
     pm.enter(context=context)
@@ -50,7 +52,7 @@ def test_process_manager_complete_executes_reset_actions() -> None:
     pm = ProcessManager(name="Mgr", card=card, player=player)
     context = Mock(name="ExecutionContextMock")
     context.notifications = []
-    context.ready = []
+    context.ready = deque()
     context.choices = [pm.end_process]
 
     pm.complete(context=context)
@@ -69,8 +71,9 @@ def test_process_manager_moves_notifications_to_ready() -> None:
     pm = ProcessManager(name="Mgr", card=card, player=player)
     context = Mock(name="ExecutionContextMock")
     notification = Mock(name="NotifAction")
-    context.notifications = [notification]
-    context.ready = []
+    context.notifications = TriggerQueue()
+    context.notifications.append(notification)
+    context.ready = deque()
 
     pm.update_next_state(context=context)
 
@@ -78,3 +81,21 @@ def test_process_manager_moves_notifications_to_ready() -> None:
     assert context.notifications == []
     assert notification.state == ActionStateDef.queued
     assert pm.state == ActionStateDef.queued
+
+
+def test_process_manager_queues_triggers_ahead_of_ready() -> None:
+    """Queue drained triggers in order, ahead of actions already ready."""
+    card = Mock(name="CardMock")
+    card.actions = []
+
+    pm = ProcessManager(name="Mgr", card=card, player=Mock(name="PlayerMock"))
+    context = Mock(name="ExecutionContextMock")
+    first, second, waiting = Mock(), Mock(), Mock()
+    context.notifications = TriggerQueue()
+    context.notifications.extend(actions=[first, second])
+    context.ready = deque([waiting])
+
+    pm.update_next_state(context=context)
+
+    assert list(context.ready) == [first, second, waiting]
+    assert len(context.notifications) == 0
@@ -2,6 +2,7 @@
 
 from unittest.mock import Mock
 
+from custom_tcg.core.dirty_actions import DirtyActions
 from custom_tcg.core.process.reset_actions import ResetActions
 
 
@@ -35,6 +36,13 @@ def test_reset_actions_filters_and_resets() -> None:
     a2.card = c1
     a3.card = c2
 
+    # Actions used since the last reset are tracked per player
+    player.dirty_actions = DirtyActions()
+    other.dirty_actions = DirtyActions()
+    player.dirty_actions.mark(action=a1)
+    player.dirty_actions.mark(action=a2)
+    other.dirty_actions.mark(action=a3)
+
     # Filter: only reset a2
     def filter_actions(action) -> bool:  # noqa: ANN001
         return action is a2
@@ -52,3 +60,34 @@ def test_reset_actions_filters_and_resets() -> None:
     a2.reset_state.assert_called_once_with()
     a1.reset_state.assert_not_called()
     a3.reset_state.assert_not_called()
+
+
+def test_reset_actions_only_visits_dirty_actions() -> None:
+    """Skip actions that have not left `not_started` since the last reset."""
+    player = Mock(name="PlayerMock")
+    player.dirty_actions = DirtyActions()
+
+    used = Mock(name="Used")
+    unused = Mock(name="Unused")
+
+    card = Mock(name="Card")
+    card.register = Mock()
+    card.actions = [used, unused]
+    used.card = card
+    unused.card = card
+    player.played = [card]
+    player.dirty_actions.mark(action=used)
+
+    ra = ResetActions(
+        card=card,
+        player=player,
+        filter_actions=lambda action: True,  # noqa: ARG005
+    )
+
+    context = Mock(name="ExecutionContextMock")
+    context.players = [player]
+
+    ra.enter(context=context)
+
+    used.reset_state.assert_called_once_with()
+    unused.reset_state.assert_not_called()
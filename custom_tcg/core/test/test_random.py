@@ -0,0 +1,71 @@
+"""Tests for `custom_tcg.core.util.random` module."""
+
+from __future__ import annotations
+
+from collections import Counter
+from itertools import permutations
+
+from custom_tcg.common.player import p1
+from custom_tcg.core.util.random import GameRandom, shuffle_many
+
+
+def test_same_seed_replays_same_numbers() -> None:
+    """Draw the same shuffles and rolls from the same seed."""
+    first, second = GameRandom(seed=42), GameRandom(seed=42)
+
+    assert first.randomize(ordered=list(range(20))) == second.randomize(
+        ordered=list(range(20)),
+    )
+    assert [first.roll(sides=6) for _ in range(10)] == [
+        second.roll(sides=6) for _ in range(10)
+    ]
+
+
+def test_rolls_do_not_change_shuffles() -> None:
+    """Keep shuffles independent of how many rolls came before."""
+    rolled, unrolled = GameRandom(seed=7), GameRandom(seed=7)
+
+    for _ in range(5):
+        rolled.roll(sides=6)
+
+    assert rolled.below(exclusive_upper_bound=1000) == unrolled.below(
+        exclusive_upper_bound=1000,
+    )
+    assert all(1 <= rolled.roll(sides=6) <= 6 for _ in range(100))  # noqa: PLR2004
+
+
+def test_shuffle_is_uniform() -> None:
+    """Produce every ordering of a small deck about equally often."""
+    rng = GameRandom(seed=2024)
+    deck: list[int] = [0, 1, 2]
+    counts: Counter[tuple[int, ...]] = Counter()
+    trials: int = 6000
+
+    for _ in range(trials):
+        rng.shuffle(items=deck)
+        counts[tuple(deck)] += 1
+
+    expected: float = trials / len(list(permutations(deck)))
+    chi_square: float = sum(
+        (counts[ordering] - expected) ** 2 / expected
+        for ordering in permutations(deck)
+    )
+
+    # Critical value for 5 degrees of freedom at p = 0.001.
+    assert chi_square < 20.52  # noqa: PLR2004
+
+
+def test_shuffle_many_shuffles_zones_and_lists_in_place() -> None:
+    """Shuffle every deck in a batch in place, keeping the same cards."""
+    player = p1()
+    zone = player.main_cards
+    cards = list(zone)
+    decks: list[list[int]] = [list(range(30)) for _ in range(3)]
+
+    shuffle_many(decks=[zone, *decks], rng=GameRandom(seed=3))
+
+    assert player.main_cards is zone
+    assert sorted(zone, key=id) == sorted(cards, key=id)
+    assert zone.where(cls=type(cards[0]))
+    assert all(sorted(deck) == list(range(30)) for deck in decks)
+    assert any(deck != list(range(30)) for deck in decks)
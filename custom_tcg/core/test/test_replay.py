@@ -0,0 +1,97 @@
+"""Tests for `custom_tcg.core.replay` module."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from custom_tcg.common.being.that_pebble_girl import ThatPebbleGirl
+from custom_tcg.common.player import p1, p2
+from custom_tcg.core.game import Game
+from custom_tcg.core.replay import (
+    GameRecord,
+    PlayerRecord,
+    ReplayWriter,
+    card_name,
+    decode,
+    digest,
+    encode,
+)
+from custom_tcg.core.util.random import GameRandom
+from custom_tcg.replay import card_types, replay
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def played_game(choices: int, recorder: ReplayWriter | None = None) -> Game:
+    """Play a seeded game, always making the last choice offered."""
+    game = Game(players=[p1(), p2()], rng=GameRandom(seed=11))
+    game.recorder = recorder
+    game.setup()
+    game.start()
+
+    for _ in range(choices):
+        if len(game.context.choices) == 0:
+            break
+
+        game.choose(action=game.context.choices[-1])
+
+    return game
+
+
+def test_encode_round_trips() -> None:
+    """Decode a record exactly as it was encoded."""
+    record = GameRecord(
+        seed=2**64 - 1,
+        players=[
+            PlayerRecord(
+                session_object_id="p1",
+                name="Person 1",
+                starting=["LetsPlay"],
+                main=["Peasant", "Peasant"],
+            ),
+        ],
+        choices=[0, 3, -1, 200],
+        checkpoints={0: 123, 2: 2**32 - 1},
+    )
+
+    assert decode(data=encode(record=record)) == record
+
+
+def test_decode_ignores_truncated_tail() -> None:
+    """Keep every whole record when the file was cut off mid-record."""
+    record = GameRecord(seed=1, choices=[1, 2, 300])
+    data: bytes = encode(record=record)
+
+    assert decode(data=data[:-1]).choices == [1, 2]
+
+
+def test_replay_matches_recorded_game(tmp_path: Path) -> None:
+    """Replay a written record to the same state, checking checkpoints."""
+    path: Path = tmp_path / "game.replay"
+    game: Game = played_game(choices=40, recorder=ReplayWriter(path=path))
+
+    record: GameRecord = decode(data=path.read_bytes())
+    replayed: Game = replay(record=record, types=card_types())
+
+    assert len(record.checkpoints) > 1
+    assert replayed.record.choices == game.record.choices
+    assert digest(game=replayed) == digest(game=game)
+
+
+def test_unrecorded_games_skip_checkpoints() -> None:
+    """Keep choices, but no state digests, when nothing records the game."""
+    game: Game = played_game(choices=20)
+
+    assert len(game.record.choices) > 16  # noqa: PLR2004
+    assert game.record.checkpoints == {}
+
+
+def test_decks_are_recorded_by_card_class() -> None:
+    """Name cards by class, which finds the class that creates them again."""
+    types = card_types()
+    card = ThatPebbleGirl.create(player=p1())
+
+    assert card_name(card=card) == "ThatPebbleGirl"
+    assert types[card_name(card=card)] is ThatPebbleGirl
+    assert type(types["ThatPebbleGirl"].create(player=p1())) is ThatPebbleGirl
@@ -6,6 +6,7 @@ from unittest.mock import Mock
 import pytest
 
 from custom_tcg.core.card.select import Select
+from custom_tcg.core.util.random import GameRandom
 
 
 @pytest.fixture
@@ -59,6 +60,7 @@ def mock_context(mock_player: Mock) -> Mock:
     """
     context = Mock()
     context.player = mock_player
+    context.version = 0
     return context
 
 
@@ -204,6 +206,39 @@ def test_queue_with_insufficient_options(
     assert select.state.name == "Cancelled"
 
 
+def test_can_satisfy_does_not_change_state(
+    mock_card: Mock,
+    mock_player: Mock,
+    mock_context: Mock,
+) -> None:
+    """Test can_satisfy evaluates options without changing the selector.
+
+    :param mock_card: The mocked card.
+    :type mock_card: Mock
+    :param mock_player: The mocked player.
+    :type mock_player: Mock
+    :param mock_context: The mocked context.
+    :type mock_context: Mock
+    """
+    option = Mock()
+    option.name = "OnlyOption"
+    select = Select(
+        name="TestSelect",
+        card=mock_card,
+        player=mock_player,
+        options=[option],
+        n=2,
+        require_n=True,
+    )
+
+    assert select.can_satisfy(context=mock_context) is False
+    assert select.state.name == "Not started"
+    assert select.options == []
+
+    select.n = 1
+    assert select.can_satisfy(context=mock_context) is True
+
+
 def test_enter_without_randomize(
     mock_card: Mock,
     mock_player: Mock,
@@ -260,6 +295,7 @@ def test_enter_with_randomize(
         n=2,
         randomize=True,
     )
+    mock_context.random = GameRandom(seed=0)
     select.enter(context=mock_context)
 
     assert len(select.selected) == 2  # noqa: PLR2004
@@ -513,3 +549,37 @@ def test_select_with_empty_options(
     select.enter(context=mock_context)
 
     assert select.selected == []
+
+
+def test_current_options_reused_until_version_changes(
+    mock_card: Mock,
+    mock_player: Mock,
+    mock_context: Mock,
+) -> None:
+    """Test options are created once per board version.
+
+    :param mock_card: The mocked card.
+    :type mock_card: Mock
+    :param mock_player: The mocked player.
+    :type mock_player: Mock
+    :param mock_context: The mocked context.
+    :type mock_context: Mock
+    """
+    options_callable = Mock(return_value=[Mock()])
+    select = Select(
+        name="TestSelect",
+        card=mock_card,
+        player=mock_player,
+        options=options_callable,
+    )
+    mock_context.version = 1
+
+    first = select.current_options(context=mock_context)
+    second = select.current_options(context=mock_context)
+    assert first == second
+    assert first is not second
+    assert options_callable.call_count == 1
+
+    mock_context.version = 2
+    select.current_options(context=mock_context)
+    assert options_callable.call_count == 2  # noqa: PLR2004
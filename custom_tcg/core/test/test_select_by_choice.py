@@ -83,6 +83,7 @@ def mock_context() -> Mock:
     """
     context = Mock()
     context.choices = []
+    context.version = 0
     return context
 
 
@@ -184,6 +185,23 @@ def test_speculate_false(select_by_choice: SelectByChoice) -> None:
     assert select_by_choice.speculate() is False
 
 
+def test_can_satisfy_does_not_change_state(
+    select_by_choice: SelectByChoice,
+    mock_context: Mock,
+) -> None:
+    """Test can_satisfy leaves options, selection, and state untouched.
+
+    :param select_by_choice: The select by choice action.
+    :type select_by_choice: SelectByChoice
+    :param mock_context: The mocked context.
+    :type mock_context: Mock
+    """
+    assert select_by_choice.can_satisfy(context=mock_context) is True
+    assert select_by_choice.state == ActionStateDef.not_started
+    assert select_by_choice.options == []
+    assert select_by_choice.selected == []
+
+
 def test_enter(
     select_by_choice: SelectByChoice,
     mock_context: Mock,
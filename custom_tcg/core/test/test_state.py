@@ -0,0 +1,58 @@
+"""Tests for `custom_tcg.core.state` module."""
+
+from __future__ import annotations
+
+import pickle
+
+import pytest
+
+from custom_tcg.common.player import p1, p2
+from custom_tcg.core import state
+from custom_tcg.core.game import Game
+from custom_tcg.core.replay import digest
+from custom_tcg.core.util.random import GameRandom
+from custom_tcg.replay import card_types
+
+
+def _ids(game: Game) -> list[str]:
+    return [choice.session_object_id for choice in game.context.choices]
+
+
+def _names(game: Game) -> list[str]:
+    return [choice.name for choice in game.context.choices]
+
+
+def test_loaded_games_play_on_the_same() -> None:
+    """Load a game mid-play, then make the same choices in both."""
+    types = card_types()
+    game = Game(players=[p1(), p2()], rng=GameRandom(seed=3))
+    game.setup()
+    game.start()
+
+    for _ in range(15):
+        game.choose(action=game.context.choices[-1])
+
+    with pytest.raises((pickle.PicklingError, AttributeError)):
+        pickle.dumps(game)
+
+    loaded: Game = state.loads(
+        data=state.dumps(game=game, types=types),
+        types=types,
+    )
+
+    assert loaded is not game
+    assert _ids(game=loaded) == _ids(game=game)
+    assert digest(game=loaded) == digest(game=game)
+
+    for _ in range(15):
+        game.choose(action=game.context.choices[0])
+        loaded.choose(action=loaded.context.choices[0])
+
+    assert _names(game=loaded) == _names(game=game)
+    assert digest(game=loaded) == digest(game=game)
+
+
+def test_load_rejects_other_data() -> None:
+    """Refuse bytes that are not a saved game."""
+    with pytest.raises(ValueError, match="Not a saved game"):
+        state.loads(data=b"TCGR\x01", types={})
@@ -0,0 +1,78 @@
+"""Tests for `custom_tcg.core.execution.trigger_queue` module."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+from unittest.mock import Mock
+
+from custom_tcg.core.execution.trigger_queue import TriggerQueue
+
+
+@dataclass(eq=False)
+class _Trigger:
+    """A trigger, optionally resolving another action."""
+
+    name: str
+    player: Any
+    action: Any = None
+
+
+def _trigger(name: str, player: object, action: object = None) -> Any:  # noqa: ANN401
+    """Create a trigger, optionally resolving another action."""
+    return _Trigger(name=name, player=player, action=action)
+
+
+def test_triggers_resolve_by_controller_and_time() -> None:
+    """Order by the controller's rank, then trigger order."""
+    active, other = Mock(name="Active"), Mock(name="Other")
+    queue = TriggerQueue(rank=lambda player: 0 if player is active else 1)
+
+    late = _trigger(name="late", player=active)
+    opponent = _trigger(name="opponent", player=other)
+    early = _trigger(name="early", player=active)
+
+    queue.append(action=opponent)
+    queue.append(action=early)
+    queue.append(action=late)
+
+    assert queue == [early, late, opponent]
+    assert queue.pop() is early
+    assert queue.drain() == [late, opponent]
+    assert len(queue) == 0
+
+
+def test_identical_pending_triggers_are_queued_once() -> None:
+    """Skip a trigger resolving an action already pending for its source."""
+    player = Mock(name="Player")
+    listener = Mock(name="Listener")
+    source = Mock(name="Source")
+    queue = TriggerQueue()
+
+    first = _trigger(name="first", player=player, action=listener)
+    queue.append(action=first, source=source)
+    queue.append(
+        action=_trigger(name="again", player=player, action=listener),
+        source=source,
+    )
+
+    assert queue == [first]
+
+    queue.pop()
+    queue.append(action=_trigger(name="later", player=player, action=listener))
+
+    assert len(queue) == 1
+
+
+def test_separate_firings_of_a_listener_are_all_queued() -> None:
+    """Queue a listener once per action that set it off."""
+    player = Mock(name="Player")
+    listener = Mock(name="Listener")
+    queue = TriggerQueue()
+
+    first = _trigger(name="first", player=player, action=listener)
+    second = _trigger(name="second", player=player, action=listener)
+    queue.append(action=first, source=Mock(name="First play"))
+    queue.append(action=second, source=Mock(name="Second play"))
+
+    assert queue.drain() == [first, second]
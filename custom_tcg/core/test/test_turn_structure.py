@@ -0,0 +1,42 @@
+"""Tests for `custom_tcg.core.turn_structure` module."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+from custom_tcg.core.execution.activate import Activate
+from custom_tcg.core.turn_structure import TurnStructure
+
+
+def _process(name: str, player: Mock) -> Mock:
+    """Create a process card with a plain activation."""
+    card = Mock(name=name)
+    card.name = name
+    card.player = player
+    card.actions = [Activate(card=card, player=player, actions=[])]
+    return card
+
+
+def test_processes_take_turns_in_a_ring() -> None:
+    """Rotate through each player's processes, then to the next player."""
+    p1, p2 = Mock(name="P1"), Mock(name="P2")
+    p1.processes = [_process(name="Play", player=p1)]
+    p2.processes = [_process(name="Play", player=p2)]
+    turns = TurnStructure(players=[p1, p2])
+
+    rest = _process(name="Rest", player=p1)
+    first_resolve = turns.entry(process=p1.processes[0]).resolve
+    p1.processes.append(rest)
+    turns.add_process(process=rest)
+
+    after_play = turns.after(process=p1.processes[0])
+    after_rest = turns.after(process=rest)
+    after_p2 = turns.after(process=p2.processes[0])
+
+    assert after_play.process is rest
+    assert not after_play.first
+    assert after_rest.player is p2
+    assert after_rest.first
+    assert after_p2.process is p1.processes[0]
+    assert after_p2.resolve is first_resolve
+    assert after_p2.resolve.action is p1.processes[0].actions[0]
@@ -0,0 +1,110 @@
+"""Tests for `custom_tcg.core.zone` module."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_tcg.common.being.peasant import Peasant
+from custom_tcg.common.card_type_def import CardTypeDef as CommonCardTypeDef
+from custom_tcg.common.effect.item_stats import ItemStats
+from custom_tcg.common.item.flint import Flint
+from custom_tcg.common.player import p1
+from custom_tcg.core.dimension import CardTypeDef
+from custom_tcg.core.effect.activated import Activated
+from custom_tcg.core.zone import Zone
+
+
+def test_where_finds_cards_in_zone_order() -> None:
+    """Query by class, type, and effect, keeping the zone's order."""
+    player = p1()
+    peasant = Peasant.create(player=player)
+    flint = Flint.create(player=player)
+    tired = Peasant.create(player=player)
+    tired.effects.append(Activated(card=tired))
+
+    zone = Zone(cards=[peasant, flint, tired])
+
+    assert zone.where(cls=Peasant) == [peasant, tired]
+    assert zone.where(card_type=CardTypeDef.being) == [peasant, tired]
+    assert zone.where(card_type=CommonCardTypeDef.item) == [flint]
+    assert zone.where(with_effect=Activated) == [tired]
+    assert zone.where(with_effect=ItemStats) == [flint]
+    assert zone.where(
+        card_type=CardTypeDef.being,
+        without_effect=Activated,
+    ) == [peasant]
+
+
+def test_indexes_follow_effect_changes_and_moves() -> None:
+    """Update indexes when effects change and when cards change zones."""
+    player = p1()
+    peasant = Peasant.create(player=player)
+    played = Zone(cards=[peasant])
+    discard = Zone()
+
+    activated = Activated(card=peasant)
+    peasant.effects.append(activated)
+
+    assert played.where(with_effect=Activated) == [peasant]
+
+    peasant.effects.remove(activated)
+
+    assert played.where(with_effect=Activated) == []
+
+    played.remove(peasant)
+    discard.append(peasant)
+    peasant.effects = [Activated(card=peasant)]
+
+    assert peasant not in played
+    assert played.where(cls=Peasant) == []
+    assert discard.where(with_effect=Activated) == [peasant]
+    assert peasant.zones == [discard]
+
+
+def test_card_may_not_be_added_twice() -> None:
+    """Reject a card already in the zone."""
+    player = p1()
+    peasant = Peasant.create(player=player)
+    zone = Zone(cards=[peasant])
+
+    with pytest.raises(ValueError, match="already in this zone"):
+        zone.append(peasant)
+
+
+def test_player_zones_are_coerced() -> None:
+    """Turn lists assigned to a player's zones into zones."""
+    player = p1()
+    peasant = Peasant.create(player=player)
+
+    player.hand = [peasant]
+
+    assert isinstance(player.hand, Zone)
+    assert isinstance(player.main_cards, Zone)
+    assert player.hand.where(cls=Peasant) == [peasant]
+
+
+def test_zone_behaves_like_a_list() -> None:
+    """Index, pop, insert, and remove cards like a list."""
+    player = p1()
+    first, second, third = (Peasant.create(player=player) for _ in range(3))
+    zone = Zone(cards=[first, second, third])
+
+    assert zone[0] is first
+    assert zone[1] is second
+    assert zone[-1] is third
+    assert zone[1:] == [second, third]
+    assert zone.index(third) == 2  # noqa: PLR2004
+
+    assert zone.pop() is third
+    zone.insert(0, third)
+    zone.remove(first)
+
+    assert zone == [third, second]
+    assert first not in zone
+    assert zone.where(cls=Peasant) == [third, second]
+
+    with pytest.raises(ValueError, match="not in this zone"):
+        zone.remove(first)
+
+    with pytest.raises(IndexError):
+        zone[2]
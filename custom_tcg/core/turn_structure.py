@@ -0,0 +1,129 @@
+"""The order processes take turns in."""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from custom_tcg.core.execution.activate import Activate
+from custom_tcg.core.execution.resolve import Resolve
+
+if TYPE_CHECKING:
+    from custom_tcg.core.interface import ICard, IEffect, IPlayer
+
+logger: logging.Logger = logging.getLogger(name=__name__)
+
+
+@dataclass
+class TurnEntry:
+    """A process in turn order, with the resolution that activates it."""
+
+    player: IPlayer
+    process: ICard
+    resolve: Resolve
+    first: bool
+
+
+class TurnStructure:
+    """The order processes take turns in.
+
+    Processes are kept in a ring, by player and then by the order they were
+    played, so the process after another is found in constant time. The ring
+    is only rebuilt when the players change or a process enters play.
+
+    Activated processes are tracked per player, so a player's processes can be
+    readied at the start of their turn without scanning effects.
+    """
+
+    players: list[IPlayer]
+    entries: list[TurnEntry]
+    positions: dict[ICard, int]
+    activated: dict[str, dict[ICard, IEffect]]
+
+    def __init__(self: TurnStructure, players: list[IPlayer]) -> None:
+        """Create a turn structure for players, in turn order."""
+        self.players = players
+        self.entries = []
+        self.positions = {}
+        self.activated = {}
+        self.rebuild()
+
+    def set_players(self: TurnStructure, players: list[IPlayer]) -> None:
+        """Change the players or their turn order."""
+        self.players = players
+        self.rebuild()
+
+    def add_process(self: TurnStructure, process: ICard) -> None:
+        """Take a process that entered play into turn order."""
+        logger.info("Adding process '%s' to turn order", process.name)
+        self.rebuild()
+
+    def rebuild(self: TurnStructure) -> None:
+        """Rebuild the ring, keeping entries of processes already in it."""
+        known: dict[ICard, TurnEntry] = {
+            entry.process: entry for entry in self.entries
+        }
+        self.entries = []
+
+        for player in self.players:
+            for index, process in enumerate(player.processes):
+                entry: TurnEntry | None = known.get(process)
+
+                if entry is None or entry.player is not player:
+                    activation: Activate = next(
+                        action
+                        for action in process.actions
+                        if isinstance(action, Activate) and action.bind is None
+                    )
+                    entry = TurnEntry(
+                        player=player,
+                        process=process,
+                        resolve=Resolve(
+                            action=activation,
+                            card=activation.card,
+                            player=activation.player,
+                        ),
+                        first=index == 0,
+                    )
+
+                entry.first = index == 0
+                self.entries.append(entry)
+
+        self.positions = {
+            entry.process: position
+            for position, entry in enumerate(self.entries)
+        }
+
+    def entry(self: TurnStructure, process: ICard) -> TurnEntry:
+        """Get the entry for a process."""
+        return self.entries[self.positions[process]]
+
+    def after(self: TurnStructure, process: ICard) -> TurnEntry:
+        """Get the entry for the process taking the next turn."""
+        return self.entries[(self.positions[process] + 1) % len(self.entries)]
+
+    def mark_activated(self: TurnStructure, effect: IEffect) -> None:
+        """Note a process was activated."""
+        self.activated.setdefault(
+            effect.card_affected.player.session_object_id,
+            {},
+        )[effect.card_affected] = effect
+
+    def unmark_activated(self: TurnStructure, effect: IEffect) -> None:
+        """Note a process is no longer activated."""
+        activated: dict[ICard, IEffect] | None = self.activated.get(
+            effect.card_affected.player.session_object_id,
+        )
+
+        if activated is not None and activated.get(effect.card_affected) is (
+            effect
+        ):
+            del activated[effect.card_affected]
+
+    def activated_effects(
+        self: TurnStructure,
+        player: IPlayer,
+    ) -> list[IEffect]:
+        """Get the effects marking a player's processes activated."""
+        return list(self.activated.get(player.session_object_id, {}).values())
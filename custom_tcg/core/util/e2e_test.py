@@ -5,13 +5,48 @@ These helpers encapsulate common choice navigation patterns used by tests.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, override
+
+from custom_tcg.core.util.random import GameRandom
 
 if TYPE_CHECKING:
+    from collections.abc import MutableSequence, Sequence
+
     from custom_tcg.core.game import Game
     from custom_tcg.core.interface import IAction
 
 
+class FixedRandom(GameRandom):
+    """Random numbers fixed for tests.
+
+    Lists keep their order, the first player goes first, and every die rolls
+    `rolled` (or its highest side, if lower.)
+    """
+
+    rolled: int
+
+    def __init__(self: FixedRandom, rolled: int = 1) -> None:
+        """Create fixed random numbers."""
+        super().__init__(seed=0)
+        self.rolled = rolled
+
+    @override
+    def below(self: FixedRandom, exclusive_upper_bound: int) -> int:
+        return 0
+
+    @override
+    def roll(self: FixedRandom, sides: int) -> int:
+        return min(self.rolled, sides)
+
+    @override
+    def shuffle(self: FixedRandom, items: MutableSequence) -> None:
+        pass
+
+    @override
+    def randomize(self: FixedRandom, ordered: Sequence) -> list:
+        return list(ordered)
+
+
 def end_current_process(g: Game) -> list[IAction]:
     """Choose End Process for the current process and return next choices."""
     choices = g.context.choices
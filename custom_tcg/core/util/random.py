@@ -1,17 +1,87 @@
-"""Utility functions."""
+"""Reproducible random numbers for a game, and shuffles drawing on them."""
 
 from __future__ import annotations
 
-from secrets import randbelow
+import logging
+from random import Random
+from secrets import randbits
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    from collections.abc import (
+        Callable,
+        Iterable,
+        MutableSequence,
+        Sequence,
+    )
 
-def list_randomize(ordered: list) -> list:
+logger: logging.Logger = logging.getLogger(name=__name__)
+
+
+class GameRandom:
+    """Random numbers for a game, reproducible from a seed.
+
+    Shuffles (deck order, turn order, random selections) and in-game rolls
+    draw from independent streams, so a roll never changes a later shuffle.
+    Replaying a game's choices against the same seed replays the game.
+    """
+
+    seed: int
+    shuffles: Random
+    rolls: Random
+
+    def __init__(self: GameRandom, seed: int | None = None) -> None:
+        """Create random streams from a seed, or from a fresh seed if None."""
+        self.seed = randbits(64) if seed is None else seed
+        self.shuffles = Random(f"{self.seed}:shuffles")  # noqa: S311
+        self.rolls = Random(f"{self.seed}:rolls")  # noqa: S311
+
+    def below(self: GameRandom, exclusive_upper_bound: int) -> int:
+        """Pick a number in [0, `exclusive_upper_bound`) for setup decisions."""
+        return self.shuffles.randrange(exclusive_upper_bound)
+
+    def roll(self: GameRandom, sides: int) -> int:
+        """Roll a die with a number of sides, from 1 to `sides`."""
+        return self.rolls.randint(1, sides)
+
+    def shuffle(self: GameRandom, items: MutableSequence) -> None:
+        """Shuffle items in place."""
+        shuffle(items=items, rng=self)
+
+    def randomize(self: GameRandom, ordered: Sequence) -> list:
+        """Get a shuffled copy of items."""
+        output: list = list(ordered)
+        self.shuffles.shuffle(output)
+        return output
+
+
+def shuffle(items: MutableSequence, rng: GameRandom) -> None:
+    """Shuffle items in place, uniformly, in linear time.
+
+    Lists are shuffled directly with a Fisher-Yates shuffle. Other sequences,
+    such as zones, are shuffled as a list and then assigned back in one go, so
+    their indexes are only rebuilt once.
+    """
+    if isinstance(items, list):
+        rng.shuffles.shuffle(items)
+        return
+
+    shuffled: list = list(items)
+    rng.shuffles.shuffle(shuffled)
+    items[:] = shuffled
+
+
+def shuffle_many(decks: Iterable[MutableSequence], rng: GameRandom) -> None:
+    """Shuffle many sequences in place, such as every deck in a simulation."""
+    shuffle_list: Callable[[list], None] = rng.shuffles.shuffle
+
+    for deck in decks:
+        if isinstance(deck, list):
+            shuffle_list(deck)
+        else:
+            shuffle(items=deck, rng=rng)
+
+
+def list_randomize(ordered: Sequence, rng: GameRandom | None = None) -> list:
     """Randomize the order of items in a list."""
-    output: list = []
-    sort_indexes: list[tuple[int, int]] = [
-        (i, randbelow(exclusive_upper_bound=101)) for i in range(len(ordered))
-    ]
-    sort_indexes = sorted(sort_indexes, key=lambda x: x[1])
-    for src_index, _ in sort_indexes:
-        output.append(ordered[src_index])
-    return output
+    return (rng or GameRandom()).randomize(ordered=ordered)
@@ -0,0 +1,369 @@
+"""An ordered zone of cards that can be queried by class, type, and effect."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable, MutableSequence
+from itertools import islice
+from typing import TYPE_CHECKING, Any, overload
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from custom_tcg.core.dimension import CardType
+    from custom_tcg.core.interface import ICard, IEffect
+
+logger: logging.Logger = logging.getLogger(name=__name__)
+
+
+class Zone(MutableSequence["ICard"]):
+    """An ordered zone of cards that can be queried by class, type, and effect.
+
+    A zone behaves like a list of cards, and also keeps secondary indexes of
+    its cards by python class, card type, and the types of their effects. Use
+    `where` to query them, so that cost scales with the size of the result
+    rather than the size of the zone.
+
+    Cards are held in an insertion-ordered dict rather than a list, so adding
+    to the end, removing, and checking membership take constant time, as do
+    reading or popping the first and last cards. Cards compare by identity.
+
+    Cards report changes to their effects to the zones holding them. Every
+    change to the zone's cards or their effects is reported to `changed`, if
+    set, such as to move the board version of the game holding the zone on.
+    Every card taken out of the zone, even to be put back in another place,
+    is reported to `removed`, if set.
+    """
+
+    cards: dict[ICard, int]
+    next_order: int
+    by_class: dict[type, dict[ICard, None]]
+    by_type: dict[str, dict[ICard, None]]
+    by_effect: dict[type, dict[ICard, None]]
+    effect_types: dict[ICard, set[type]]
+    changed: Callable[[], None] | None
+    removed: Callable[[ICard], None] | None
+
+    def __init__(self: Zone, cards: Iterable[ICard] | None = None) -> None:
+        """Create a zone, optionally with cards."""
+        self.changed = None
+        self.removed = None
+        self.cards = {}
+        self.next_order = 0
+        self.by_class = {}
+        self.by_type = {}
+        self.by_effect = {}
+        self.effect_types = {}
+
+        for card in cards or ():
+            self.append(card)
+
+    @overload
+    def __getitem__(self: Zone, index: int) -> ICard: ...
+
+    @overload
+    def __getitem__(self: Zone, index: slice) -> list[ICard]: ...
+
+    def __getitem__(self: Zone, index: int | slice) -> ICard | list[ICard]:
+        """Get a card, or a list of cards for a slice.
+
+        The first and last cards are found in constant time, others by walking
+        the zone.
+        """
+        if isinstance(index, slice):
+            return list(self.cards)[index]
+
+        size: int = len(self.cards)
+        position: int = index + size if index < 0 else index
+
+        if not 0 <= position < size:
+            msg: str = "Zone index out of range"
+            raise IndexError(msg)
+
+        if position == size - 1:
+            return next(reversed(self.cards))
+
+        return next(islice(self.cards, position, None))
+
+    @overload
+    def __setitem__(self: Zone, index: int, value: ICard) -> None: ...
+
+    @overload
+    def __setitem__(
+        self: Zone,
+        index: slice,
+        value: Iterable[ICard],
+    ) -> None: ...
+
+    def __setitem__(
+        self: Zone,
+        index: int | slice,
+        value: ICard | Iterable[ICard],
+    ) -> None:
+        """Replace cards, reindexing the zone."""
+        cards: list[ICard] = list(self.cards)
+        cards[index] = value  # pyright: ignore[reportArgumentType, reportCallIssue]
+        self.reindex(cards=cards)
+
+    def __delitem__(self: Zone, index: int | slice) -> None:
+        """Remove cards by position."""
+        removed: list[ICard] = (
+            self[index] if isinstance(index, slice) else [self[index]]
+        )
+
+        for card in removed:
+            self.remove_from_indexes(card=card)
+
+    def __len__(self: Zone) -> int:
+        """Count cards in the zone."""
+        return len(self.cards)
+
+    def __iter__(self: Zone) -> Iterator[ICard]:
+        """Iterate cards in order."""
+        return iter(self.cards)
+
+    def __reversed__(self: Zone) -> Iterator[ICard]:
+        """Iterate cards in reverse order."""
+        return reversed(self.cards)
+
+    def __contains__(self: Zone, card: object) -> bool:
+        """Check if a card is in the zone."""
+        try:
+            return card in self.cards
+        except TypeError:
+            return False
+
+    def __eq__(self: Zone, other: object) -> bool:
+        """Compare cards in order with another sequence."""
+        if isinstance(other, (Zone, list, tuple)):
+            return list(self) == list(other)
+
+        return NotImplemented
+
+    __hash__ = None  # pyright: ignore[reportAssignmentType]
+
+    def __repr__(self: Zone) -> str:
+        """Create a string representation of a zone."""
+        return f"Zone({list(self.cards)!r})"
+
+    def index(
+        self: Zone,
+        value: ICard,
+        start: int = 0,
+        stop: int | None = None,
+    ) -> int:
+        """Find the position of a card."""
+        if value not in self.cards:
+            msg: str = "Card is not in this zone"
+            raise ValueError(msg)
+
+        cards: list[ICard] = list(self.cards)
+        return cards.index(value, start, len(cards) if stop is None else stop)
+
+    def insert(self: Zone, index: int, value: ICard) -> None:
+        """Insert a card before a position."""
+        if index >= len(self.cards):
+            self.add_to_indexes(card=value)
+        else:
+            cards: list[ICard] = list(self.cards)
+            cards.insert(index, value)
+            self.reindex(cards=cards)
+
+    def append(self: Zone, value: ICard) -> None:
+        """Add a card to the end of the zone."""
+        self.add_to_indexes(card=value)
+
+    def remove(self: Zone, value: ICard) -> None:
+        """Remove a card."""
+        if value not in self.cards:
+            msg: str = "Card is not in this zone"
+            raise ValueError(msg)
+
+        self.remove_from_indexes(card=value)
+
+    def pop(self: Zone, index: int = -1) -> ICard:
+        """Remove and return a card, the last one by default."""
+        card: ICard = self[index]
+        self.remove_from_indexes(card=card)
+        return card
+
+    def clear(self: Zone) -> None:
+        """Remove all cards."""
+        for card in list(self.cards):
+            self.remove_from_indexes(card=card)
+
+    def add_to_indexes(self: Zone, card: ICard) -> None:
+        """Place a card last in the zone and index it."""
+        if card in self.cards:
+            msg: str = f"Card '{card.name}' is already in this zone"
+            raise ValueError(msg)
+
+        self.cards[card] = self.next_order
+        self.next_order += 1
+        self.by_class.setdefault(type(card), {})[card] = None
+
+        for card_type in card.types:
+            self.by_type.setdefault(card_type.name, {})[card] = None
+
+        zones: list[Zone] | None = getattr(card, "zones", None)
+        if zones is not None:
+            zones.append(self)
+
+        # Indexing the card's effects reports the change.
+        self.reindex_effects(card=card)
+
+    def remove_from_indexes(self: Zone, card: ICard) -> None:
+        """Take a card out of the zone and its indexes."""
+        del self.cards[card]
+        self.discard_from(buckets=self.by_class, key=type(card), card=card)
+
+        for card_type in card.types:
+            self.discard_from(
+                buckets=self.by_type,
+                key=card_type.name,
+                card=card,
+            )
+
+        for effect_type in self.effect_types.pop(card, set()):
+            self.discard_from(
+                buckets=self.by_effect,
+                key=effect_type,
+                card=card,
+            )
+
+        zones: list[Zone] | None = getattr(card, "zones", None)
+        if zones is not None:
+            zones[:] = [zone for zone in zones if zone is not self]
+
+        if self.removed is not None:
+            self.removed(card)
+
+        self.notify()
+
+    def notify(self: Zone) -> None:
+        """Report a change to the zone's cards or their effects."""
+        if self.changed is not None:
+            self.changed()
+
+    def reindex(self: Zone, cards: Iterable[ICard]) -> None:
+        """Replace the zone's cards, rebuilding all indexes in order."""
+        cards = list(cards)
+        self.clear()
+        self.next_order = 0
+
+        for card in cards:
+            self.add_to_indexes(card=card)
+
+    def reindex_effects(self: Zone, card: ICard) -> None:
+        """Update the effect index for a card after its effects changed."""
+        if card not in self.cards:
+            return
+
+        effect_types: set[type] = {type(effect) for effect in card.effects}
+        previous: set[type] = self.effect_types.get(card, set())
+
+        for effect_type in previous - effect_types:
+            self.discard_from(
+                buckets=self.by_effect,
+                key=effect_type,
+                card=card,
+            )
+
+        for effect_type in effect_types - previous:
+            self.by_effect.setdefault(effect_type, {})[card] = None
+
+        self.effect_types[card] = effect_types
+        self.notify()
+
+    @staticmethod
+    def discard_from(
+        buckets: dict[Any, dict[ICard, None]],
+        key: object,
+        card: ICard,
+    ) -> None:
+        """Remove a card from an index bucket, dropping empty buckets."""
+        bucket: dict[ICard, None] | None = buckets.get(key)
+
+        if bucket is not None:
+            bucket.pop(card, None)
+
+            if len(bucket) == 0:
+                del buckets[key]
+
+    def matching(
+        self: Zone,
+        buckets: dict[type, dict[ICard, None]],
+        cls: type | tuple[type, ...],
+    ) -> list[dict[ICard, None]]:
+        """Get the buckets for a class, including its subclasses."""
+        return [
+            bucket for key, bucket in buckets.items() if issubclass(key, cls)
+        ]
+
+    def has_effect(
+        self: Zone,
+        card: ICard,
+        effect_type: type[IEffect] | tuple[type[IEffect], ...],
+    ) -> bool:
+        """Check if an indexed card has an effect of a type."""
+        return any(
+            issubclass(indexed, effect_type)
+            for indexed in self.effect_types.get(card, ())
+        )
+
+    def where(
+        self: Zone,
+        cls: type | tuple[type, ...] | None = None,
+        card_type: CardType | None = None,
+        with_effect: type[IEffect] | tuple[type[IEffect], ...] | None = None,
+        without_effect: type[IEffect] | tuple[type[IEffect], ...] | None = None,
+    ) -> list[ICard]:
+        """Find cards matching every given condition, in zone order.
+
+        `cls` and effect types match subclasses, like `isinstance`. Cards are
+        drawn from the smallest matching index, then checked against the other
+        conditions.
+        """
+        sources: list[list[dict[ICard, None]]] = [
+            [self.cards],  # pyright: ignore[reportAssignmentType]
+        ]
+
+        if cls is not None:
+            sources.append(self.matching(buckets=self.by_class, cls=cls))
+
+        if card_type is not None:
+            sources.append([self.by_type.get(card_type.name, {})])
+
+        if with_effect is not None:
+            sources.append(
+                self.matching(buckets=self.by_effect, cls=with_effect),
+            )
+
+        smallest: list[dict[ICard, None]] = min(
+            sources,
+            key=lambda buckets: sum(len(bucket) for bucket in buckets),
+        )
+
+        found: list[ICard] = [
+            card
+            for bucket in smallest
+            for card in bucket
+            if (cls is None or isinstance(card, cls))
+            and (
+                card_type is None
+                or card in self.by_type.get(card_type.name, {})
+            )
+            and (
+                with_effect is None
+                or self.has_effect(card=card, effect_type=with_effect)
+            )
+            and (
+                without_effect is None
+                or not self.has_effect(card=card, effect_type=without_effect)
+            )
+        ]
+
+        if len(smallest) > 1:
+            found = list(dict.fromkeys(found))
+
+        return sorted(found, key=self.cards.__getitem__)
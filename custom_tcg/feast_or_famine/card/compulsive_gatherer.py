@@ -13,6 +13,12 @@ from custom_tcg.core.dimension import CardClassDef, CardTypeDef
 from custom_tcg.core.effect.activated import Activated
 from custom_tcg.core.execution.activate import Activate
 from custom_tcg.core.execution.play import Play
+from custom_tcg.core.predicate import (
+    ActionIs,
+    CardHasClass,
+    CardHasEffect,
+    PlayerIs,
+)
 from custom_tcg.feast_or_famine.card.dirty_blueberry import DirtyBlueberry
 
 if TYPE_CHECKING:
@@ -41,8 +47,6 @@ class CompulsiveGatherer(Card):
             Play(card=compulsive_gatherer, player=player),
         )
 
-        this_player: IPlayer = player
-
         draw: IAction = Draw(
             n=1,
             card=compulsive_gatherer,
@@ -63,14 +67,10 @@ class CompulsiveGatherer(Card):
                 actions=[draw, find_dirty_blueberry],
                 card=compulsive_gatherer,
                 player=player,
-                bind=lambda action, card, player: (
-                    isinstance(action, Activate)
-                    and CardClassDef.play in card.classes
-                    and player is this_player
-                    and not any(
-                        isinstance(effect, Activated) for effect in card.effects
-                    )
-                ),
+                bind=ActionIs(cls=Activate)
+                & CardHasClass(card_class=CardClassDef.play)
+                & PlayerIs(player=player)
+                & ~CardHasEffect(effect_type=Activated),
             ),
         )
 
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import logging
-from asyncio import sleep
-from dataclasses import dataclass
+from asyncio import sleep, to_thread
+from contextlib import asynccontextmanager
+from functools import partial
+from pathlib import Path
+from time import monotonic
 from typing import TYPE_CHECKING, Any, cast
 
 import socketio
@@ -25,25 +28,53 @@ from custom_tcg.common.being.seamstress import Seamstress
 from custom_tcg.common.being.skilled_hunter import SkilledHunter
 from custom_tcg.common.being.that_pebble_girl import ThatPebbleGirl
 from custom_tcg.common.being.the_stewmaker import TheStewmaker
+from custom_tcg.core import state
 from custom_tcg.core.anon import Deck as CoreDeck
 from custom_tcg.core.anon import Player as CorePlayer
+from custom_tcg.core.autopilot import ForcedChoiceAutoPilot
 from custom_tcg.core.game import ActionStateDef
 from custom_tcg.core.game import Game as CoreGame
 from custom_tcg.core.process.lets_play import LetsPlay
 from custom_tcg.core.process.lets_rest import LetsRest
-from custom_tcg.game_api.response.action_context import ActionContext
 from custom_tcg.game_api.response.choice import Choice
 from custom_tcg.game_api.response.game import Game
 from custom_tcg.game_api.response.player import Player
+from custom_tcg.game_api.scheduler import SessionScheduler
+from custom_tcg.game_api.session_actor import SessionActor
+from custom_tcg.game_api.session_context import SessionContext
+from custom_tcg.game_api.session_journal import SessionJournal
+from custom_tcg.game_api.session_store import (
+    DiskSessionTier,
+    MemorySessionStore,
+    estimate_size,
+)
 from custom_tcg.game_api.socket_action_queue import SocketActionQueue
 from custom_tcg.main import setup
+from custom_tcg.replay import card_types
 
 if TYPE_CHECKING:
-    from custom_tcg.core.interface import IAction, IActionContext, IPlayer
+    from collections.abc import AsyncIterator
+
+    from custom_tcg.core.card.card import Card
+    from custom_tcg.core.interface import IAction
 
 setup()
 
-app: FastAPI = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:  # noqa: ARG001
+    """Recover journaled sessions and flush every session while serving.
+
+    Startup waits for recovery, so clients never rejoin a session before it
+    is back, but the event loop stays free while journals are replayed.
+    """
+    await to_thread(recover_sessions)
+    scheduler.start()
+    yield
+    scheduler.stop()
+
+
+app: FastAPI = FastAPI(lifespan=lifespan)
 
 sio = socketio.AsyncServer(
     async_mode="asgi",
@@ -66,14 +97,107 @@ app.add_middleware(
 logger: logging.Logger = logging.getLogger(name=__name__)
 
 
-@dataclass
-class SessionContext:
-    players: list[IPlayer]
-    game: CoreGame
-    completed_queue_index: int
+# Card definitions by card name, to save and load games with.
+CARD_TYPES: dict[str, type[Card]] = card_types()
+
 
+def dump_game(game: CoreGame) -> bytes:
+    """Save a game, for the disk tier and journal snapshots."""
+    return state.dumps(game=game, types=CARD_TYPES)
 
-session_data: dict[str, SessionContext] = {}
+
+def load_game(data: bytes) -> CoreGame:
+    """Load a saved game, reconnecting its events to the socket server."""
+    game: CoreGame = state.loads(data=data, types=CARD_TYPES)
+    cast("SocketActionQueue", game.context.completed).socket = sio
+    return game
+
+
+def dump_session(session_context: SessionContext) -> bytes:
+    """Serialize a session's game for the disk tier."""
+    return dump_game(game=session_context.game)
+
+
+def load_session(data: bytes) -> SessionContext:
+    """Rebuild a session from the disk tier, with a fresh actor."""
+    game: CoreGame = load_game(data=data)
+
+    return SessionContext(
+        players=list(game.players),
+        game=game,
+        actor=SessionActor(name=game.session_id),
+    )
+
+
+def events_path(session_id: str) -> Path:
+    """Get the file a session's events are spilled to."""
+    return Path.cwd() / "logs" / "events" / f"{session_id}.jsonl"
+
+
+def discard_events(session_id: str) -> None:
+    """Remove a collected session's spilled events."""
+    events_path(session_id=session_id).unlink(missing_ok=True)
+
+
+def restore_session(game: CoreGame) -> SessionContext:
+    """Host a game recovered from its journal again."""
+    if not isinstance(game.context.completed, SocketActionQueue):
+        game.context.completed = SocketActionQueue(
+            socket=sio,
+            event_name="action_executed",
+            spill_path=events_path(session_id=game.session_id),
+        )
+
+    for player in game.players:
+        game.set_autopilot(player=player, autopilot=ForcedChoiceAutoPilot())
+
+    return SessionContext(
+        players=list(game.players),
+        game=game,
+        actor=SessionActor(name=game.session_id),
+    )
+
+
+# Games are journaled as they are played, and snapshot every so often, so
+# that sessions survive the server going down.
+session_journal: SessionJournal = SessionJournal(
+    directory=Path.cwd() / "logs" / "journals",
+    dump=dump_game,
+    load=load_game,
+    archive=Path.cwd() / "logs" / "replays",
+)
+
+# Sessions untouched for SESSION_TTL seconds, or beyond the count and size
+# limits, are moved to disk and restored when next used.
+SESSION_TTL: float = 300
+MAX_SESSIONS: int = 256
+MAX_SESSION_BYTES: int = 512 * 1024 * 1024
+
+session_data: MemorySessionStore = MemorySessionStore(
+    ttl=SESSION_TTL,
+    max_sessions=MAX_SESSIONS,
+    max_bytes=MAX_SESSION_BYTES,
+    disk=DiskSessionTier(
+        directory=Path.cwd() / "logs" / "sessions",
+        dump=dump_session,
+        load=load_session,
+    ),
+    sizer=partial(estimate_size, shared=(sio,)),
+    journal=session_journal,
+)
+
+# Engine work is done in slices so that one long chain of auto-resolving
+# actions cannot hold an executor thread away from other sessions.
+ENGINE_SLICE_STEPS: int = 100
+ENGINE_SLICE_SECONDS: float = 0.05
+
+
+def engine_slice(game: CoreGame) -> bool:
+    """Run one budgeted slice of the engine, returning whether it is idle."""
+    return game.run(
+        max_steps=ENGINE_SLICE_STEPS,
+        deadline=monotonic() + ENGINE_SLICE_SECONDS,
+    )
 
 
 @sio.event
@@ -88,6 +212,17 @@ async def disconnect(sid: str) -> None:
     """Disconnect a Socket IO connection."""
     logger.info("Disconnected from socket with sid '%s'", sid)
 
+    for session_context in scheduler.disconnect(sid=sid):
+        await session_context.actor.submit(
+            command=partial(
+                cast(
+                    "SocketActionQueue",
+                    session_context.game.context.completed,
+                ).unregister,
+                client_id=sid,
+            ),
+        )
+
 
 @sio.event
 async def host_connect(sid: str, player_id: str) -> None:
@@ -136,18 +271,23 @@ async def host_connect(sid: str, player_id: str) -> None:
     player1.select_deck(deck=p1_deck)
 
     game: CoreGame = CoreGame(players=[player1])
+    game.set_autopilot(player=player1, autopilot=ForcedChoiceAutoPilot())
     game.context.completed = SocketActionQueue(
         socket=sio,
         event_name="action_executed",
+        spill_path=events_path(session_id=game.session_id),
     )
+    session_journal.attach(game=game)
 
     session_data[game.session_id] = SessionContext(
         players=[player1],
         game=game,
-        completed_queue_index=-1,
+        actor=SessionActor(name=game.session_id),
     )
 
     session_data[game.session_id].players.append(player1)
+    scheduler.connect(session_id=game.session_id, sid=sid)
+
     await sio.emit(
         to=sid,
         event="host_connected",
@@ -198,7 +338,16 @@ async def client_connect(sid: str, session_id: str, player_id: str) -> None:
     player2.select_deck(deck=p2_deck)
 
     session_context.players.append(player2)
-    session_context.game.add_player(player2)
+
+    def add_player() -> None:
+        session_context.game.add_player(player=player2)
+        session_context.game.set_autopilot(
+            player=player2,
+            autopilot=ForcedChoiceAutoPilot(),
+        )
+
+    await session_context.actor.submit(command=add_player)
+    scheduler.connect(session_id=session_id, sid=sid)
 
     # This only gets emitted to other players. There should be a
     # "client_connected" event sent with all game data to the client connecting.
@@ -209,6 +358,30 @@ async def client_connect(sid: str, session_id: str, player_id: str) -> None:
     )
 
 
+@sio.event
+async def client_reconnect(sid: str, session_id: str) -> None:
+    """Client rejoins a session it was in, such as after a server restart."""
+    if session_id not in session_data:
+        logger.warning(
+            "Client asked to rejoin unknown session '%s'",
+            session_id,
+        )
+        await sio.emit(to=sid, event="session_not_found", data=session_id)
+        return
+
+    session_context: SessionContext = session_data[session_id]
+    scheduler.connect(session_id=session_id, sid=sid)
+
+    # Events and any pending choice follow with the next flush.
+    await sio.emit(
+        to=sid,
+        event="client_reconnected",
+        data=await session_context.actor.submit(
+            command=lambda: Game(game=session_context.game).serialize(),
+        ),
+    )
+
+
 @sio.event
 async def game_start(
     sid: str,
@@ -219,22 +392,68 @@ async def game_start(
 
     session_context: SessionContext = session_data[session_id]
 
-    session_context.game.setup()
-    session_context.game.start()
+    def start() -> None:
+        session_context.game.setup()
+        session_context.game.start(max_steps=0)
+
+    await session_context.actor.submit(
+        command=start,
+        resume=partial(engine_slice, game=session_context.game),
+    )
 
     await sio.emit(
         to=sid,
         event="game_started",
-        data=Game(game=session_context.game).serialize(),
+        data=await session_context.actor.submit(
+            command=lambda: Game(game=session_context.game).serialize(),
+        ),
     )
 
-    while True:
-        await sleep(delay=1)
+    scheduler.mark_dirty(session_id=session_id)
+
+
+async def flush_session(session_context: SessionContext) -> None:
+    """Send pending updates to every client connected to a session."""
+    for sid in list(session_context.sids):
         await send_new_action_executions(
             sid=sid,
             session_context=session_context,
         )
 
+    # Measuring walks the whole game, so it is only done every so often.
+    if session_data.measure_due(
+        session_id=session_context.game.session_id,
+        now=monotonic(),
+    ):
+        await session_context.actor.submit(
+            command=partial(
+                session_data.measure,
+                session_id=session_context.game.session_id,
+            ),
+        )
+
+    await session_context.actor.submit(
+        command=partial(session_journal.compact, game=session_context.game),
+    )
+
+
+scheduler: SessionScheduler = SessionScheduler(
+    sessions=session_data,
+    flush=flush_session,
+    collected=discard_events,
+)
+
+
+def recover_sessions() -> None:
+    """Host journaled sessions again, collecting any no client rejoins."""
+    now: float = monotonic()
+
+    for session_id, session_context in session_journal.recover(
+        restore=restore_session,
+    ).items():
+        session_data[session_id] = session_context
+        scheduler.track_idle(session_id=session_id, now=now)
+
 
 async def send_new_action_executions(
     sid: str,
@@ -242,34 +461,65 @@ async def send_new_action_executions(
 ) -> None:
     logger.info("Searching for events.")
 
-    new_actions: list[IActionContext] = cast(
-        "list[IActionContext]",
+    completed: SocketActionQueue = cast(
+        "SocketActionQueue",
         session_context.game.context.completed,
-    )[session_context.completed_queue_index + 1 :]
+    )
+    new_events: list[tuple[int, dict[str, Any]]]
+    choice: dict[str, Any] | None
+    new_events, choice = await session_context.actor.submit(
+        command=lambda: collect_updates(
+            sid=sid,
+            session_context=session_context,
+        ),
+    )
 
-    if len(new_actions) > 0:
-        for action_context in new_actions:
+    if len(new_events) > 0:
+        for _, event in new_events:
             await sio.emit(
                 to=sid,
-                event="action_executed",
-                data=ActionContext(
-                    action_context=action_context,
-                ).serialize(),
+                event=completed.event_name,
+                data=event,
             )
-        session_context.completed_queue_index += len(new_actions)
+        await session_context.actor.submit(
+            command=lambda: completed.acknowledge(
+                client_id=sid,
+                index=new_events[-1][0],
+            ),
+        )
 
-    elif (
-        len(session_context.game.context.ready) > 0
-        and session_context.game.context.ready[0].state
-        == ActionStateDef.input_requested
-    ):
+    if choice is not None:
         await sio.emit(
             to=sid,
             event="choice_requested",
-            data=Choice(context=session_context.game.context).serialize(),
+            data=choice,
         )
 
 
+def collect_updates(
+    sid: str,
+    session_context: SessionContext,
+) -> tuple[list[tuple[int, dict[str, Any]]], dict[str, Any] | None]:
+    """Read unsent events and any pending choice, inside the session actor."""
+    completed: SocketActionQueue = cast(
+        "SocketActionQueue",
+        session_context.game.context.completed,
+    )
+    new_events: list[tuple[int, dict[str, Any]]] = completed.events_after(
+        index=completed.cursor(client_id=sid),
+    )
+    choice: dict[str, Any] | None = None
+
+    if (
+        len(session_context.game.context.ready) > 0
+        and session_context.game.context.ready[0].state
+        == ActionStateDef.input_requested
+    ):
+        choice = Choice(context=session_context.game.context).serialize()
+
+    return new_events, choice
+
+
 @sio.event
 async def choice_confirmed(sid: str, ids: tuple[str, str]) -> None:
     session_id: str
@@ -277,12 +527,55 @@ async def choice_confirmed(sid: str, ids: tuple[str, str]) -> None:
     (session_id, action_id) = ids
     session_context: SessionContext = session_data[session_id]
 
-    chosen_action: IAction = next(
-        choice
-        for choice in session_context.game.context.choices
-        if choice.session_object_id == action_id
+    def choose() -> None:
+        chosen_action: IAction | None = session_context.game.choice_by_id(
+            session_object_id=action_id,
+        )
+
+        if chosen_action is None:
+            logger.warning("Rejected unknown or stale choice '%s'", action_id)
+            return
+
+        session_context.game.choose(action=chosen_action, max_steps=0)
+
+    await session_context.actor.submit(
+        command=choose,
+        resume=partial(engine_slice, game=session_context.game),
+    )
+    scheduler.mark_dirty(session_id=session_id)
+
+
+@sio.event
+async def choices_confirmed(
+    sid: str,
+    ids: tuple[str, list[str]],
+) -> None:
+    """Apply an ordered batch of choices, such as options then confirm.
+
+    Choices of the batch that were not offered when reached are sent back to
+    the client as dropped.
+    """
+    session_id: str
+    action_ids: list[str]
+    (session_id, action_ids) = ids
+    session_context: SessionContext = session_data[session_id]
+
+    await session_context.actor.submit(
+        command=partial(
+            session_context.game.choose_many,
+            actions=action_ids,
+            max_steps=0,
+        ),
+        resume=partial(engine_slice, game=session_context.game),
     )
-    session_context.game.choose(action=chosen_action)
+    scheduler.mark_dirty(session_id=session_id)
+
+    dropped: list[str] = await session_context.actor.submit(
+        command=lambda: list(session_context.game.dropped_choices),
+    )
+
+    if len(dropped) > 0:
+        await sio.emit(to=sid, event="choices_dropped", data=dropped)
 
 
 app.mount(path="/socket.io", app=socketio.ASGIApp(socketio_server=sio))
@@ -0,0 +1,158 @@
+"""Flush pending updates for all sessions from a single loop."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from time import monotonic
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from custom_tcg.game_api.session_context import SessionContext
+    from custom_tcg.game_api.session_store import SessionStore
+
+logger: logging.Logger = logging.getLogger(name=__name__)
+
+
+class SessionScheduler:
+    """Flush pending updates for all sessions from a single loop.
+
+    Sessions are marked dirty when something happens to them, and each tick
+    flushes only the dirty ones, together. Sessions left without connected
+    clients for longer than `ttl` seconds are collected, then the store is
+    asked to enforce its own limits. `collected` is called with the id of
+    each session collected, to clean up what it left outside the store.
+    """
+
+    DEFAULT_INTERVAL: float = 0.1
+    DEFAULT_TTL: float = 600
+
+    sessions: SessionStore
+    flush: Callable[[SessionContext], Awaitable[None]]
+    collected: Callable[[str], None] | None
+    interval: float
+    ttl: float
+    dirty: set[str]
+    idle: dict[str, float]
+    memberships: dict[str, set[str]]
+    task: asyncio.Task[None] | None
+
+    def __init__(
+        self: SessionScheduler,
+        sessions: SessionStore,
+        flush: Callable[[SessionContext], Awaitable[None]],
+        interval: float | None = None,
+        ttl: float | None = None,
+        collected: Callable[[str], None] | None = None,
+    ) -> None:
+        """Create a scheduler over a session store."""
+        self.sessions = sessions
+        self.flush = flush
+        self.collected = collected
+        self.interval = interval or SessionScheduler.DEFAULT_INTERVAL
+        self.ttl = ttl if ttl is not None else SessionScheduler.DEFAULT_TTL
+        self.dirty = set()
+        self.idle = {}
+        self.memberships = {}
+        self.task = None
+
+    def start(self: SessionScheduler) -> None:
+        """Start ticking on the running loop, if not already."""
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(coro=self.run())
+
+    def stop(self: SessionScheduler) -> None:
+        """Stop ticking."""
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    def mark_dirty(self: SessionScheduler, session_id: str) -> None:
+        """Flush a session on the next tick."""
+        self.dirty.add(session_id)
+
+    def connect(self: SessionScheduler, session_id: str, sid: str) -> None:
+        """Track a client connected to a session."""
+        session_context: SessionContext = self.sessions[session_id]
+        session_context.sids.add(sid)
+        session_context.idle_since = None
+        self.memberships.setdefault(sid, set()).add(session_id)
+        self.idle.pop(session_id, None)
+        self.mark_dirty(session_id=session_id)
+
+    def track_idle(
+        self: SessionScheduler,
+        session_id: str,
+        now: float,
+    ) -> None:
+        """Collect a session after the ttl, unless a client connects first."""
+        session_context: SessionContext = self.sessions[session_id]
+
+        if len(session_context.sids) == 0:
+            session_context.idle_since = now
+            self.idle[session_id] = now
+
+    def disconnect(self: SessionScheduler, sid: str) -> list[SessionContext]:
+        """Forget a client everywhere, returning the sessions it was in."""
+        left: list[SessionContext] = [
+            self.sessions[session_id]
+            for session_id in self.memberships.pop(sid, set())
+            if session_id in self.sessions
+        ]
+
+        for session_context in left:
+            session_context.sids.discard(sid)
+
+            if len(session_context.sids) == 0:
+                session_context.idle_since = monotonic()
+                self.idle[session_context.game.session_id] = (
+                    session_context.idle_since
+                )
+
+        return left
+
+    async def run(self: SessionScheduler) -> None:
+        """Tick forever."""
+        while True:
+            await asyncio.sleep(delay=self.interval)
+            await self.tick()
+
+    async def tick(self: SessionScheduler) -> None:
+        """Flush every dirty session, then collect and evict idle ones."""
+        dirty: set[str] = self.dirty
+        self.dirty = set()
+
+        await asyncio.gather(
+            *(
+                self.flush(self.sessions[session_id])
+                for session_id in dirty
+                if session_id in self.sessions
+            ),
+        )
+
+        now: float = monotonic()
+        self.collect(now=now)
+        self.sessions.enforce(now=now)
+
+    def collect(self: SessionScheduler, now: float) -> list[str]:
+        """Remove sessions idle past the ttl, returning their ids."""
+        expired: list[str] = [
+            session_id
+            for session_id, idle_since in self.idle.items()
+            if now - idle_since > self.ttl
+        ]
+
+        for session_id in expired:
+            logger.info("Collecting idle session '%s'", session_id)
+            del self.idle[session_id]
+            self.dirty.discard(session_id)
+
+            if session_id in self.sessions:
+                del self.sessions[session_id]
+
+            if self.collected is not None:
+                self.collected(session_id)
+
+        return expired
@@ -0,0 +1,124 @@
+"""Run commands against a single game session, one at a time."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger: logging.Logger = logging.getLogger(name=__name__)
+
+
+class SessionActor:
+    """Run commands against a single game session, one at a time.
+
+    Commands are queued in order and executed on a bounded executor so the
+    engine never blocks the event loop. Only one command per session runs at
+    a time, and submitting waits for room in the queue (backpressure.)
+
+    A command may come with a `resume` callable, run repeatedly in its own
+    executor slice until it reports being done. Other sessions get the
+    executor in between slices, while this session's later commands wait.
+    """
+
+    DEFAULT_MAX_PENDING: int = 16
+    DEFAULT_MAX_WORKERS: int = 4
+
+    shared_executor: Executor | None = None
+
+    name: str
+    executor: Executor
+    commands: asyncio.Queue[
+        tuple[
+            Callable[[], Any],
+            Callable[[], bool] | None,
+            asyncio.Future[Any],
+        ]
+    ]
+    worker: asyncio.Task[None] | None
+    running: bool
+
+    def __init__(
+        self: SessionActor,
+        name: str,
+        executor: Executor | None = None,
+        max_pending: int | None = None,
+    ) -> None:
+        """Create an actor for a session."""
+        self.name = name
+        self.executor = executor or SessionActor.default_executor()
+        self.commands = asyncio.Queue(
+            maxsize=max_pending or SessionActor.DEFAULT_MAX_PENDING,
+        )
+        self.worker = None
+        self.running = False
+
+    @property
+    def busy(self: SessionActor) -> bool:
+        """Check if a command is running or waiting to run."""
+        return self.running or not self.commands.empty()
+
+    @classmethod
+    def default_executor(cls: type[SessionActor]) -> Executor:
+        """Get the executor shared by all sessions, creating it if needed."""
+        if cls.shared_executor is None:
+            cls.shared_executor = ThreadPoolExecutor(
+                max_workers=cls.DEFAULT_MAX_WORKERS,
+                thread_name_prefix="session",
+            )
+
+        return cls.shared_executor
+
+    async def submit[T](
+        self: SessionActor,
+        command: Callable[[], T],
+        resume: Callable[[], bool] | None = None,
+    ) -> T:
+        """Queue a command and wait for its result.
+
+        If given, `resume` is called after the command until it returns True.
+        """
+        if self.worker is None or self.worker.done():
+            self.worker = asyncio.create_task(coro=self.run())
+
+        result: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        await self.commands.put((command, resume, result))
+
+        return await result
+
+    async def run(self: SessionActor) -> None:
+        """Execute queued commands in order until stopped."""
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        while True:
+            command, resume, result = await self.commands.get()
+            self.running = True
+
+            try:
+                value: Any = await loop.run_in_executor(self.executor, command)
+
+                while resume is not None and not await loop.run_in_executor(
+                    self.executor,
+                    resume,
+                ):
+                    logger.info("Session '%s' yielded, resuming.", self.name)
+            except Exception as exception:
+                logger.exception("Session '%s' command failed", self.name)
+                if not result.done():
+                    result.set_exception(exception)
+            else:
+                if not result.done():
+                    result.set_result(value)
+            finally:
+                self.running = False
+                self.commands.task_done()
+
+    def stop(self: SessionActor) -> None:
+        """Stop executing commands, abandoning any still queued."""
+        if self.worker is not None:
+            self.worker.cancel()
+            self.worker = None
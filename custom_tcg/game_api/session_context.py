@@ -0,0 +1,22 @@
+"""A live game session and the clients connected to it."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from custom_tcg.core.game import Game
+    from custom_tcg.core.interface import IPlayer
+    from custom_tcg.game_api.session_actor import SessionActor
+
+
+@dataclass
+class SessionContext:
+    """A live game session and the clients connected to it."""
+
+    players: list[IPlayer]
+    game: Game
+    actor: SessionActor
+    sids: set[str] = field(default_factory=set)
+    idle_since: float | None = None
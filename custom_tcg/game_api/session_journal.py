@@ -0,0 +1,467 @@
+"""Journal live sessions, so they can be recovered after a crash."""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, override
+
+from custom_tcg.core import state
+from custom_tcg.core.replay import (
+    GameRecord,
+    ReplayWriter,
+    decode,
+    encode_header,
+    read_varint,
+    write_varint,
+)
+from custom_tcg.replay import card_types, rebuild, replay_choices
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+    from pathlib import Path
+
+    from custom_tcg.core.card.card import Card
+    from custom_tcg.core.game import Game
+    from custom_tcg.game_api.session_context import SessionContext
+
+logger: logging.Logger = logging.getLogger(name=__name__)
+
+
+class GroupCommitter:
+    """Write journal appends in batches, with one fsync per file per batch.
+
+    Appends are buffered and return at once. A background thread flushes
+    every `interval` seconds, so a choice never waits on the disk, and all the
+    choices made across sessions in that time share each file's fsync. At
+    most `interval` seconds of choices are lost in a crash.
+    """
+
+    DEFAULT_INTERVAL: float = 0.05
+
+    shared: GroupCommitter | None = None
+
+    interval: float
+    pending: dict[Path, bytearray]
+    lock: threading.Lock
+    io_lock: threading.Lock
+    stopping: threading.Event
+    thread: threading.Thread | None
+
+    def __init__(
+        self: GroupCommitter,
+        interval: float | None = None,
+    ) -> None:
+        """Create a committer, flushing every `interval` seconds once used."""
+        self.interval = interval or GroupCommitter.DEFAULT_INTERVAL
+        self.pending = {}
+        self.lock = threading.Lock()
+        self.io_lock = threading.Lock()
+        self.stopping = threading.Event()
+        self.thread = None
+
+    @classmethod
+    def default(cls: type[GroupCommitter]) -> GroupCommitter:
+        """Get the committer shared by all journals, creating it if needed."""
+        if cls.shared is None:
+            cls.shared = GroupCommitter()
+            atexit.register(cls.shared.stop)
+
+        return cls.shared
+
+    def append(self: GroupCommitter, path: Path, chunk: bytes) -> None:
+        """Buffer bytes to append to a file with the next batch."""
+        with self.lock:
+            self.pending.setdefault(path, bytearray()).extend(chunk)
+
+        self.start()
+
+    def replace(self: GroupCommitter, path: Path, data: bytes) -> None:
+        """Replace a file's contents now, dropping any appends buffered."""
+        with self.io_lock:
+            with self.lock:
+                self.pending.pop(path, None)
+
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            with path.open(mode="wb") as file:
+                file.write(data)
+                file.flush()
+                os.fsync(file.fileno())
+
+    def flush(self: GroupCommitter) -> int:
+        """Write and fsync every buffered append, returning files written."""
+        with self.io_lock:
+            with self.lock:
+                batch: dict[Path, bytearray] = self.pending
+                self.pending = {}
+
+            for path, data in batch.items():
+                path.parent.mkdir(parents=True, exist_ok=True)
+
+                with path.open(mode="ab") as file:
+                    file.write(data)
+                    file.flush()
+                    os.fsync(file.fileno())
+
+        return len(batch)
+
+    def start(self: GroupCommitter) -> None:
+        """Start flushing in the background, if not already."""
+        if self.thread is None or not self.thread.is_alive():
+            self.stopping.clear()
+            self.thread = threading.Thread(
+                target=self.run,
+                name="journal",
+                daemon=True,
+            )
+            self.thread.start()
+
+    def run(self: GroupCommitter) -> None:
+        """Flush every interval until stopped."""
+        while not self.stopping.wait(timeout=self.interval):
+            self.flush()
+
+    def stop(self: GroupCommitter) -> None:
+        """Stop flushing in the background, flushing what is left."""
+        self.stopping.set()
+
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+        self.flush()
+
+
+class JournalWriter(ReplayWriter):
+    """Write a game record to a journal through a group committer."""
+
+    committer: GroupCommitter
+
+    def __init__(
+        self: JournalWriter,
+        path: Path,
+        committer: GroupCommitter | None = None,
+    ) -> None:
+        """Create a writer for a journal file."""
+        super().__init__(path=path)
+        self.committer = committer or GroupCommitter.default()
+
+    @override
+    def start(self: JournalWriter, record: GameRecord) -> None:
+        """Write the header durably, replacing any earlier journal."""
+        self.committer.replace(
+            path=self.path,
+            data=encode_header(record=record),
+        )
+
+    @override
+    def append(self: JournalWriter, chunk: bytes) -> None:
+        """Append with the next group commit."""
+        self.committer.append(path=self.path, chunk=chunk)
+
+    def __getstate__(self: JournalWriter) -> dict[str, Any]:
+        """Pickle only the path, the committer belongs to this process."""
+        return {"path": self.path}
+
+    def __setstate__(self: JournalWriter, state: dict[str, Any]) -> None:
+        """Write through the shared committer after unpickling."""
+        self.path = state["path"]
+        self.committer = GroupCommitter.default()
+
+
+class SessionJournal:
+    """Journal games of live sessions, and recover them after a crash.
+
+    Each game's record (seed, decks, and choices) is appended to a journal in
+    `directory` as the game is played. Journals are replay files, so they can
+    also be checked with `python -m custom_tcg.replay`.
+
+    Every `compact_every` choices, a snapshot of the game is saved with
+    `dump`, so recovery only replays the choices made since. Snapshots are
+    skipped while a game cannot be dumped, and recovery then replays the
+    whole journal.
+
+    When a session is discarded, its journal is moved to `archive` as the
+    game's permanent replay, or removed if there is no archive.
+    """
+
+    DEFAULT_COMPACT_EVERY: int = 64
+
+    directory: Path
+    archive: Path | None
+    committer: GroupCommitter
+    dump: Callable[[Game], bytes] | None
+    load: Callable[[bytes], Game] | None
+    compact_every: int
+    compacted: dict[str, int]
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self: SessionJournal,
+        directory: Path,
+        committer: GroupCommitter | None = None,
+        dump: Callable[[Game], bytes] | None = None,
+        load: Callable[[bytes], Game] | None = None,
+        compact_every: int | None = None,
+        archive: Path | None = None,
+    ) -> None:
+        """Create a journal in a directory."""
+        self.directory = directory
+        self.archive = archive
+        self.committer = committer or GroupCommitter.default()
+        self.dump = dump
+        self.load = load
+        self.compact_every = (
+            compact_every or SessionJournal.DEFAULT_COMPACT_EVERY
+        )
+        self.compacted = {}
+
+    def journal_path(self: SessionJournal, session_id: str) -> Path:
+        """Get the file a session's choices are journaled to."""
+        return self.directory / f"{session_id}.replay"
+
+    def snapshot_path(self: SessionJournal, session_id: str) -> Path:
+        """Get the file a session's latest snapshot is saved to."""
+        return self.directory / f"{session_id}.snapshot"
+
+    def attach(self: SessionJournal, game: Game) -> None:
+        """Journal a game from when it starts."""
+        game.recorder = JournalWriter(
+            path=self.journal_path(session_id=game.session_id),
+            committer=self.committer,
+        )
+
+    def compact(self: SessionJournal, game: Game) -> bool:
+        """Snapshot a game if enough choices were made since the last one.
+
+        Only call this between engine commands, never while the game runs.
+        Returns whether a snapshot was saved.
+        """
+        count: int = len(game.record.choices)
+
+        if (
+            self.dump is None
+            or count - self.compacted.get(game.session_id, 0)
+            < self.compact_every
+        ):
+            return False
+
+        self.compacted[game.session_id] = count
+
+        try:
+            data: bytes = self.dump(game)
+        except Exception as exception:  # noqa: BLE001
+            logger.warning(
+                "Session '%s' could not be snapshot: %r",
+                game.session_id,
+                exception,
+            )
+            return False
+
+        # The journal must hold every choice in the snapshot, or later
+        # choices would be appended after a gap.
+        self.committer.flush()
+
+        header = bytearray()
+        write_varint(out=header, value=count)
+        path: Path = self.snapshot_path(session_id=game.session_id)
+        partial: Path = path.with_suffix(".partial")
+
+        with partial.open(mode="wb") as file:
+            file.write(header + data)
+            file.flush()
+            os.fsync(file.fileno())
+
+        partial.replace(path)
+        logger.info(
+            "Snapshot session '%s' at choice %d",
+            game.session_id,
+            count,
+        )
+        return True
+
+    def discard(self: SessionJournal, session_id: str) -> None:
+        """Archive a session's journal and remove its snapshot, once ended."""
+        self.compacted.pop(session_id, None)
+        journal: Path = self.journal_path(session_id=session_id)
+
+        if self.archive is None:
+            journal.unlink(missing_ok=True)
+        else:
+            # Choices still buffered belong in the replay.
+            self.committer.flush()
+
+            if journal.exists():
+                self.archive.mkdir(parents=True, exist_ok=True)
+                journal.replace(self.archive / journal.name)
+                logger.info("Archived the replay of session '%s'", session_id)
+
+        self.snapshot_path(session_id=session_id).unlink(missing_ok=True)
+
+    def session_ids(self: SessionJournal) -> list[str]:
+        """List the sessions with journals."""
+        if not self.directory.exists():
+            return []
+
+        return sorted(path.stem for path in self.directory.glob("*.replay"))
+
+    def snapshot(self: SessionJournal, session_id: str) -> tuple[Game, int]:
+        """Load a session's snapshot and the number of choices it holds."""
+        if self.load is None:
+            raise FileNotFoundError(self.snapshot_path(session_id=session_id))
+
+        data: bytes = self.snapshot_path(session_id=session_id).read_bytes()
+        count, offset = read_varint(data=data, offset=0)
+        return self.load(data[offset:]), count
+
+    def replay(
+        self: SessionJournal,
+        session_id: str,
+        types: Mapping[str, type[Card]],
+    ) -> tuple[Game, int]:
+        """Rebuild a session's game, and the choice its snapshot ends at.
+
+        The game comes back without auto-pilots, and not journaled yet.
+        """
+        record: GameRecord = decode(
+            data=self.journal_path(session_id=session_id).read_bytes(),
+        )
+        game: Game | None = None
+        start: int = 0
+
+        if (
+            self.load is not None
+            and self.snapshot_path(session_id=session_id).exists()
+        ):
+            try:
+                game, start = self.snapshot(session_id=session_id)
+            except Exception as exception:  # noqa: BLE001
+                logger.warning(
+                    "Snapshot of session '%s' could not be loaded: %r",
+                    session_id,
+                    exception,
+                )
+
+        if game is None:
+            start = 0
+            game = rebuild(record=record, types=types)
+            game.setup()
+            game.start()
+        else:
+            # Choices auto-pilots made after the snapshot are in the journal.
+            game.autopilots = {}
+            game.run()
+
+        game.session_id = session_id
+        replay_choices(game=game, record=record, start=start)
+        return game, start
+
+    def recover_game(
+        self: SessionJournal,
+        session_id: str,
+        types: Mapping[str, type[Card]],
+    ) -> Game:
+        """Rebuild a session's game from its snapshot and journal.
+
+        The game comes back without auto-pilots, journaling to the same file.
+        """
+        game, start = self.replay(session_id=session_id, types=types)
+        return self.resume(game=game, start=start)
+
+    def resume(self: SessionJournal, game: Game, start: int) -> Game:
+        """Journal a recovered game again, after the choices it holds."""
+        self.compacted[game.session_id] = start
+        self.attach(game=game)
+        logger.info(
+            "Recovered session '%s' from choice %d of %d",
+            game.session_id,
+            start,
+            len(game.record.choices),
+        )
+        return game
+
+    def recover(
+        self: SessionJournal,
+        restore: Callable[[Game], SessionContext],
+        max_workers: int | None = None,
+    ) -> dict[str, SessionContext]:
+        """Recover every journaled session, replaying journals in parallel.
+
+        Journals are replayed in worker processes, which send each game back
+        saved with `state.dumps`, so `dump` and `load` must be picklable.
+        `restore` wraps each recovered game in a live session. Sessions that
+        fail to recover are logged and left on disk.
+        """
+        session_ids: list[str] = self.session_ids()
+
+        if len(session_ids) == 0:
+            return {}
+
+        types: dict[str, type[Card]] = card_types()
+
+        # Forking would copy the committer's thread and locks mid-flight.
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context(method="forkserver"),
+        ) as executor:
+            futures: dict[str, Future[tuple[bytes, int]]] = {
+                session_id: executor.submit(
+                    replay_saved,
+                    journal=self,
+                    session_id=session_id,
+                    types=types,
+                )
+                for session_id in session_ids
+            }
+
+        sessions: dict[str, SessionContext] = {}
+
+        for session_id, future in futures.items():
+            try:
+                data, start = future.result()
+                game: Game = (
+                    self.load(data)
+                    if self.load is not None
+                    else state.loads(data=data, types=types)
+                )
+                sessions[session_id] = restore(
+                    self.resume(game=game, start=start),
+                )
+            except Exception:
+                logger.exception(
+                    "Session '%s' could not be recovered",
+                    session_id,
+                )
+
+        return sessions
+
+    def __getstate__(self: SessionJournal) -> dict[str, Any]:
+        """Pickle the journal's files, the committer belongs to this process."""
+        state: dict[str, Any] = self.__dict__.copy()
+        del state["committer"]
+        state["compacted"] = {}
+        return state
+
+    def __setstate__(self: SessionJournal, state: dict[str, Any]) -> None:
+        """Write through the shared committer after unpickling."""
+        self.__dict__.update(state)
+        self.committer = GroupCommitter.default()
+
+
+def replay_saved(
+    journal: SessionJournal,
+    session_id: str,
+    types: Mapping[str, type[Card]],
+) -> tuple[bytes, int]:
+    """Replay a session in a worker process, saving its game to send back."""
+    game, start = journal.replay(session_id=session_id, types=types)
+    data: bytes = (
+        journal.dump(game)
+        if journal.dump is not None
+        else state.dumps(game=game, types=types)
+    )
+    return data, start
@@ -0,0 +1,376 @@
+"""Keep live sessions within time and memory limits."""
+
+from __future__ import annotations
+
+import logging
+import pickle
+import sys
+from asyncio import AbstractEventLoop
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from concurrent.futures import Executor
+from threading import Thread
+from time import monotonic
+from types import FunctionType, MethodType, ModuleType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from pathlib import Path
+
+    from custom_tcg.game_api.session_context import SessionContext
+    from custom_tcg.game_api.session_journal import SessionJournal
+
+logger: logging.Logger = logging.getLogger(name=__name__)
+
+
+# Objects of these types are shared between sessions.
+SHARED_TYPES: tuple[type, ...] = (
+    type,
+    ModuleType,
+    FunctionType,
+    MethodType,
+    Executor,
+    Thread,
+    AbstractEventLoop,
+    logging.Logger,
+)
+
+
+def estimate_size(root: object, shared: Iterable[object] = ()) -> int:
+    """Estimate the bytes held by an object graph, counting each object once.
+
+    Classes, modules, functions, executors, threads, event loops, and loggers
+    are shared between sessions, as are the objects in `shared`, such as the
+    socket server, so none of them are counted or walked.
+    """
+    seen: set[int] = {id(obj) for obj in shared}
+    stack: list[object] = [root]
+    total: int = 0
+
+    while len(stack) > 0:
+        obj: object = stack.pop()
+
+        if id(obj) in seen or isinstance(obj, SHARED_TYPES):
+            continue
+
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif hasattr(obj, "__dict__"):
+            stack.append(vars(obj))
+
+    return total
+
+
+class SessionStore(MutableMapping[str, "SessionContext"]):
+    """Hold live sessions by session id."""
+
+    def measure(self: SessionStore, session_id: str) -> int:
+        """Update the memory accounted to a session."""
+        raise NotImplementedError
+
+    def measure_due(self: SessionStore, session_id: str, now: float) -> bool:
+        """Check if a session should be measured again."""
+        raise NotImplementedError
+
+    def enforce(self: SessionStore, now: float) -> list[str]:
+        """Evict sessions beyond limits, returning their ids."""
+        raise NotImplementedError
+
+
+class DiskSessionTier:
+    """Serialize evicted sessions to local files and restore them on demand."""
+
+    directory: Path
+    dump: Callable[[SessionContext], bytes]
+    load: Callable[[bytes], SessionContext]
+
+    def __init__(
+        self: DiskSessionTier,
+        directory: Path,
+        dump: Callable[[SessionContext], bytes] | None = None,
+        load: Callable[[bytes], SessionContext] | None = None,
+    ) -> None:
+        """Create a disk tier in a directory."""
+        self.directory = directory
+        self.dump = dump or pickle.dumps
+        self.load = load or pickle.loads
+
+    def path(self: DiskSessionTier, session_id: str) -> Path:
+        """Get the file a session is saved to."""
+        return self.directory / f"{session_id}.session"
+
+    def __contains__(self: DiskSessionTier, session_id: object) -> bool:
+        """Check if a session is saved."""
+        return isinstance(session_id, str) and self.path(session_id).exists()
+
+    def save(
+        self: DiskSessionTier,
+        session_id: str,
+        session_context: SessionContext,
+    ) -> bool:
+        """Save a session, returning whether it could be serialized."""
+        try:
+            data: bytes = self.dump(session_context)
+        except Exception as exception:  # noqa: BLE001
+            logger.warning(
+                "Session '%s' could not be serialized: %r",
+                session_id,
+                exception,
+            )
+            return False
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.path(session_id).write_bytes(data)
+        return True
+
+    def restore(self: DiskSessionTier, session_id: str) -> SessionContext:
+        """Load a saved session and remove its file."""
+        path: Path = self.path(session_id)
+        session_context: SessionContext = self.load(path.read_bytes())
+        path.unlink()
+        return session_context
+
+    def discard(self: DiskSessionTier, session_id: str) -> None:
+        """Remove a saved session, if any."""
+        self.path(session_id).unlink(missing_ok=True)
+
+
+class MemorySessionStore(SessionStore):
+    """Hold sessions in memory, evicting by recency, idle time, and size.
+
+    Sessions are kept in least recently used order. Sessions without connected
+    clients not accessed for `ttl` seconds, or any beyond `max_sessions` or
+    `max_bytes`, are evicted to the disk tier when one is configured,
+    otherwise dropped. Sessions with commands in flight are never evicted, and
+    sessions that cannot be saved are kept while clients are still connected
+    to them. Sessions evicted to disk get their connected clients back when
+    restored. Removing a session for good also discards its journal, when one
+    is configured.
+
+    Measuring a session walks its whole object graph, so it is left to the
+    session's actor, and `measure_due` limits it to once every
+    `MEASURE_INTERVAL` seconds per session. Until a session is measured, it
+    is accounted the average size of the others.
+    """
+
+    MEASURE_INTERVAL: float = 5
+
+    sessions: OrderedDict[str, SessionContext]
+    accessed: dict[str, float]
+    sizes: dict[str, int]
+    measured: dict[str, float]
+    detached: dict[str, tuple[set[str], float | None]]
+    ttl: float | None
+    max_sessions: int | None
+    max_bytes: int | None
+    disk: DiskSessionTier | None
+    sizer: Callable[[Any], int]
+    journal: SessionJournal | None
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self: MemorySessionStore,
+        ttl: float | None = None,
+        max_sessions: int | None = None,
+        max_bytes: int | None = None,
+        disk: DiskSessionTier | None = None,
+        sizer: Callable[[Any], int] | None = None,
+        journal: SessionJournal | None = None,
+    ) -> None:
+        """Create an in-memory store."""
+        self.sessions = OrderedDict()
+        self.accessed = {}
+        self.sizes = {}
+        self.measured = {}
+        self.detached = {}
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self.disk = disk
+        self.sizer = sizer or estimate_size
+        self.journal = journal
+
+    @property
+    def total_bytes(self: MemorySessionStore) -> int:
+        """Sum the memory accounted to all sessions in memory."""
+        return sum(self.sizes.values())
+
+    def __getitem__(
+        self: MemorySessionStore,
+        session_id: str,
+    ) -> SessionContext:
+        """Get a session, restoring it from disk if it was evicted."""
+        if session_id not in self.sessions:
+            if self.disk is None or session_id not in self.disk:
+                raise KeyError(session_id)
+
+            logger.info("Restoring session '%s' from disk", session_id)
+            session_context: SessionContext = self.disk.restore(
+                session_id=session_id,
+            )
+            sids, idle_since = self.detached.pop(session_id, (set(), None))
+            session_context.sids.update(sids)
+            session_context.idle_since = idle_since
+            self[session_id] = session_context
+
+        self.sessions.move_to_end(session_id)
+        self.accessed[session_id] = monotonic()
+        return self.sessions[session_id]
+
+    def __setitem__(
+        self: MemorySessionStore,
+        session_id: str,
+        session_context: SessionContext,
+    ) -> None:
+        """Add or replace a session, then keep within count and size limits.
+
+        Other sessions are evicted to make room, least recently used first.
+        """
+        if session_id not in self.sizes:
+            self.sizes[session_id] = (
+                self.total_bytes // len(self.sizes)
+                if len(self.sizes) > 0
+                else 0
+            )
+
+        self.sessions[session_id] = session_context
+        self.sessions.move_to_end(session_id)
+        self.accessed[session_id] = monotonic()
+        self.measured.pop(session_id, None)
+        self.shrink(keep=session_id)
+
+    def __delitem__(self: MemorySessionStore, session_id: str) -> None:
+        """Remove a session from memory and disk, stopping its actor."""
+        found: bool = session_id in self.sessions
+
+        if found:
+            self.forget(session_id=session_id).actor.stop()
+
+        if self.disk is not None and session_id in self.disk:
+            self.disk.discard(session_id=session_id)
+            self.detached.pop(session_id, None)
+            found = True
+
+        if not found:
+            raise KeyError(session_id)
+
+        if self.journal is not None:
+            self.journal.discard(session_id=session_id)
+
+    def __contains__(self: MemorySessionStore, session_id: object) -> bool:
+        """Check for a session in memory or on disk, without restoring it."""
+        return session_id in self.sessions or (
+            self.disk is not None and session_id in self.disk
+        )
+
+    def __iter__(self: MemorySessionStore) -> Iterator[str]:
+        """Iterate ids of sessions in memory."""
+        return iter(list(self.sessions))
+
+    def __len__(self: MemorySessionStore) -> int:
+        """Count sessions in memory."""
+        return len(self.sessions)
+
+    def forget(self: MemorySessionStore, session_id: str) -> SessionContext:
+        """Drop a session from memory only."""
+        self.accessed.pop(session_id, None)
+        self.sizes.pop(session_id, None)
+        self.measured.pop(session_id, None)
+        return self.sessions.pop(session_id)
+
+    def measure(self: MemorySessionStore, session_id: str) -> int:
+        """Update the memory accounted to a session, if still in memory."""
+        if session_id not in self.sessions:
+            return 0
+
+        self.measured[session_id] = monotonic()
+        self.sizes[session_id] = self.sizer(self.sessions[session_id])
+        return self.sizes[session_id]
+
+    def measure_due(
+        self: MemorySessionStore,
+        session_id: str,
+        now: float,
+    ) -> bool:
+        """Check if a session in memory should be measured again."""
+        return (
+            session_id in self.sessions
+            and now - self.measured.get(session_id, -self.MEASURE_INTERVAL)
+            >= self.MEASURE_INTERVAL
+        )
+
+    def enforce(self: MemorySessionStore, now: float) -> list[str]:
+        """Evict idle sessions, then least recently used ones over limits.
+
+        Sessions with connected clients are never idle, however long since
+        they were last used.
+        """
+        candidates: list[str] = [
+            session_id
+            for session_id, session_context in self.sessions.items()
+            if self.ttl is not None
+            and len(session_context.sids) == 0
+            and now - self.accessed[session_id] > self.ttl
+        ]
+        evicted: list[str] = [
+            session_id for session_id in candidates if self.evict(session_id)
+        ]
+        evicted.extend(self.shrink())
+        return evicted
+
+    def shrink(self: MemorySessionStore, keep: str | None = None) -> list[str]:
+        """Evict least recently used sessions, but `keep`, while over limits."""
+        evicted: list[str] = []
+
+        for session_id in list(self.sessions):
+            if not self.over_limits():
+                break
+
+            if session_id != keep and self.evict(session_id=session_id):
+                evicted.append(session_id)
+
+        return evicted
+
+    def over_limits(self: MemorySessionStore) -> bool:
+        """Check if the sessions in memory exceed count or size limits."""
+        return (
+            self.max_sessions is not None
+            and len(self.sessions) > self.max_sessions
+        ) or (self.max_bytes is not None and self.total_bytes > self.max_bytes)
+
+    def evict(self: MemorySessionStore, session_id: str) -> bool:
+        """Move a session out of memory, returning whether it was moved."""
+        session_context: SessionContext = self.sessions[session_id]
+
+        if session_context.actor.busy:
+            return False
+
+        if self.disk is not None and self.disk.save(
+            session_id=session_id,
+            session_context=session_context,
+        ):
+            self.detached[session_id] = (
+                set(session_context.sids),
+                session_context.idle_since,
+            )
+            logger.info("Evicted session '%s' to disk", session_id)
+
+        elif len(session_context.sids) > 0:
+            logger.warning(
+                "Keeping session '%s' in memory, clients are connected",
+                session_id,
+            )
+            return False
+
+        else:
+            logger.info("Dropped session '%s'", session_id)
+
+        self.forget(session_id=session_id)
+        session_context.actor.stop()
+        return True
@@ -2,28 +2,220 @@
 
 from __future__ import annotations
 
+import json
 import logging
-from typing import TYPE_CHECKING
+from bisect import bisect_right
+from collections import deque
+from typing import TYPE_CHECKING, Any, BinaryIO
 
 from custom_tcg.core.interface import IActionContext, IActionQueue
+from custom_tcg.game_api.response.action_context import ActionContext
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     import socketio
 
 logger: logging.Logger = logging.getLogger(name=__name__)
 
 
-class SocketActionQueue(list[IActionContext], IActionQueue):
-    """An event queue to interface the core engine with socket io."""
+class SocketActionQueue(IActionQueue):
+    """An event queue to interface the core engine with socket io.
+
+    Completed events are serialized as they arrive and kept in a bounded ring
+    buffer. Each client owns a cursor, the index of the last event it has
+    acknowledged. Events acknowledged by every client, and the oldest events
+    when the buffer is full, are spilled to an append-only segment file, so
+    lagging clients and clients joining late can still read every event. They
+    are dropped instead if no segment file is configured.
+
+    Events are spilled in batches of at least `spill_batch`, through a segment
+    file kept open between batches. The byte offset of each batch is kept, so
+    catching up seeks to the first batch needed rather than reading the file
+    from the start, while the index holds one entry per batch.
+    """
+
+    DEFAULT_CAPACITY: int = 1024
+    DEFAULT_SPILL_BATCH: int = 128
 
     socket: socketio.AsyncServer
     event_name: str
+    capacity: int
+    spill_batch: int
+    spill_path: Path | None
+    segment: BinaryIO | None
+    events: deque[dict[str, Any]]
+    first_index: int
+    segments: list[tuple[int, int]]
+    cursors: dict[str, int]
 
     def __init__(
         self: SocketActionQueue,
         socket: socketio.AsyncServer,
         event_name: str | None = None,
+        capacity: int | None = None,
+        spill_path: Path | None = None,
+        spill_batch: int | None = None,
     ) -> None:
         """Create an event queue instance."""
         self.socket = socket
         self.event_name = event_name or "new_event"
+        self.capacity = capacity or SocketActionQueue.DEFAULT_CAPACITY
+        self.spill_batch = min(
+            spill_batch or SocketActionQueue.DEFAULT_SPILL_BATCH,
+            self.capacity,
+        )
+        self.spill_path = spill_path
+        self.segment = None
+        self.events = deque()
+        self.first_index = 0
+        self.segments = []
+        self.cursors = {}
+
+    def __getstate__(self: SocketActionQueue) -> dict[str, Any]:
+        """Get state to serialize, leaving out the socket server and file."""
+        state: dict[str, Any] = self.__dict__.copy()
+        state["socket"] = None
+        state["segment"] = None
+        return state
+
+    def __len__(self: SocketActionQueue) -> int:
+        """Count every event ever appended, including dropped ones."""
+        return self.first_index + len(self.events)
+
+    def append(self: SocketActionQueue, action_context: IActionContext) -> None:
+        """Serialize and buffer a new event, spilling the oldest if full."""
+        self.events.append(
+            ActionContext(action_context=action_context).serialize(),
+        )
+
+        overflow: int = len(self.events) - self.capacity
+
+        if overflow <= 0:
+            return
+
+        if self.spill_path is None:
+            logger.warning(
+                "Event buffer full, dropping %s unacknowledged event(s)",
+                overflow,
+            )
+            self.spill(n=overflow)
+        else:
+            self.spill(n=max(overflow, self.spill_batch))
+
+    def cursor(self: SocketActionQueue, client_id: str) -> int:
+        """Get a client's cursor, registering it if it is unknown."""
+        if client_id not in self.cursors:
+            self.cursors[client_id] = -1
+
+        return self.cursors[client_id]
+
+    def acknowledge(
+        self: SocketActionQueue,
+        client_id: str,
+        index: int,
+    ) -> None:
+        """Advance a client's cursor and trim events everyone has seen."""
+        self.cursors[client_id] = max(self.cursor(client_id=client_id), index)
+        self.trim()
+
+    def unregister(self: SocketActionQueue, client_id: str) -> None:
+        """Forget a client so it no longer holds events in memory."""
+        if self.cursors.pop(client_id, None) is not None:
+            self.trim()
+
+    def events_after(
+        self: SocketActionQueue,
+        index: int,
+    ) -> list[tuple[int, dict[str, Any]]]:
+        """Get (index, event) pairs after an index, oldest first."""
+        found: list[tuple[int, dict[str, Any]]] = []
+
+        if index + 1 < self.first_index:
+            found.extend(self.read_spilled(index=index))
+
+        start: int = max(index + 1 - self.first_index, 0)
+        found.extend(
+            (self.first_index + offset, self.events[offset])
+            for offset in range(start, len(self.events))
+        )
+
+        return found
+
+    def trim(self: SocketActionQueue) -> None:
+        """Spill buffered events acknowledged by every registered client.
+
+        Without a segment file they are dropped right away. Otherwise they are
+        left in memory until there are enough to spill as a batch.
+        """
+        if len(self.cursors) == 0:
+            return
+
+        acknowledged: int = min(
+            len(self.events),
+            min(self.cursors.values()) + 1 - self.first_index,
+        )
+
+        if self.spill_path is None or acknowledged >= self.spill_batch:
+            self.spill(n=acknowledged)
+
+    def spill(self: SocketActionQueue, n: int) -> None:
+        """Move the oldest buffered events out of memory."""
+        n = min(n, len(self.events))
+
+        if n <= 0:
+            return
+
+        if self.spill_path is not None:
+            if self.segment is None:
+                self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+                self.segment = self.spill_path.open(mode="ab")
+
+            self.segments.append((self.first_index, self.segment.tell()))
+            self.segment.write(
+                b"".join(
+                    json.dumps(
+                        [self.first_index + offset, self.events[offset]],
+                    ).encode()
+                    + b"\n"
+                    for offset in range(n)
+                ),
+            )
+            self.segment.flush()
+
+        for _ in range(n):
+            self.events.popleft()
+            self.first_index += 1
+
+    def close(self: SocketActionQueue) -> None:
+        """Close the segment file, until more events are spilled."""
+        if self.segment is not None:
+            self.segment.close()
+            self.segment = None
+
+    def read_spilled(
+        self: SocketActionQueue,
+        index: int,
+    ) -> list[tuple[int, dict[str, Any]]]:
+        """Read events after an index back from the segment file."""
+        if self.spill_path is None or len(self.segments) == 0:
+            return []
+
+        # Start from the last batch holding the first event wanted.
+        batch: int = max(
+            bisect_right(self.segments, index + 1, key=lambda batch: batch[0])
+            - 1,
+            0,
+        )
+        found: list[tuple[int, dict[str, Any]]] = []
+
+        with self.spill_path.open(mode="rb") as segment:
+            segment.seek(self.segments[batch][1])
+
+            for line in segment:
+                event_index, event = json.loads(line)
+
+                if event_index > index:
+                    found.append((event_index, event))
+
+        return found
@@ -0,0 +1,90 @@
+"""Tests for `custom_tcg.game_api.scheduler` module."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import Mock
+
+from custom_tcg.game_api.scheduler import SessionScheduler
+from custom_tcg.game_api.session_context import SessionContext
+from custom_tcg.game_api.session_store import MemorySessionStore
+
+
+def _session(session_id: str) -> SessionContext:
+    game = Mock(name="Game")
+    game.session_id = session_id
+    actor = Mock(name="Actor")
+    actor.busy = False
+    return SessionContext(players=[], game=game, actor=actor)
+
+
+def _store(*session_ids: str) -> MemorySessionStore:
+    store = MemorySessionStore(sizer=lambda _: 0)
+
+    for session_id in session_ids:
+        store[session_id] = _session(session_id)
+
+    return store
+
+
+def test_tick_flushes_only_dirty_sessions() -> None:
+    """Flush dirty sessions once per tick, leaving clean sessions alone."""
+    flushed: list[str] = []
+
+    async def flush(session_context: SessionContext) -> None:
+        flushed.append(session_context.game.session_id)
+
+    sessions = _store("a", "b")
+    scheduler = SessionScheduler(sessions=sessions, flush=flush)
+
+    scheduler.mark_dirty(session_id="a")
+    scheduler.mark_dirty(session_id="a")
+    asyncio.run(scheduler.tick())
+    asyncio.run(scheduler.tick())
+
+    assert flushed == ["a"]
+
+
+def test_sessions_without_clients_are_collected_after_ttl() -> None:
+    """Collect a session only once its last client has been gone for ttl."""
+
+    async def flush(session_context: SessionContext) -> None:
+        pass
+
+    sessions = _store("a", "b")
+    scheduler = SessionScheduler(sessions=sessions, flush=flush, ttl=10)
+    scheduler.connect(session_id="a", sid="x")
+    scheduler.connect(session_id="b", sid="x")
+    scheduler.connect(session_id="b", sid="y")
+
+    scheduler.disconnect(sid="x")
+    idle_since = sessions["a"].idle_since
+    assert idle_since is not None
+    assert sessions["b"].idle_since is None
+
+    assert scheduler.collect(now=idle_since + 5) == []
+    assert scheduler.collect(now=idle_since + 11) == ["a"]
+    assert list(sessions) == ["b"]
+
+
+def test_sessions_tracked_as_idle_are_collected_unless_joined() -> None:
+    """Collect sessions nobody rejoined, such as ones recovered at startup."""
+
+    async def flush(session_context: SessionContext) -> None:
+        pass
+
+    collected: list[str] = []
+    sessions = _store("a", "b")
+    scheduler = SessionScheduler(
+        sessions=sessions,
+        flush=flush,
+        ttl=10,
+        collected=collected.append,
+    )
+    scheduler.track_idle(session_id="a", now=0)
+    scheduler.track_idle(session_id="b", now=0)
+    scheduler.connect(session_id="b", sid="x")
+
+    assert scheduler.collect(now=11) == ["a"]
+    assert list(sessions) == ["b"]
+    assert collected == ["a"]
@@ -0,0 +1,78 @@
+"""Tests for `custom_tcg.game_api.session_actor` module."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from custom_tcg.game_api.session_actor import SessionActor
+
+
+def test_commands_run_in_order_off_the_event_loop() -> None:
+    """Run every command in submission order on an executor thread."""
+    observed: list[tuple[int, bool]] = []
+
+    async def scenario() -> list[int]:
+        actor = SessionActor(name="session", max_pending=2)
+        loop_thread: threading.Thread = threading.current_thread()
+
+        def command(i: int) -> int:
+            observed.append((i, threading.current_thread() is loop_thread))
+            return i * 10
+
+        results: list[int] = await asyncio.gather(
+            *(actor.submit(command=lambda i=i: command(i)) for i in range(5)),
+        )
+        actor.stop()
+        return results
+
+    assert asyncio.run(scenario()) == [0, 10, 20, 30, 40]
+    assert observed == [(i, False) for i in range(5)]
+
+
+def test_command_exceptions_reach_the_submitter() -> None:
+    """Raise command failures to the submitter and keep serving commands."""
+
+    def fail() -> None:
+        raise ValueError
+
+    async def scenario() -> str:
+        actor = SessionActor(name="session")
+
+        with pytest.raises(ValueError):  # noqa: PT011
+            await actor.submit(command=fail)
+
+        result: str = await actor.submit(command=lambda: "still running")
+        actor.stop()
+        return result
+
+    assert asyncio.run(scenario()) == "still running"
+
+
+def test_resume_runs_until_done_before_next_command() -> None:
+    """Keep resuming a command before starting the next queued one."""
+    observed: list[str] = []
+    remaining: list[int] = [3]
+
+    def resume() -> bool:
+        observed.append("slice")
+        remaining[0] -= 1
+        return remaining[0] == 0
+
+    async def scenario() -> None:
+        actor = SessionActor(name="session")
+
+        await asyncio.gather(
+            actor.submit(
+                command=lambda: observed.append("first"),
+                resume=resume,
+            ),
+            actor.submit(command=lambda: observed.append("second")),
+        )
+        actor.stop()
+
+    asyncio.run(scenario())
+
+    assert observed == ["first", "slice", "slice", "slice", "second"]
@@ -0,0 +1,136 @@
+"""Tests for `custom_tcg.game_api.session_journal` module."""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+from custom_tcg.common.player import p1, p2
+from custom_tcg.core import state
+from custom_tcg.core.game import Game
+from custom_tcg.core.replay import decode, digest
+from custom_tcg.core.util.random import GameRandom
+from custom_tcg.game_api.session_context import SessionContext
+from custom_tcg.game_api.session_journal import GroupCommitter, SessionJournal
+from custom_tcg.replay import card_types
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+def _session(game: Game) -> SessionContext:
+    return SessionContext(players=list(game.players), game=game, actor=Mock())
+
+
+def _play(game: Game, choices: int) -> None:
+    for _ in range(choices):
+        game.choose(action=game.context.choices[-1])
+
+
+def _journaled_game(journal: SessionJournal) -> Game:
+    game = Game(players=[p1(), p2()], rng=GameRandom(seed=5))
+    journal.attach(game=game)
+    game.setup()
+    game.start()
+    return game
+
+
+def test_appends_are_batched_into_one_fsync_per_file(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Buffer appends until a flush, then sync each file once."""
+    synced: list[int] = []
+    monkeypatch.setattr(os, "fsync", synced.append)
+    committer = GroupCommitter(interval=60)
+    committer.replace(path=tmp_path / "a", data=b"head")
+
+    for chunk in (b"1", b"2", b"3"):
+        committer.append(path=tmp_path / "a", chunk=chunk)
+        committer.append(path=tmp_path / "b", chunk=chunk)
+
+    assert (tmp_path / "a").read_bytes() == b"head"
+    assert len(synced) == 1
+
+    assert committer.flush() == 2  # noqa: PLR2004
+    committer.stop()
+
+    assert (tmp_path / "a").read_bytes() == b"head123"
+    assert (tmp_path / "b").read_bytes() == b"123"
+    assert len(synced) == 3  # noqa: PLR2004
+
+
+def test_sessions_are_recovered_from_their_journals(tmp_path: Path) -> None:
+    """Rebuild a game from its journal, continuing to journal new choices."""
+    committer = GroupCommitter(interval=60)
+    journal = SessionJournal(directory=tmp_path, committer=committer)
+    game: Game = _journaled_game(journal=journal)
+    _play(game=game, choices=20)
+    committer.flush()
+
+    recovered: dict[str, Game] = {
+        session_id: session_context.game
+        for session_id, session_context in journal.recover(
+            restore=_session,
+        ).items()
+    }
+
+    assert list(recovered) == [game.session_id]
+    assert digest(game=recovered[game.session_id]) == digest(game=game)
+
+    _play(game=recovered[game.session_id], choices=5)
+    committer.stop()
+
+    assert (
+        decode(data=journal.journal_path(game.session_id).read_bytes()).choices
+        == recovered[game.session_id].record.choices
+    )
+
+
+def test_recovery_starts_from_the_latest_snapshot(tmp_path: Path) -> None:
+    """Only replay choices made after the latest snapshot."""
+    committer = GroupCommitter(interval=60)
+    types = card_types()
+    journal = SessionJournal(
+        directory=tmp_path,
+        committer=committer,
+        dump=lambda game: state.dumps(game=game, types=types),
+        load=lambda data: state.loads(data=data, types=types),
+        compact_every=8,
+        archive=tmp_path / "replays",
+    )
+    game: Game = _journaled_game(journal=journal)
+    _play(game=game, choices=6)
+
+    assert not journal.compact(game=game)
+
+    _play(game=game, choices=6)
+
+    assert journal.compact(game=game)
+
+    _play(game=game, choices=3)
+    committer.stop()
+
+    recovered: Game = journal.recover_game(
+        session_id=game.session_id,
+        types=types,
+    )
+
+    assert journal.compacted[game.session_id] == 12  # noqa: PLR2004
+    assert digest(game=recovered) == digest(game=game)
+
+    journal.discard(session_id=game.session_id)
+
+    assert journal.session_ids() == []
+    assert not journal.snapshot_path(session_id=game.session_id).exists()
+    assert (
+        decode(
+            data=(
+                tmp_path / "replays" / f"{game.session_id}.replay"
+            ).read_bytes(),
+        ).choices
+        == game.record.choices
+    )
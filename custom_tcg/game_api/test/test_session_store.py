@@ -0,0 +1,159 @@
+"""Tests for `custom_tcg.game_api.session_store` module."""
+
+from __future__ import annotations
+
+import pickle
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+from custom_tcg.game_api.session_context import SessionContext
+from custom_tcg.game_api.session_store import (
+    DiskSessionTier,
+    MemorySessionStore,
+    estimate_size,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _session(session_id: str, sids: set[str] | None = None) -> SessionContext:
+    game = Mock(name="Game")
+    game.session_id = session_id
+    actor = Mock(name="Actor")
+    actor.busy = False
+    return SessionContext(
+        players=[],
+        game=game,
+        actor=actor,
+        sids=sids or set(),
+    )
+
+
+def _dump(session_context: SessionContext) -> bytes:
+    return pickle.dumps(session_context.game.session_id)
+
+
+def _load(data: bytes) -> SessionContext:
+    return _session(pickle.loads(data))  # noqa: S301
+
+
+def test_least_recently_used_sessions_are_dropped_over_limits() -> None:
+    """Drop least recently used sessions past count and byte limits."""
+    store = MemorySessionStore(max_sessions=2, max_bytes=25, sizer=lambda _: 10)
+    store["a"] = _session("a")
+    store["b"] = _session("b")
+    _ = store["a"]
+    store["c"] = _session("c", sids={"x"})
+
+    assert list(store) == ["a", "c"]
+
+    for session_id in store:
+        store.measure(session_id=session_id)
+
+    assert store.enforce(now=0) == []
+
+    store.max_bytes = 5
+    assert store.enforce(now=0) == ["a"]
+    assert "c" in store
+
+
+def test_idle_sessions_are_evicted_to_disk_and_restored(tmp_path: Path) -> None:
+    """Move sessions past the ttl to disk, restoring them when next used."""
+    store = MemorySessionStore(
+        ttl=10,
+        disk=DiskSessionTier(directory=tmp_path, dump=_dump, load=_load),
+        sizer=lambda _: 0,
+    )
+    store["a"] = _session("a")
+    store["b"] = _session("b")
+    store.accessed["a"] -= 20
+    store.sessions["b"].actor.busy = True
+
+    assert store.enforce(now=store.accessed["b"]) == ["a"]
+    assert len(store) == 1
+    assert "a" in store
+    assert store["a"].game.session_id == "a"
+    assert not (tmp_path / "a.session").exists()
+
+    store.accessed["a"] -= 20
+    store.enforce(now=store.accessed["b"])
+    del store["a"]
+    assert "a" not in store
+
+
+def test_connected_sessions_keep_their_clients(tmp_path: Path) -> None:
+    """Never idle out connected sessions, and reconnect them after eviction."""
+    store = MemorySessionStore(
+        ttl=10,
+        max_sessions=1,
+        disk=DiskSessionTier(directory=tmp_path, dump=_dump, load=_load),
+        sizer=lambda _: 0,
+    )
+    store["a"] = _session("a", sids={"x"})
+    store.accessed["a"] -= 20
+
+    assert store.enforce(now=store.accessed["a"] + 20) == []
+
+    store["b"] = _session("b")
+
+    assert list(store) == ["b"]
+    assert store["a"].sids == {"x"}
+
+
+def test_sessions_are_measured_on_a_cadence() -> None:
+    """Measure a session again only after the measuring interval."""
+    store = MemorySessionStore(sizer=lambda _: 10)
+    store["a"] = _session("a")
+
+    assert store.measure_due(session_id="a", now=0)
+
+    store.measure(session_id="a")
+    measured: float = store.measured["a"]
+
+    assert not store.measure_due(session_id="a", now=measured + 1)
+    assert store.measure_due(
+        session_id="a",
+        now=measured + MemorySessionStore.MEASURE_INTERVAL,
+    )
+    assert not store.measure_due(session_id="b", now=measured)
+
+
+def test_unserializable_sessions_with_clients_stay_in_memory(
+    tmp_path: Path,
+) -> None:
+    """Keep sessions that cannot be saved while clients are connected."""
+    store = MemorySessionStore(
+        max_sessions=0,
+        disk=DiskSessionTier(directory=tmp_path),
+        sizer=lambda _: 0,
+    )
+    store["a"] = _session("a", sids={"x"})
+    store["b"] = _session("b")
+
+    assert store.enforce(now=0) == ["b"]
+    assert list(store) == ["a"]
+
+
+def test_added_sessions_are_accounted_an_average_size() -> None:
+    """Account new sessions without measuring them, making room right away."""
+    sizer = Mock(return_value=10)
+    store = MemorySessionStore(max_bytes=25, sizer=sizer)
+    store["a"] = _session("a")
+    store.measure(session_id="a")
+    store["b"] = _session("b")
+
+    assert sizer.call_count == 1
+    assert store.sizes["b"] == 10  # noqa: PLR2004
+
+    store["c"] = _session("c")
+
+    assert list(store) == ["b", "c"]
+
+
+def test_estimate_size_counts_shared_objects_once() -> None:
+    """Count an object reachable twice only once."""
+    shared = list(range(100))
+
+    assert estimate_size([shared, shared]) < estimate_size([shared, [*shared]])
+    assert estimate_size([shared], shared=[shared]) < estimate_size(shared)
@@ -0,0 +1,120 @@
+"""Tests for `custom_tcg.game_api.socket_action_queue` module."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+from custom_tcg.core.anon import Action as AnonAction
+from custom_tcg.core.anon import Player as AnonPlayer
+from custom_tcg.core.card.card import Card
+from custom_tcg.core.execution.execution import ActionContext
+from custom_tcg.game_api.socket_action_queue import SocketActionQueue
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _action_context(name: str) -> ActionContext:
+    player = AnonPlayer(
+        session_object_id="p1",
+        name="P1",
+        decks=[],
+        starting_cards=[],
+        main_cards=[],
+        processes=[],
+        hand=[],
+        played=[],
+        discard=[],
+    )
+    card = Card(name="Card", player=player, types=[], classes=[])
+    action = AnonAction(
+        name=name,
+        card=card,
+        player=player,
+        enter=lambda context: None,  # noqa: ARG005
+    )
+    return ActionContext(action=action, ready=[], choices=[], players=[player])
+
+
+def test_acknowledged_events_are_dropped() -> None:
+    """Trim events once every registered client has acknowledged them."""
+    queue = SocketActionQueue(socket=Mock())
+    queue.cursor(client_id="a")
+    queue.cursor(client_id="b")
+
+    for i in range(3):
+        queue.append(_action_context(name=f"E{i}"))
+
+    queue.acknowledge(client_id="a", index=2)
+    assert len(queue.events) == 3  # noqa: PLR2004
+
+    queue.acknowledge(client_id="b", index=1)
+    assert [event["action"]["name"] for event in queue.events] == ["E2"]
+    assert len(queue) == 3  # noqa: PLR2004
+
+    queue.unregister(client_id="b")
+    assert len(queue.events) == 0
+
+
+def test_full_buffer_spills_to_segment(tmp_path: Path) -> None:
+    """Keep memory bounded and serve lagging clients from the segment file."""
+    queue = SocketActionQueue(
+        socket=Mock(),
+        capacity=2,
+        spill_path=tmp_path / "events.jsonl",
+    )
+    queue.cursor(client_id="a")
+
+    for i in range(5):
+        queue.append(_action_context(name=f"E{i}"))
+
+    assert len(queue.events) == 1
+    assert queue.first_index == 4  # noqa: PLR2004
+
+    caught_up = queue.events_after(index=queue.cursor(client_id="a"))
+    assert [index for index, _ in caught_up] == [0, 1, 2, 3, 4]
+    assert [event["action"]["name"] for _, event in caught_up] == [
+        "E0",
+        "E1",
+        "E2",
+        "E3",
+        "E4",
+    ]
+
+
+def test_acknowledged_events_spill_for_late_clients(tmp_path: Path) -> None:
+    """Keep acknowledged events in the segment, seeking to the batch needed."""
+    queue = SocketActionQueue(
+        socket=Mock(),
+        spill_path=tmp_path / "events.jsonl",
+        spill_batch=2,
+    )
+    queue.cursor(client_id="a")
+
+    for i in range(5):
+        queue.append(_action_context(name=f"E{i}"))
+        queue.acknowledge(client_id="a", index=i)
+
+    assert [event["action"]["name"] for event in queue.events] == ["E4"]
+    assert [first for first, _ in queue.segments] == [0, 2]
+
+    late = queue.events_after(index=queue.cursor(client_id="b"))
+    assert [event["action"]["name"] for _, event in late] == [
+        "E0",
+        "E1",
+        "E2",
+        "E3",
+        "E4",
+    ]
+    assert [index for index, _ in queue.events_after(index=1)] == [2, 3, 4]
+
+
+def test_full_buffer_without_segment_drops_oldest() -> None:
+    """Drop the oldest events when no segment file is configured."""
+    queue = SocketActionQueue(socket=Mock(), capacity=1)
+
+    queue.append(_action_context(name="E0"))
+    queue.append(_action_context(name="E1"))
+
+    assert [index for index, _ in queue.events_after(index=-1)] == [1]
@@ -0,0 +1,210 @@
+"""Replay recorded games, checking they play out the same way.
+
+Run with `python -m custom_tcg.replay <replay files or directories>`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import logging
+import pkgutil
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from custom_tcg.core.anon import Deck, Player
+from custom_tcg.core.card.card import Card
+from custom_tcg.core.game import Game
+from custom_tcg.core.replay import GameRecord, decode, digest
+from custom_tcg.core.util.random import GameRandom
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+logger: logging.Logger = logging.getLogger(name=__name__)
+
+CARD_PACKAGES: tuple[str, ...] = (
+    "custom_tcg.core",
+    "custom_tcg.common",
+    "custom_tcg.feast_or_famine",
+)
+
+# Modules holding tests or test fixtures, which aren't imported for cards.
+TEST_MODULE_MARKERS: tuple[str, ...] = (".test", "_test")
+
+
+class ReplayDivergedError(Exception):
+    """A replayed game stopped matching its record."""
+
+
+def card_types() -> dict[str, type[Card]]:
+    """Find every card class by its class name, to rebuild recorded decks.
+
+    Card classes are the subclasses of `Card` that define a card name.
+    """
+    for package_name in CARD_PACKAGES:
+        package = importlib.import_module(name=package_name)
+
+        for module in pkgutil.walk_packages(
+            path=package.__path__,
+            prefix=f"{package_name}.",
+        ):
+            if not any(marker in module.name for marker in TEST_MODULE_MARKERS):
+                importlib.import_module(name=module.name)
+
+    found: dict[str, type[Card]] = {}
+    pending: list[type[Card]] = [Card]
+
+    while len(pending) > 0:
+        cls: type[Card] = pending.pop()
+        if isinstance(vars(cls).get("name"), str):
+            found[cls.__name__] = cls
+
+        pending.extend(cls.__subclasses__())
+
+    return found
+
+
+def rebuild(record: GameRecord, types: Mapping[str, type[Card]]) -> Game:
+    """Create a game as it was before setup, from a record."""
+    players: list[Player] = []
+
+    for player_record in record.players:
+        player = Player(
+            session_object_id=player_record.session_object_id,
+            name=player_record.name,
+            decks=[],
+            starting_cards=[],
+            main_cards=[],
+            processes=[],
+            hand=[],
+            played=[],
+            discard=[],
+        )
+        deck = Deck(
+            name=f"{player_record.name} replay",
+            player=player,
+            starting=[
+                types[name].create(player=player)
+                for name in player_record.starting
+            ],
+            main=[
+                types[name].create(player=player) for name in player_record.main
+            ],
+        )
+        player.decks.append(deck)
+        player.select_deck(deck=deck)
+        players.append(player)
+
+    return Game(players=players, rng=GameRandom(seed=record.seed))
+
+
+def replay(
+    record: GameRecord,
+    types: Mapping[str, type[Card]],
+    *,
+    verify: bool = True,
+) -> Game:
+    """Play a recorded game again, making each recorded choice in turn.
+
+    With `verify`, the game state is compared to each recorded checkpoint, and
+    `ReplayDivergedError` is raised at the first that does not match.
+    """
+    game: Game = rebuild(record=record, types=types)
+    game.setup()
+    game.start()
+    replay_choices(game=game, record=record, verify=verify)
+    return game
+
+
+def replay_choices(
+    game: Game,
+    record: GameRecord,
+    start: int = 0,
+    *,
+    verify: bool = True,
+) -> None:
+    """Make the recorded choices from `start` onward, in a game at `start`."""
+    for count, index in enumerate(record.choices[start:], start=start):
+        if (
+            verify
+            and count in record.checkpoints
+            and digest(game=game) != record.checkpoints[count]
+        ):
+            msg: str = f"Game state differs from the record at choice {count}"
+            raise ReplayDivergedError(msg)
+
+        if not 0 <= index < len(game.context.choices):
+            msg = (
+                f"Choice {count} was {index}, but only"
+                f" {len(game.context.choices)} choice(s) are offered"
+            )
+            raise ReplayDivergedError(msg)
+
+        game.choose(action=game.context.choices[index])
+
+
+def replay_paths(paths: Sequence[Path]) -> list[Path]:
+    """Expand directories into the replay files in them."""
+    return [
+        replay_path
+        for path in paths
+        for replay_path in (
+            sorted(path.glob("*.replay")) if path.is_dir() else [path]
+        )
+    ]
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Replay games, returning a non-zero exit code if any diverged."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "paths",
+        nargs="*",
+        type=Path,
+        default=[Path.cwd() / "logs" / "replays"],
+        help="Replay files, or directories of them.",
+    )
+    parser.add_argument(
+        "--no-verify",
+        action="store_true",
+        help="Skip comparing the game state against checkpoints.",
+    )
+    args: argparse.Namespace = parser.parse_args(args=argv)
+
+    types: dict[str, type[Card]] = card_types()
+    failures: int = 0
+
+    for path in replay_paths(paths=args.paths):
+        record: GameRecord = decode(data=path.read_bytes())
+        started: float = perf_counter()
+
+        try:
+            replay(record=record, types=types, verify=not args.no_verify)
+        except (ReplayDivergedError, KeyError):
+            logger.exception("Replay '%s' failed.", path)
+            failures += 1
+            continue
+
+        logger.info(
+            "Replayed '%s': %d choice(s) in %.3fs.",
+            path,
+            len(record.choices),
+            perf_counter() - started,
+        )
+
+    return 1 if failures > 0 else 0
+
+
+if __name__ == "__main__":
+    from custom_tcg.main import setup
+
+    setup()
+
+    # Per-step logging would dominate replay time, so only report results.
+    logging.getLogger().setLevel(level=logging.WARNING)
+    logger.setLevel(level=logging.INFO)
+
+    sys.exit(main())